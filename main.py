@@ -1,12 +1,19 @@
 import os
 from contextlib import asynccontextmanager
-from fastapi import FastAPI
+from typing import List
+from fastapi import Depends, FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from src.shared.config import settings
-from src.shared.infrastructure.database.mongo_client import connect_to_mongo, close_mongo_connection
-from src.shared.infrastructure.security.verification_middleware import EmailVerificationMiddleware
-from src.shared.infrastructure.middleware.subscription_middleware import SubscriptionMiddleware
-from src.shared.infrastructure.middleware.security_middleware import SecurityMiddleware
+from src.shared.infrastructure.database.mongo_client import connect_to_mongo, close_mongo_connection, get_database
+from src.shared.infrastructure.database.index_registry import index_registry
+from src.shared.infrastructure.database.pagination import NEXT_CURSOR_HEADER
+from src.shared.infrastructure.container import container
+from src.shared.infrastructure.middleware.auth_pipeline import AuthPipelineMiddleware
+from src.shared.infrastructure.security.revocation_policy import TokenRevocationPolicy
+from src.shared.infrastructure.security.authentication import require_admin_key
+from src.shared.infrastructure.security.verification_middleware import EmailVerificationPolicy
+from src.shared.infrastructure.middleware.subscription_middleware import SubscriptionPolicy
+from src.shared.infrastructure.middleware.security_middleware import SecurityHeadersPolicy
 from src.auth.infrastructure.http.auth_router import router as auth_router
 from src.trips.infrastructure.http.trips_router import router as trips_router
 from src.expenses.infrastructure.http.expenses_router import router as expenses_router
@@ -15,11 +22,35 @@ from src.journal_entries.infrastructure.http.journal_entries_router import route
 from src.friendships.infrastructure.http.friendships_router import router as friendships_router
 from src.subscriptions.infrastructure.http.subscription_router import router as subscription_router
 from src.subscriptions.application.subscription_scheduler import execute_daily_tasks, execute_weekly_tasks
+from src.expenses.application.expense_rollup_service import execute_rollup_reconciliation
+from src.expenses.application.import_fx_rates import ImportFxRates
+from src.expenses.application.currency_converter import CurrencyConverter
+from src.expenses.infrastructure.http.expenses_schemas import FxRateRequest
+from src.auth.infrastructure.persistence.user_auth_facts_cache import user_auth_facts_cache
+from src.subscriptions.infrastructure.persistence.subscription_status_cache import subscription_status_cache
+from src.trips.infrastructure.persistence.trip_analytics_cache import trip_analytics_cache
+from src.expenses.infrastructure.persistence.trip_balances_cache import trip_balances_cache
+from src.shared.infrastructure.services.render_pool import render_pool
+from src.shared.infrastructure.security.hashing import password_hasher
+from src.trips.application.export_job_runner import ExportJobRunner
+from src.shared.infrastructure.services.email_outbox_worker import EmailOutboxWorker
+from src.shared.infrastructure.persistence.mongo_email_outbox_repository import MongoEmailOutboxRepository
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     await connect_to_mongo()
+    # Los repositorios toman la base de datos al construirse
+    container.reset()
+    await index_registry.apply(get_database())
+    if settings.check_index_coverage:
+        await index_registry.verify(get_database())
+    await container.get(ExportJobRunner).recover()
+    await container.get(EmailOutboxWorker).start()
     yield
+    await container.get(EmailOutboxWorker).stop()
+    render_pool.shutdown()
+    password_hasher.shutdown()
+    container.reset()
     await close_mongo_connection()
 
 app = FastAPI(
@@ -39,11 +70,18 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER],
 )
 
-app.add_middleware(SecurityMiddleware)
-app.add_middleware(SubscriptionMiddleware)
-app.add_middleware(EmailVerificationMiddleware)
+app.add_middleware(
+    AuthPipelineMiddleware,
+    policies=[
+        TokenRevocationPolicy(),
+        EmailVerificationPolicy(),
+        SubscriptionPolicy(),
+        SecurityHeadersPolicy()
+    ]
+)
 
 app.include_router(auth_router)
 app.include_router(subscription_router)
@@ -61,6 +99,31 @@ async def run_daily_tasks():
 async def run_weekly_tasks():
     return await execute_weekly_tasks()
 
+@app.post("/admin/reconcile-expense-rollups", dependencies=[Depends(require_admin_key)])
+async def reconcile_expense_rollups():
+    return await execute_rollup_reconciliation()
+
+@app.post("/admin/fx-rates", dependencies=[Depends(require_admin_key)])
+async def import_fx_rates(request: List[FxRateRequest]):
+    try:
+        return await container.get(ImportFxRates).execute([rate.dict() for rate in request])
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@app.get("/admin/cache-stats", dependencies=[Depends(require_admin_key)])
+async def cache_stats():
+    return {
+        "user_auth_facts": user_auth_facts_cache.stats(),
+        "subscription_status": subscription_status_cache.stats(),
+        "trip_analytics": trip_analytics_cache.stats(),
+        "trip_balances": trip_balances_cache.stats(),
+        "fx_rates": container.get(CurrencyConverter).stats()
+    }
+
+@app.get("/admin/email-outbox", dependencies=[Depends(require_admin_key)])
+async def email_outbox_stats():
+    return await container.get(MongoEmailOutboxRepository).count_by_status()
+
 @app.get("/")
 async def root():
     return {
@@ -0,0 +1,26 @@
+import asyncio
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.auth.infrastructure.persistence.mongo_user_repository import MongoUserRepository
+from src.shared.infrastructure.database.mongo_client import connect_to_mongo, close_mongo_connection
+
+async def run() -> int:
+    await connect_to_mongo()
+    try:
+        repository = MongoUserRepository()
+        indexed = 0
+        # Solo toma usuarios sin searchGrams, así que se puede volver a correr tras un corte
+        async for docs in repository.iter_missing_directory_fields():
+            indexed += await repository.set_directory_fields(docs)
+            print(f"{indexed} users indexed")
+    finally:
+        await close_mongo_connection()
+
+    print(f"User directory ready: {indexed} users indexed")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(run()))
@@ -0,0 +1,118 @@
+import argparse
+import os
+import sys
+import timeit
+from copy import deepcopy
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bson import ObjectId
+from src.trips.domain.trip import Trip
+from src.trips.infrastructure.persistence.mongo_trip_repository import trip_mapper
+
+def build_trip_document(days: int, activities_per_day: int, members: int) -> dict:
+    start = datetime(2025, 1, 1)
+    return {
+        "_id": ObjectId(),
+        "title": "Benchmark trip",
+        "startDate": start,
+        "endDate": start + timedelta(days=days - 1),
+        "createdBy": ObjectId(),
+        "coverImageUrl": None,
+        "isPublic": False,
+        "baseCurrency": "USD",
+        "estimatedTotalBudget": 2500.0,
+        "members": [
+            {"userId": ObjectId(), "role": "owner" if i == 0 else "viewer", "private_notes": None}
+            for i in range(members)
+        ],
+        "days": [
+            {
+                "_id": ObjectId(),
+                "date": start + timedelta(days=d),
+                "notes": f"Día {d + 1}",
+                "activities": [
+                    {
+                        "id": str(ObjectId()),
+                        "title": f"Actividad {a}",
+                        "description": "Visita guiada",
+                        "location": "Centro",
+                        "start_time": "09:00",
+                        "end_time": "11:00",
+                        "estimated_cost": 35.5,
+                        "order": a
+                    }
+                    for a in range(activities_per_day)
+                ]
+            }
+            for d in range(days)
+        ],
+        "isDeleted": False,
+        "createdAt": start
+    }
+
+def legacy_to_domain(doc: dict) -> Trip:
+    # Ruta previa: copiar y renombrar claves a mano y validar con Trip(**doc)
+    doc["id"] = str(doc["_id"])
+    doc["start_date"] = doc.get("startDate").date() if doc.get("startDate") else None
+    doc["end_date"] = doc.get("endDate").date() if doc.get("endDate") else None
+    doc["created_by"] = str(doc.get("createdBy"))
+    doc["estimated_total_budget"] = doc.get("estimatedTotalBudget")
+    doc["created_at"] = doc.get("createdAt")
+    doc["is_public"] = doc.get("isPublic", False)
+    doc["base_currency"] = doc.get("baseCurrency", "USD")
+
+    for member in doc.get("members", []):
+        member["user_id"] = str(member.pop("userId"))
+
+    for day in doc.get("days", []):
+        day["id"] = str(day.pop("_id"))
+        day["date"] = day.get("date").date() if day.get("date") else None
+
+    for key in ("_id", "startDate", "endDate", "createdBy", "estimatedTotalBudget", "createdAt", "isPublic", "baseCurrency"):
+        doc.pop(key, None)
+
+    return Trip(**doc)
+
+def generic_to_domain(doc: dict) -> Trip:
+    # Mapa de campos genérico, sin la lectura escrita a mano
+    return trip_mapper.model.model_validate(trip_mapper.to_values(doc))
+
+def measure(convert, template: dict, number: int) -> float:
+    # Cada iteración recibe su copia, igual que un documento recién leído del driver
+    docs = [deepcopy(template) for _ in range(number)]
+    return timeit.timeit(lambda: convert(docs.pop()), number=number) / number
+
+def run(days: int, activities_per_day: int, members: int, number: int, rounds: int) -> None:
+    template = build_trip_document(days, activities_per_day, members)
+    paths = {
+        "legacy (dict copy + Trip(**doc))": legacy_to_domain,
+        "generic field map": generic_to_domain,
+        "trip_mapper.to_domain": trip_mapper.to_domain
+    }
+
+    expected = legacy_to_domain(deepcopy(template)).model_dump()
+    for convert in paths.values():
+        assert convert(deepcopy(template)).model_dump() == expected
+
+    # Rondas intercaladas y el mínimo de cada ruta, para que el ruido de la máquina no decida el resultado
+    best = {name: float("inf") for name in paths}
+    for _ in range(rounds):
+        for name, convert in paths.items():
+            best[name] = min(best[name], measure(convert, template, number))
+
+    legacy = best["legacy (dict copy + Trip(**doc))"]
+    print(f"Trip with {days} days x {activities_per_day} activities, {members} members ({rounds} x {number} runs)")
+    for name, seconds in best.items():
+        print(f"  {name:<34} {seconds * 1000:.3f} ms/doc  ({legacy / seconds:.2f}x)")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compara el mapeo de documentos de viaje")
+    parser.add_argument("--days", type=int, default=45)
+    parser.add_argument("--activities", type=int, default=8)
+    parser.add_argument("--members", type=int, default=6)
+    parser.add_argument("--number", type=int, default=200)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+    run(args.days, args.activities, args.members, args.number, args.rounds)
@@ -0,0 +1,107 @@
+import argparse
+import asyncio
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bson import ObjectId
+from src.shared.infrastructure.database.mongo_client import connect_to_mongo, close_mongo_connection, get_database
+from src.shared.infrastructure.database.index_registry import index_registry
+from src.expenses.infrastructure.persistence.mongo_expense_repository import MongoExpenseRepository
+
+CATEGORIES = ["food", "transport", "lodging", "tickets", None]
+CURRENCIES = ["USD", "EUR", "MXN"]
+
+def build_expenses(trip_id: ObjectId, count: int, members: int, days: int) -> list:
+    rng = random.Random(42)
+    user_ids = [ObjectId() for _ in range(members)]
+    start = datetime(2025, 1, 1)
+    return [
+        {
+            "tripId": trip_id,
+            "userId": rng.choice(user_ids),
+            "activityId": None,
+            "amount": round(rng.uniform(1, 250), 2),
+            "currency": rng.choice(CURRENCIES),
+            "category": rng.choice(CATEGORIES),
+            "description": f"Gasto {i}",
+            "date": start + timedelta(days=rng.randrange(days)),
+            "splits": [],
+            "isDeleted": False
+        }
+        for i in range(count)
+    ]
+
+async def legacy_summary(repository: MongoExpenseRepository, trip_id: str) -> dict:
+    # Ruta previa: cargar todos los gastos y agrupar en Python
+    expenses = await repository.find_by_trip_id(trip_id)
+    total_amount = sum(expense.amount for expense in expenses)
+
+    by_category, by_user, by_date, by_currency = {}, {}, {}, {}
+    for expense in expenses:
+        for bucket, key in (
+            (by_category, expense.category or "Uncategorized"),
+            (by_user, expense.user_id),
+            (by_date, expense.date.strftime("%Y-%m-%d")),
+            (by_currency, expense.currency)
+        ):
+            if key not in bucket:
+                bucket[key] = {"count": 0, "total": Decimal(0)}
+            bucket[key]["count"] += 1
+            bucket[key]["total"] += expense.amount
+
+    return {
+        "count": len(expenses),
+        "total": total_amount,
+        "by_category": by_category,
+        "by_user": by_user,
+        "by_date": by_date,
+        "by_currency": by_currency
+    }
+
+async def timed(coro_factory, runs: int):
+    result = None
+    started = time.perf_counter()
+    for _ in range(runs):
+        result = await coro_factory()
+    return (time.perf_counter() - started) / runs, result
+
+async def run(count: int, members: int, days: int, runs: int) -> None:
+    await connect_to_mongo()
+    db = get_database()
+    await index_registry.apply(db)
+
+    trip_id = ObjectId()
+    repository = MongoExpenseRepository()
+    try:
+        await db.expenses.insert_many(build_expenses(trip_id, count, members, days))
+
+        legacy_time, legacy = await timed(lambda: legacy_summary(repository, str(trip_id)), runs)
+        pipeline_time, aggregated = await timed(lambda: repository.summarize(str(trip_id)), runs)
+
+        for key in ("by_category", "by_user", "by_date", "by_currency"):
+            assert {k: (v["count"], float(v["total"])) for k, v in legacy[key].items()} == \
+                {k: (v["count"], float(v["total"])) for k, v in aggregated[key].items()}, key
+        assert legacy["count"] == aggregated["count"]
+
+        print(f"Expense summary over {count} expenses, {members} members, {days} days ({runs} runs)")
+        print(f"  legacy (load + Python grouping): {legacy_time * 1000:.1f} ms")
+        print(f"  $match + $facet pipeline:        {pipeline_time * 1000:.1f} ms")
+        print(f"  speedup: {legacy_time / pipeline_time:.1f}x")
+    finally:
+        await db.expenses.delete_many({"tripId": trip_id})
+        await close_mongo_connection()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compara el resumen de gastos en Python contra la agregación")
+    parser.add_argument("--expenses", type=int, default=10000)
+    parser.add_argument("--members", type=int, default=8)
+    parser.add_argument("--days", type=int, default=30)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(run(args.expenses, args.members, args.days, args.runs))
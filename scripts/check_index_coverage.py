@@ -0,0 +1,31 @@
+import asyncio
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import main  # noqa: F401  (registra los índices de todos los contextos)
+import src.plan_deviations.infrastructure.persistence.mongo_plan_deviation_repository  # noqa: F401
+from src.shared.infrastructure.database.mongo_client import connect_to_mongo, close_mongo_connection, get_database
+from src.shared.infrastructure.database.index_registry import index_registry
+
+async def run() -> int:
+    await connect_to_mongo()
+    try:
+        await index_registry.apply(get_database())
+        violations = await index_registry.find_collection_scans(get_database())
+    finally:
+        await close_mongo_connection()
+
+    for violation in violations:
+        print(f"COLLSCAN {violation['collection']}.{violation['query']}: {' <- '.join(violation['stages'])}")
+
+    if violations:
+        print(f"{len(violations)} query shape(s) not served by an index")
+        return 1
+
+    print(f"All query shapes in {len(index_registry.collections)} collections are served by indexes")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(run()))
@@ -0,0 +1,135 @@
+import argparse
+import asyncio
+import os
+import sys
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pymongo import UpdateOne
+from src.shared.domain.money import quantize_money
+from src.shared.infrastructure.database.decimal_fields import to_decimal, to_decimal128
+from src.shared.infrastructure.database.mongo_client import connect_to_mongo, close_mongo_connection, get_database
+
+MIGRATION_ID = "money_decimal128"
+# Tipos que guardaba la versión anterior: float, enteros o texto
+LEGACY_TYPES = ["double", "int", "long", "string"]
+
+def _legacy(field: str):
+    return [{field: {"$type": legacy_type}} for legacy_type in LEGACY_TYPES]
+
+def _money(raw: Any, currency: str) -> Any:
+    if raw is None:
+        return None
+    # Los datos existentes se redondean a la unidad menor en lugar de rechazarse
+    return to_decimal128(quantize_money(to_decimal(raw), currency, strict=False))
+
+def convert_expense(doc: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    currency = doc.get("currency") or "USD"
+    splits = [dict(split, amount=_money(split.get("amount"), currency)) for split in doc.get("splits") or []]
+    # Si el gasto cambió mientras tanto, el filtro no coincide y se reintenta en otra pasada
+    match = {"_id": doc["_id"], "amount": doc.get("amount"), "splits": doc.get("splits")}
+    return match, {"$set": {"amount": _money(doc.get("amount"), currency), "splits": splits}}
+
+def convert_trip(doc: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    currency = doc.get("baseCurrency") or doc.get("base_currency") or "USD"
+    days = []
+    for day in doc.get("days") or []:
+        activities = [
+            dict(activity, estimated_cost=_money(activity.get("estimated_cost"), currency))
+            for activity in day.get("activities") or []
+        ]
+        days.append(dict(day, activities=activities))
+
+    update: Dict[str, Any] = {"days": days}
+    if doc.get("estimatedTotalBudget") is not None:
+        update["estimatedTotalBudget"] = _money(doc["estimatedTotalBudget"], currency)
+    # Toda escritura de un viaje incrementa dataVersion: sirve de control de concurrencia
+    return {"_id": doc["_id"], "dataVersion": doc.get("dataVersion")}, {"$set": update}
+
+MIGRATIONS: Dict[str, Tuple[Dict[str, Any], Callable]] = {
+    "expenses": (
+        {"$or": _legacy("amount") + _legacy("splits.amount")},
+        convert_expense
+    ),
+    "trips": (
+        {"$or": _legacy("estimatedTotalBudget") + _legacy("days.activities.estimated_cost")},
+        convert_trip
+    )
+}
+
+async def migrate_collection(db, name: str, batch_size: int) -> Dict[str, int]:
+    pending, convert = MIGRATIONS[name]
+    state = await db.migrations.find_one({"_id": MIGRATION_ID}) or {}
+    checkpoint: Optional[Dict[str, Any]] = (state.get("collections") or {}).get(name)
+    if checkpoint and checkpoint.get("completed"):
+        return {"converted": 0, "skipped": 0, "remaining": 0}
+
+    query = dict(pending)
+    if checkpoint and checkpoint.get("lastId"):
+        query["_id"] = {"$gt": checkpoint["lastId"]}
+
+    converted = skipped = 0
+    cursor = db[name].find(query).sort("_id", 1).batch_size(batch_size)
+    batch = []
+    async for doc in cursor:
+        batch.append(doc)
+        if len(batch) >= batch_size:
+            done, missed = await _write_batch(db, name, batch, convert)
+            converted, skipped = converted + done, skipped + missed
+            batch = []
+    if batch:
+        done, missed = await _write_batch(db, name, batch, convert)
+        converted, skipped = converted + done, skipped + missed
+
+    # Lo que cambió durante la pasada se vuelve a buscar desde el principio
+    remaining = await db[name].count_documents(pending)
+    await db.migrations.update_one(
+        {"_id": MIGRATION_ID},
+        {"$set": {
+            f"collections.{name}": {"lastId": None, "completed": remaining == 0},
+            "updatedAt": datetime.utcnow()
+        }},
+        upsert=True
+    )
+    return {"converted": converted, "skipped": skipped, "remaining": remaining}
+
+async def _write_batch(db, name: str, batch, convert) -> Tuple[int, int]:
+    operations = [UpdateOne(*convert(doc)) for doc in batch]
+    result = await db[name].bulk_write(operations, ordered=False)
+    # El punto de control se guarda por lote para poder reanudar tras un corte
+    await db.migrations.update_one(
+        {"_id": MIGRATION_ID},
+        {"$set": {f"collections.{name}.lastId": batch[-1]["_id"], "updatedAt": datetime.utcnow()}},
+        upsert=True
+    )
+    return result.modified_count, len(batch) - result.matched_count
+
+async def run(batch_size: int, restart: bool) -> int:
+    await connect_to_mongo()
+    db = get_database()
+    try:
+        if restart:
+            await db.migrations.delete_one({"_id": MIGRATION_ID})
+
+        remaining = 0
+        for name in MIGRATIONS:
+            result = await migrate_collection(db, name, batch_size)
+            remaining += result["remaining"]
+            print(f"{name}: {result['converted']} converted, {result['skipped']} changed during migration, {result['remaining']} remaining")
+    finally:
+        await close_mongo_connection()
+
+    if remaining:
+        print("Some documents still hold float amounts; run the migration again")
+        return 1
+    print("All money fields are stored as Decimal128")
+    return 0
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Convierte montos float a Decimal128 redondeados a la unidad menor de su moneda")
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--restart", action="store_true", help="Ignora el punto de control guardado")
+    args = parser.parse_args()
+    sys.exit(asyncio.run(run(args.batch_size, args.restart)))
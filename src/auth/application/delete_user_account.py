@@ -0,0 +1,18 @@
+from src.auth.infrastructure.persistence.mongo_user_repository import MongoUserRepository
+from src.auth.infrastructure.persistence.user_auth_facts_cache import user_auth_facts_cache
+from src.shared.infrastructure.container import container
+
+class DeleteUserAccount:
+    def __init__(self):
+        self.user_repository = container.get(MongoUserRepository)
+
+    async def execute(self, user_id: str) -> bool:
+        user = await self.user_repository.find_by_id(user_id)
+        if not user:
+            raise ValueError("User not found")
+
+        await self.user_repository.delete(user_id)
+        await self.user_repository.revoke_tokens(user_id)
+        user_auth_facts_cache.invalidate(user_id)
+
+        return True
\ No newline at end of file
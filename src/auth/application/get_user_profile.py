@@ -1,9 +1,10 @@
 from src.auth.domain.user import User
 from src.auth.infrastructure.persistence.mongo_user_repository import MongoUserRepository
+from src.shared.infrastructure.container import container
 
 class GetUserProfile:
     def __init__(self):
-        self.user_repository = MongoUserRepository()
+        self.user_repository = container.get(MongoUserRepository)
 
     async def execute(self, user_id: str) -> User:
         user = await self.user_repository.find_by_id(user_id)
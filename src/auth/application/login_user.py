@@ -1,33 +1,28 @@
 from datetime import datetime
+from typing import Optional
 from src.auth.infrastructure.persistence.mongo_user_repository import MongoUserRepository
-from src.shared.infrastructure.security.hashing import verify_password
-from src.shared.infrastructure.security.authentication import create_access_token, create_refresh_token
+from src.auth.application.token_issuer import TokenIssuer
+from src.auth.domain.user import User
+from src.shared.infrastructure.security.hashing import password_hasher
+from src.shared.infrastructure.container import container
 
 class LoginUser:
     def __init__(self):
-        self.user_repository = MongoUserRepository()
+        self.user_repository = container.get(MongoUserRepository)
+        self.token_issuer = container.get(TokenIssuer)
 
     async def execute(self, email: str, password: str) -> dict:
         user = await self.user_repository.find_by_email(email)
-        if not user or not verify_password(password, user.password):
+        if not user:
             raise ValueError("Invalid credentials")
 
-        await self.user_repository.update(user.id, {"lastLoginAt": datetime.utcnow()})
+        valid, new_hash = await password_hasher.verify_and_update(password, user.password)
+        if not valid:
+            raise ValueError("Invalid credentials")
 
-        token_data = {"sub": user.id, "email": user.email}
-        access_token = create_access_token(token_data)
-        refresh_token = create_refresh_token(token_data)
+        # Si cambió el costo configurado se aprovecha la contraseña en claro para rehashear
+        return await self.start_session(user, {"password": new_hash} if new_hash else None)
 
-        return {
-            "access_token": access_token,
-            "refresh_token": refresh_token,
-            "token_type": "bearer",
-            "user": {
-                "id": user.id,
-                "email": user.email,
-                "name": user.name,
-                "profile_photo_url": user.profile_photo_url,
-                "email_verified": user.email_verified
-            },
-            
-        }
\ No newline at end of file
+    async def start_session(self, user: User, update_data: Optional[dict] = None) -> dict:
+        await self.user_repository.update(user.id, {**(update_data or {}), "lastLoginAt": datetime.utcnow()})
+        return await self.token_issuer.issue(user)
\ No newline at end of file
@@ -0,0 +1,30 @@
+from src.auth.infrastructure.persistence.mongo_user_repository import MongoUserRepository
+from src.auth.infrastructure.persistence.user_auth_facts_cache import user_auth_facts_cache
+from src.auth.application.token_issuer import TokenIssuer
+from src.shared.infrastructure.security.authentication import verify_token, is_token_revoked
+from src.shared.config import settings
+from src.shared.infrastructure.container import container
+
+class RefreshTokens:
+    def __init__(self):
+        self.user_repository = container.get(MongoUserRepository)
+        self.token_issuer = container.get(TokenIssuer)
+
+    async def execute(self, refresh_token: str) -> dict:
+        payload = verify_token(refresh_token, settings.jwt_refresh_secret)
+        if not payload or payload.get("type") != "refresh" or not payload.get("sub"):
+            raise ValueError("Invalid refresh token")
+
+        user_id = payload["sub"]
+        facts = await user_auth_facts_cache.get(user_id)
+        if not facts.exists or facts.is_deleted:
+            raise ValueError("User not found")
+
+        if is_token_revoked(payload, facts.tokens_valid_after):
+            raise ValueError("Refresh token revoked")
+
+        user = await self.user_repository.find_by_id(user_id)
+        if not user:
+            raise ValueError("User not found")
+
+        return await self.token_issuer.issue(user)
\ No newline at end of file
@@ -1,19 +1,20 @@
 from src.auth.domain.user import User
 from src.auth.infrastructure.persistence.mongo_user_repository import MongoUserRepository
-from src.shared.infrastructure.security.hashing import hash_password
+from src.shared.infrastructure.security.hashing import password_hasher
 from src.subscriptions.application.subscription_service import SubscriptionService
+from src.shared.infrastructure.container import container
 
 class RegisterUser:
     def __init__(self):
-        self.user_repository = MongoUserRepository()
-        self.subscription_service = SubscriptionService()
+        self.user_repository = container.get(MongoUserRepository)
+        self.subscription_service = container.get(SubscriptionService)
 
     async def execute(self, email: str, password: str, name: str) -> User:
         existing_user = await self.user_repository.find_by_email(email)
         if existing_user:
             raise ValueError("Email already registered")
 
-        hashed_password = hash_password(password)
+        hashed_password = await password_hasher.hash(password)
         
         user = User(
             email=email,
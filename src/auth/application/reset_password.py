@@ -1,10 +1,12 @@
 from datetime import datetime
 from src.auth.infrastructure.persistence.mongo_user_repository import MongoUserRepository
-from src.shared.infrastructure.security.hashing import hash_password
+from src.auth.infrastructure.persistence.user_auth_facts_cache import user_auth_facts_cache
+from src.shared.infrastructure.security.hashing import password_hasher
+from src.shared.infrastructure.container import container
 
 class ResetPassword:
     def __init__(self):
-        self.user_repository = MongoUserRepository()
+        self.user_repository = container.get(MongoUserRepository)
 
     async def execute(self, email: str, token: str, new_password: str) -> bool:
         user = await self.user_repository.find_by_email(email)
@@ -20,7 +22,7 @@ class ResetPassword:
         if user.reset_expires and user.reset_expires < datetime.utcnow():
             raise ValueError("Reset token expired")
 
-        hashed_password = hash_password(new_password)
+        hashed_password = await password_hasher.hash(new_password)
 
         update_data = {
             "password": hashed_password,
@@ -28,5 +30,8 @@ class ResetPassword:
             "reset_expires": None
         }
         await self.user_repository.update(user.id, update_data)
+        # Invalida las sesiones emitidas con la contraseña anterior
+        await self.user_repository.revoke_tokens(user.id)
+        user_auth_facts_cache.invalidate(user.id)
 
         return True
\ No newline at end of file
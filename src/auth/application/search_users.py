@@ -1,15 +1,52 @@
+import asyncio
 from typing import List
 from src.auth.domain.user import User
+from src.auth.domain.user_directory import query_tokens, matches, match_quality
 from src.auth.infrastructure.persistence.mongo_user_repository import MongoUserRepository
+from src.trips.infrastructure.persistence.mongo_trip_repository import MongoTripRepository
+from src.shared.infrastructure.container import container
+
+SEARCH_RESULT_LIMIT = 10
+# Candidatos que se leen del directorio general; acota la latencia con prefijos comunes
+DIRECTORY_CANDIDATES = 50
 
 class SearchUsers:
     def __init__(self):
-        self.user_repository = MongoUserRepository()
+        self.user_repository = container.get(MongoUserRepository)
+        self.trip_repository = container.get(MongoTripRepository)
 
     async def execute(self, query: str, current_user_id: str) -> List[User]:
         if not query or len(query) < 2:
             raise ValueError("Query must be at least 2 characters")
 
-        users = await self.user_repository.search_by_email_pattern(query)
-        
-        return [user for user in users if user.id != current_user_id]
\ No newline at end of file
+        tokens = query_tokens(query)
+        if not tokens:
+            raise ValueError("Query must contain at least 2 letters or digits")
+
+        current_user, co_traveler_ids = await asyncio.gather(
+            self.user_repository.find_by_id(current_user_id),
+            self.trip_repository.find_co_traveler_ids(current_user_id)
+        )
+        friend_ids = {str(friend.user_id) for friend in current_user.friends} if current_user else set()
+        related_ids = friend_ids | co_traveler_ids
+
+        # Amigos y compañeros de viaje se buscan aparte para que no queden fuera del tope general
+        related, others = await asyncio.gather(
+            self.user_repository.search_directory(tokens, current_user_id, len(related_ids), list(related_ids))
+            if related_ids else _no_users(),
+            self.user_repository.search_directory(tokens, current_user_id, DIRECTORY_CANDIDATES)
+        )
+
+        candidates = {user.id: user for user in others}
+        candidates.update({user.id: user for user in related})
+
+        def rank(user: User) -> tuple:
+            relation = 0 if user.id in friend_ids else 1 if user.id in co_traveler_ids else 2
+            return (relation, match_quality(query, tokens, user.email, user.name), user.name.lower(), user.id)
+
+        found = [user for user in candidates.values() if matches(query, tokens, user.email, user.name)]
+        found.sort(key=rank)
+        return found[:SEARCH_RESULT_LIMIT]
+
+async def _no_users() -> List[User]:
+    return []
@@ -1,10 +1,11 @@
 from src.auth.infrastructure.persistence.mongo_user_repository import MongoUserRepository
 from src.shared.infrastructure.services.email_service import EmailService
+from src.shared.infrastructure.container import container
 
 class SendVerificationEmail:
     def __init__(self):
-        self.user_repository = MongoUserRepository()
-        self.email_service = EmailService()
+        self.user_repository = container.get(MongoUserRepository)
+        self.email_service = container.get(EmailService)
 
     async def execute(self, email: str) -> bool:
         user = await self.user_repository.find_by_email(email)
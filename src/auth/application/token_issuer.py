@@ -0,0 +1,37 @@
+from src.auth.domain.user import User
+from src.subscriptions.application.subscription_service import SubscriptionService
+from src.shared.infrastructure.security.authentication import (
+    build_token_claims, create_access_token, create_refresh_token
+)
+from src.shared.infrastructure.container import container
+
+class TokenIssuer:
+    def __init__(self):
+        self.subscription_service = container.get(SubscriptionService)
+
+    async def issue(self, user: User) -> dict:
+        subscription_status = await self.subscription_service.get_subscription_status(user.id)
+
+        token_data = build_token_claims(
+            user_id=user.id,
+            email=user.email,
+            email_verified=user.email_verified,
+            plan=subscription_status["plan"],
+            claims_version=user.claims_version,
+            plan_expires_at=subscription_status["expires_at"] if subscription_status["is_pro"] else None
+        )
+        access_token = create_access_token(token_data)
+        refresh_token = create_refresh_token(token_data)
+
+        return {
+            "access_token": access_token,
+            "refresh_token": refresh_token,
+            "token_type": "bearer",
+            "user": {
+                "id": user.id,
+                "email": user.email,
+                "name": user.name,
+                "profile_photo_url": user.profile_photo_url,
+                "email_verified": user.email_verified
+            },
+        }
\ No newline at end of file
@@ -1,10 +1,11 @@
 from src.auth.infrastructure.persistence.mongo_user_repository import MongoUserRepository
 from src.shared.infrastructure.services.file_storage_service import FileStorageService
+from src.shared.infrastructure.container import container
 
 class UploadProfilePhoto:
     def __init__(self):
-        self.user_repository = MongoUserRepository()
-        self.file_storage_service = FileStorageService()
+        self.user_repository = container.get(MongoUserRepository)
+        self.file_storage_service = container.get(FileStorageService)
 
     async def execute(self, user_id: str, file_bytes: bytes, filename: str) -> str:
         user = await self.user_repository.find_by_id(user_id)
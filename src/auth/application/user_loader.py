@@ -0,0 +1,62 @@
+import asyncio
+from typing import Dict, Iterable, Optional, Set
+from bson import ObjectId
+from src.auth.domain.user import UserSummary
+from src.auth.infrastructure.persistence.mongo_user_repository import MongoUserRepository
+from src.shared.infrastructure.container import container
+from src.shared.infrastructure.request_scope import request_memo
+
+class UserLoader:
+    """Agrupa las búsquedas de perfiles públicos de una request en una sola consulta $in.
+
+    Los ids pedidos en el mismo ciclo del event loop (por ejemplo desde un
+    asyncio.gather) se resuelven juntos, y cada id se lee como mucho una vez
+    por request.
+    """
+
+    def __init__(self):
+        self.user_repository = container.get(MongoUserRepository)
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def load(self, user_id: str) -> Optional[UserSummary]:
+        return (await self.load_many([user_id])).get(user_id)
+
+    async def load_many(self, user_ids: Iterable[str]) -> Dict[str, UserSummary]:
+        futures = request_memo("user_loader")
+        pending = request_memo("user_loader_pending")
+        loop = asyncio.get_running_loop()
+
+        wanted = [user_id for user_id in dict.fromkeys(user_ids) if user_id and ObjectId.is_valid(user_id)]
+        for user_id in wanted:
+            if user_id in futures:
+                continue
+            if not pending:
+                # El lote se despacha después de que el resto de corrutinas listas encolen sus ids
+                task = loop.create_task(self._dispatch(futures, pending))
+                self._tasks.add(task)
+                task.add_done_callback(self._tasks.discard)
+            futures[user_id] = pending[user_id] = loop.create_future()
+
+        summaries: Dict[str, UserSummary] = {}
+        for user_id in wanted:
+            summary = await futures[user_id]
+            if summary is not None:
+                summaries[user_id] = summary
+        return summaries
+
+    async def _dispatch(self, futures: Dict[str, asyncio.Future], pending: Dict[str, asyncio.Future]) -> None:
+        batch = dict(pending)
+        pending.clear()
+        try:
+            found = {summary.id: summary for summary in await self.user_repository.find_summaries_by_ids(list(batch))}
+        except Exception as e:
+            for user_id, future in batch.items():
+                # Sin cachear el error: otra llamada en la misma request puede reintentar
+                futures.pop(user_id, None)
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for user_id, future in batch.items():
+            if not future.done():
+                future.set_result(found.get(user_id))
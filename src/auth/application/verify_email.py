@@ -1,9 +1,11 @@
 from datetime import datetime
 from src.auth.infrastructure.persistence.mongo_user_repository import MongoUserRepository
+from src.auth.infrastructure.persistence.user_auth_facts_cache import user_auth_facts_cache
+from src.shared.infrastructure.container import container
 
 class VerifyEmail:
     def __init__(self):
-        self.user_repository = MongoUserRepository()
+        self.user_repository = container.get(MongoUserRepository)
 
     async def execute(self, email: str, token: str) -> bool:
         user = await self.user_repository.find_by_email(email)
@@ -28,5 +30,7 @@ class VerifyEmail:
             "verification_expires": None
         }
         await self.user_repository.update(user.id, update_data)
+        await self.user_repository.bump_claims_version(user.id)
+        user_auth_facts_cache.invalidate(user.id)
 
         return True
\ No newline at end of file
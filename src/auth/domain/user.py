@@ -20,10 +20,25 @@ class User(BaseModel):
     reset_token: Optional[str] = None
     reset_expires: Optional[datetime] = None
     friends: List[Friend] = []
+    claims_version: int = 0
+    tokens_valid_after: Optional[datetime] = None
     is_deleted: bool = False
     created_at: datetime = datetime.utcnow()
 
     class Config:
         json_encoders = {
             ObjectId: str
-        }
\ No newline at end of file
+        }
+
+class UserSummary(BaseModel):
+    id: str
+    name: str
+    profile_photo_url: Optional[str] = None
+
+class UserAuthFacts(BaseModel):
+    user_id: str
+    exists: bool
+    email_verified: bool = False
+    is_deleted: bool = False
+    claims_version: int = 0
+    tokens_valid_after: Optional[datetime] = None
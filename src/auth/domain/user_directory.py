@@ -0,0 +1,57 @@
+import re
+from typing import Any, Dict, List
+from src.shared.domain.text import fold
+
+WORD_PATTERN = re.compile(r"[^\W_]+")
+MIN_GRAM_LENGTH = 2
+# Los términos más largos se buscan por su prefijo y se confirman contra el texto completo
+MAX_GRAM_LENGTH = 12
+
+def query_tokens(query: str) -> List[str]:
+    return [token for token in WORD_PATTERN.findall(fold(query)) if len(token) >= MIN_GRAM_LENGTH]
+
+def _edge_grams(word: str) -> List[str]:
+    return [word[:size] for size in range(MIN_GRAM_LENGTH, min(len(word), MAX_GRAM_LENGTH) + 1)]
+
+def directory_grams(email: str, name: str) -> List[str]:
+    """N-gramas de borde para buscar usuarios por prefijo o subcadena.
+
+    Los nombres y la parte local del correo generan n-gramas desde cada posición,
+    así una subcadena cualquiera es prefijo de algún n-grama. El dominio solo
+    se indexa por prefijo para no inflar el arreglo.
+    """
+    local, _, domain = fold(email).partition("@")
+    grams = set()
+    for word in WORD_PATTERN.findall(fold(name)) + WORD_PATTERN.findall(local):
+        for start in range(len(word) - MIN_GRAM_LENGTH + 1):
+            grams.update(_edge_grams(word[start:]))
+    for label in WORD_PATTERN.findall(domain):
+        grams.update(_edge_grams(label))
+    return sorted(grams)
+
+def directory_fields(email: str, name: str) -> Dict[str, Any]:
+    return {
+        "emailLower": fold(email).strip(),
+        "nameLower": fold(name).strip(),
+        "searchGrams": directory_grams(email, name)
+    }
+
+def lookup_grams(tokens: List[str]) -> List[str]:
+    return sorted({token[:MAX_GRAM_LENGTH] for token in tokens})
+
+def matches(query: str, tokens: List[str], email: str, name: str) -> bool:
+    # Una búsqueda con @ se trata como parte de un correo y se compara completa
+    if "@" in query:
+        return fold(query).strip() in fold(email)
+    haystack = f"{fold(email)} {fold(name)}"
+    return all(token in haystack for token in tokens)
+
+def match_quality(query: str, tokens: List[str], email: str, name: str) -> int:
+    # 0: correo exacto, 1: algún campo empieza con la búsqueda, 2: subcadena
+    email, name, query = fold(email), fold(name), fold(query).strip()
+    if email == query:
+        return 0
+    words = WORD_PATTERN.findall(name) + WORD_PATTERN.findall(email.partition("@")[0])
+    if email.startswith(query) or name.startswith(query) or any(word.startswith(tokens[0]) for word in words):
+        return 1
+    return 2
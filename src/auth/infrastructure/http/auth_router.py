@@ -3,10 +3,11 @@ from typing import List
 from src.auth.infrastructure.http.auth_schemas import (
     RegisterRequest, LoginRequest, LoginResponse, UserResponse, 
     UserProfileResponse, VerifyEmailRequest, SendPasswordResetRequest, 
-    ResetPasswordRequest
+    ResetPasswordRequest, RefreshTokenRequest
 )
 from src.auth.application.register_user import RegisterUser
 from src.auth.application.login_user import LoginUser
+from src.auth.application.refresh_tokens import RefreshTokens
 from src.auth.application.search_users import SearchUsers
 from src.auth.application.get_user_profile import GetUserProfile
 from src.auth.application.upload_profile_photo import UploadProfilePhoto
@@ -14,97 +15,136 @@ from src.auth.application.send_verification_email import SendVerificationEmail
 from src.auth.application.verify_email import VerifyEmail
 from src.auth.application.send_password_reset_email import SendPasswordResetEmail
 from src.auth.application.reset_password import ResetPassword
+from src.auth.application.delete_user_account import DeleteUserAccount
 from src.shared.infrastructure.security.authentication import get_current_user_id
+from src.shared.infrastructure.security.hashing import PasswordHasherBusy
+from src.shared.infrastructure.container import provide
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
 @router.post("/register", response_model=LoginResponse)
-async def register(request: RegisterRequest):
+async def register(
+    request: RegisterRequest,
+    register_user: RegisterUser = Depends(provide(RegisterUser)),
+    send_verification_uc: SendVerificationEmail = Depends(provide(SendVerificationEmail)),
+    login_user: LoginUser = Depends(provide(LoginUser))
+):
     try:
-        register_user = RegisterUser()
         user = await register_user.execute(
             email=request.email,
             password=request.password,
             name=request.name
         )
         
-        send_verification_uc = SendVerificationEmail()
         await send_verification_uc.execute(user.email)
         
-        login_user = LoginUser()
-        return await login_user.execute(request.email, request.password)
+        # La contraseña se acaba de hashear: se emiten los tokens sin una segunda ronda de bcrypt
+        return await login_user.start_session(user)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except PasswordHasherBusy as e:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(e), headers={"Retry-After": "1"})
 
 @router.post("/login", response_model=LoginResponse)
-async def login(request: LoginRequest):
+async def login(request: LoginRequest, login_user: LoginUser = Depends(provide(LoginUser))):
     try:
-        login_user = LoginUser()
         return await login_user.execute(request.email, request.password)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail=str(e))
+    except PasswordHasherBusy as e:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(e), headers={"Retry-After": "1"})
+
+@router.post("/refresh", response_model=LoginResponse)
+async def refresh(request: RefreshTokenRequest, refresh_tokens: RefreshTokens = Depends(provide(RefreshTokens))):
+    try:
+        return await refresh_tokens.execute(request.refresh_token)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail=str(e))
 
 @router.get("/search", response_model=List[UserResponse])
-async def search_users(q: str = Query(..., min_length=2), user_id: str = Depends(get_current_user_id)):
+async def search_users(
+    q: str = Query(..., min_length=2),
+    user_id: str = Depends(get_current_user_id),
+    search_users_uc: SearchUsers = Depends(provide(SearchUsers))
+):
     try:
-        search_users_uc = SearchUsers()
         users = await search_users_uc.execute(q, user_id)
         return [UserResponse(**user.dict()) for user in users]
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 @router.get("/profile", response_model=UserProfileResponse)
-async def get_profile(user_id: str = Depends(get_current_user_id)):
+async def get_profile(
+    user_id: str = Depends(get_current_user_id),
+    get_profile_uc: GetUserProfile = Depends(provide(GetUserProfile))
+):
     try:
-        get_profile_uc = GetUserProfile()
         user = await get_profile_uc.execute(user_id)
         return UserProfileResponse(**user.dict())
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
 
+@router.delete("/account", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_account(
+    user_id: str = Depends(get_current_user_id),
+    delete_account_uc: DeleteUserAccount = Depends(provide(DeleteUserAccount))
+):
+    try:
+        await delete_account_uc.execute(user_id)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+
 @router.post("/send-verification", status_code=status.HTTP_200_OK)
-async def send_verification_email(user_id: str = Depends(get_current_user_id)):
+async def send_verification_email(
+    user_id: str = Depends(get_current_user_id),
+    get_profile_uc: GetUserProfile = Depends(provide(GetUserProfile)),
+    send_verification_uc: SendVerificationEmail = Depends(provide(SendVerificationEmail))
+):
     try:
-        get_profile_uc = GetUserProfile()
         user = await get_profile_uc.execute(user_id)
         
-        send_verification_uc = SendVerificationEmail()
         await send_verification_uc.execute(user.email)
         return {"message": "Verification email sent"}
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 @router.post("/verify-email", status_code=status.HTTP_200_OK)
-async def verify_email(request: VerifyEmailRequest):
+async def verify_email(request: VerifyEmailRequest, verify_email_uc: VerifyEmail = Depends(provide(VerifyEmail))):
     try:
-        verify_email_uc = VerifyEmail()
         await verify_email_uc.execute(request.email, request.token)
         return {"message": "Email verified successfully"}
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 @router.post("/send-password-reset", status_code=status.HTTP_200_OK)
-async def send_password_reset(request: SendPasswordResetRequest):
+async def send_password_reset(
+    request: SendPasswordResetRequest,
+    send_reset_uc: SendPasswordResetEmail = Depends(provide(SendPasswordResetEmail))
+):
     try:
-        send_reset_uc = SendPasswordResetEmail()
         await send_reset_uc.execute(request.email)
         return {"message": "Password reset email sent"}
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 @router.post("/reset-password", status_code=status.HTTP_200_OK)
-async def reset_password(request: ResetPasswordRequest):
+async def reset_password(
+    request: ResetPasswordRequest,
+    reset_password_uc: ResetPassword = Depends(provide(ResetPassword))
+):
     try:
-        reset_password_uc = ResetPassword()
         await reset_password_uc.execute(request.email, request.token, request.new_password)
         return {"message": "Password reset successfully"}
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except PasswordHasherBusy as e:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(e), headers={"Retry-After": "1"})
 
 @router.post("/upload-profile-photo", status_code=status.HTTP_200_OK)
 async def upload_profile_photo(
     file: UploadFile = File(...),
-    user_id: str = Depends(get_current_user_id)
+    user_id: str = Depends(get_current_user_id),
+    upload_photo_uc: UploadProfilePhoto = Depends(provide(UploadProfilePhoto))
 ):
     try:
         if not file.content_type or not file.content_type.startswith('image/'):
@@ -114,7 +154,6 @@ async def upload_profile_photo(
         if len(file_bytes) > 5 * 1024 * 1024:
             raise ValueError("File size must be less than 5MB")
         
-        upload_photo_uc = UploadProfilePhoto()
         photo_url = await upload_photo_uc.execute(
             user_id=user_id,
             file_bytes=file_bytes,
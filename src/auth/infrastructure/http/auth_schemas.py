@@ -11,6 +11,9 @@ class LoginRequest(BaseModel):
     email: EmailStr
     password: str
 
+class RefreshTokenRequest(BaseModel):
+    refresh_token: str
+
 class VerifyEmailRequest(BaseModel):
     email: EmailStr
     token: str
@@ -36,6 +39,14 @@ class UserResponse(BaseModel):
     name: str
     profile_photo_url: Optional[str] = None
 
+class UserSummaryResponse(BaseModel):
+    id: str
+    name: str
+    profile_photo_url: Optional[str] = None
+
+    class Config:
+        from_attributes = True
+
 class UserProfileResponse(BaseModel):
     id: str
     email: str
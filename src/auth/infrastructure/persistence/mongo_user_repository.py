@@ -1,75 +1,45 @@
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, AsyncIterator
 from bson import ObjectId
 from datetime import datetime
+from pymongo import IndexModel, UpdateOne, ASCENDING
 from src.shared.infrastructure.database.mongo_client import get_database
-from src.auth.domain.user import User
+from src.shared.infrastructure.database.index_registry import index_registry, QueryShape
+from src.shared.infrastructure.database.document_mapper import DocumentMapper, object_id, nested, value
+from src.auth.domain.user import User, UserAuthFacts, UserSummary, Friend
+from src.auth.domain.user_directory import directory_fields, lookup_grams
+
+friend_mapper = DocumentMapper(Friend, {
+    "user_id": object_id("userId", default=""),
+    "friendship_date": value("friendshipDate", default=datetime.utcnow)
+})
+
+user_mapper = DocumentMapper(User, {
+    "id": object_id("_id"),
+    "email": value(default=""),
+    "password": value(default=""),
+    "name": value(default=""),
+    "profile_photo_url": value("profilePhotoUrl", default=None),
+    "last_login_at": value("lastLoginAt", default=None),
+    "email_verified": value("emailVerified", default=False),
+    "verification_token": value(default=None),
+    "verification_expires": value(default=None),
+    "reset_token": value(default=None),
+    "reset_expires": value(default=None),
+    "friends": nested(friend_mapper),
+    "claims_version": value("claimsVersion", default=0),
+    "tokens_valid_after": value("tokensValidAfter", default=None),
+    "is_deleted": value("isDeleted", default=False),
+    "created_at": value("createdAt", default=datetime.utcnow)
+})
 
 class MongoUserRepository:
     def __init__(self):
         self.db = get_database()
         self.collection = self.db.users
 
-    def _convert_doc_to_user(self, doc: Dict[str, Any]) -> Dict[str, Any]:
-        """Convert MongoDB document to User-compatible dict"""
-        converted = {
-            "id": str(doc["_id"]),
-            "email": doc.get("email", ""),
-            "password": doc.get("password", ""),
-            "name": doc.get("name", ""),
-            "profile_photo_url": doc.get("profilePhotoUrl"),
-            "last_login_at": doc.get("lastLoginAt"),
-            "email_verified": doc.get("emailVerified", False),
-            "verification_token": doc.get("verification_token"),
-            "verification_expires": doc.get("verification_expires"),
-            "reset_token": doc.get("reset_token"),
-            "reset_expires": doc.get("reset_expires"),
-            "is_deleted": doc.get("isDeleted", False),
-            "created_at": doc.get("createdAt", datetime.utcnow())
-        }
-        
-        # Convert friends array
-        friends_converted = []
-        for friend in doc.get("friends", []):
-            friend_data = {
-                "user_id": str(friend.get("userId", "")),
-                "friendship_date": friend.get("friendshipDate", datetime.utcnow())
-            }
-            friends_converted.append(friend_data)
-        converted["friends"] = friends_converted
-        
-        return converted
-
     async def create(self, user: User) -> User:
-        user_dict = user.dict(exclude={"id"})
-        
-        # Convert friends to MongoDB format
-        if "friends" in user_dict:
-            friends_mongo = []
-            for friend in user_dict["friends"]:
-                friend_mongo = {
-                    "userId": ObjectId(friend["user_id"]),
-                    "friendshipDate": friend["friendship_date"]
-                }
-                friends_mongo.append(friend_mongo)
-            user_dict["friends"] = friends_mongo
-        
-        # Convert field names to MongoDB format
-        if "profile_photo_url" in user_dict:
-            user_dict["profilePhotoUrl"] = user_dict["profile_photo_url"]
-            del user_dict["profile_photo_url"]
-        if "last_login_at" in user_dict:
-            user_dict["lastLoginAt"] = user_dict["last_login_at"]
-            del user_dict["last_login_at"]
-        if "email_verified" in user_dict:
-            user_dict["emailVerified"] = user_dict["email_verified"]
-            del user_dict["email_verified"]
-        if "is_deleted" in user_dict:
-            user_dict["isDeleted"] = user_dict["is_deleted"]
-            del user_dict["is_deleted"]
-        if "created_at" in user_dict:
-            user_dict["createdAt"] = user_dict["created_at"]
-            del user_dict["created_at"]
-        
+        user_dict = user_mapper.to_document(user, exclude=("id",))
+        user_dict.update(directory_fields(user.email, user.name))
         result = await self.collection.insert_one(user_dict)
         user.id = str(result.inserted_id)
         return user
@@ -77,15 +47,46 @@ class MongoUserRepository:
     async def find_by_id(self, user_id: str) -> Optional[User]:
         doc: Optional[Dict[str, Any]] = await self.collection.find_one({"_id": ObjectId(user_id), "isDeleted": {"$ne": True}})
         if doc:
-            converted = self._convert_doc_to_user(doc)
-            return User(**converted)
+            return user_mapper.to_domain(doc)
         return None
 
+    async def find_by_ids(self, user_ids: List[str]) -> List[User]:
+        cursor = self.collection.find({"_id": {"$in": [ObjectId(user_id) for user_id in user_ids]}, "isDeleted": {"$ne": True}})
+        users = {str(doc["_id"]): user_mapper.to_domain(doc) async for doc in cursor}
+        return [users[user_id] for user_id in user_ids if user_id in users]
+
+    async def find_summaries_by_ids(self, user_ids: List[str]) -> List[UserSummary]:
+        # Solo el perfil público: nunca se leen credenciales ni tokens
+        cursor = self.collection.find(
+            {"_id": {"$in": [ObjectId(user_id) for user_id in user_ids]}, "isDeleted": {"$ne": True}},
+            {"name": 1, "profilePhotoUrl": 1}
+        )
+        return [
+            UserSummary(id=str(doc["_id"]), name=doc.get("name", ""), profile_photo_url=doc.get("profilePhotoUrl"))
+            async for doc in cursor
+        ]
+
+    async def find_auth_facts(self, user_id: str) -> UserAuthFacts:
+        doc = await self.collection.find_one(
+            {"_id": ObjectId(user_id)},
+            {"emailVerified": 1, "isDeleted": 1, "claimsVersion": 1, "tokensValidAfter": 1}
+        )
+        if not doc:
+            return UserAuthFacts(user_id=user_id, exists=False)
+
+        return UserAuthFacts(
+            user_id=user_id,
+            exists=True,
+            email_verified=doc.get("emailVerified", False),
+            is_deleted=doc.get("isDeleted", False),
+            claims_version=doc.get("claimsVersion", 0),
+            tokens_valid_after=doc.get("tokensValidAfter")
+        )
+
     async def find_by_email(self, email: str) -> Optional[User]:
         doc: Optional[Dict[str, Any]] = await self.collection.find_one({"email": email, "isDeleted": {"$ne": True}})
         if doc:
-            converted = self._convert_doc_to_user(doc)
-            return User(**converted)
+            return user_mapper.to_domain(doc)
         return None
 
     async def update(self, user_id: str, update_data: dict) -> bool:
@@ -102,6 +103,14 @@ class MongoUserRepository:
                 mongo_update_data["isDeleted"] = value
             else:
                 mongo_update_data[key] = value
+
+        if "email" in mongo_update_data or "name" in mongo_update_data:
+            # El directorio de búsqueda depende de ambos campos
+            current = await self.collection.find_one({"_id": ObjectId(user_id)}, {"email": 1, "name": 1}) or {}
+            mongo_update_data.update(directory_fields(
+                mongo_update_data.get("email", current.get("email", "")),
+                mongo_update_data.get("name", current.get("name", ""))
+            ))
         
         result = await self.collection.update_one(
             {"_id": ObjectId(user_id)},
@@ -109,6 +118,30 @@ class MongoUserRepository:
         )
         return result.modified_count > 0
 
+    async def bump_claims_version(self, user_id: str) -> bool:
+        result = await self.collection.update_one(
+            {"_id": ObjectId(user_id)},
+            {"$inc": {"claimsVersion": 1}}
+        )
+        return result.modified_count > 0
+
+    async def revoke_tokens(self, user_id: str) -> bool:
+        # Marca de agua: se rechazan los tokens emitidos hasta este milisegundo (la precisión de Mongo)
+        now = datetime.utcnow()
+        watermark = now.replace(microsecond=now.microsecond // 1000 * 1000)
+        result = await self.collection.update_one(
+            {"_id": ObjectId(user_id)},
+            {"$set": {"tokensValidAfter": watermark}, "$inc": {"claimsVersion": 1}}
+        )
+        return result.modified_count > 0
+
+    async def delete(self, user_id: str) -> bool:
+        result = await self.collection.update_one(
+            {"_id": ObjectId(user_id)},
+            {"$set": {"isDeleted": True}}
+        )
+        return result.modified_count > 0
+
     async def add_friend(self, user_id: str, friend_data: dict) -> bool:
         # Convert friend data to MongoDB format
         friend_mongo = {
@@ -141,14 +174,52 @@ class MongoUserRepository:
         
         return result.modified_count > 0
 
-    async def search_by_email_pattern(self, pattern: str) -> List[User]:
-        cursor = self.collection.find({
-            "email": {"$regex": pattern, "$options": "i"},
+    async def search_directory(
+        self,
+        tokens: List[str],
+        exclude_user_id: str,
+        limit: int,
+        among_user_ids: Optional[List[str]] = None
+    ) -> List[User]:
+        # $all sobre el arreglo multikey: el índice resuelve el primer n-grama y filtra el resto
+        query: Dict[str, Any] = {
+            "searchGrams": {"$all": lookup_grams(tokens)},
             "isDeleted": {"$ne": True}
-        }).limit(10)
-        
-        users = []
-        async for doc in cursor:
-            converted = self._convert_doc_to_user(doc)
-            users.append(User(**converted))
-        return users
\ No newline at end of file
+        }
+        if among_user_ids is not None:
+            query["_id"] = {"$in": [ObjectId(user_id) for user_id in among_user_ids if user_id != exclude_user_id]}
+        else:
+            query["_id"] = {"$ne": ObjectId(exclude_user_id)}
+
+        cursor = self.collection.find(query).limit(limit)
+        return [user_mapper.to_domain(doc) async for doc in cursor]
+
+    async def iter_missing_directory_fields(self, batch_size: int = 500) -> AsyncIterator[List[Dict[str, Any]]]:
+        while True:
+            docs = await self.collection.find(
+                {"searchGrams": {"$exists": False}},
+                {"email": 1, "name": 1}
+            ).limit(batch_size).to_list(length=batch_size)
+            if not docs:
+                return
+            yield docs
+
+    async def set_directory_fields(self, docs: List[Dict[str, Any]]) -> int:
+        operations = [
+            UpdateOne({"_id": doc["_id"]}, {"$set": directory_fields(doc.get("email", ""), doc.get("name", ""))})
+            for doc in docs
+        ]
+        result = await self.collection.bulk_write(operations, ordered=False)
+        return result.modified_count
+
+index_registry.register(
+    "users",
+    indexes=[
+        IndexModel([("email", ASCENDING)]),
+        IndexModel([("searchGrams", ASCENDING)])
+    ],
+    query_shapes=[
+        QueryShape("find_by_email", {"email": "user@example.com", "isDeleted": {"$ne": True}}),
+        QueryShape("search_directory", {"searchGrams": {"$all": ["an", "gm"]}, "isDeleted": {"$ne": True}, "_id": {"$ne": ObjectId()}})
+    ]
+)
@@ -0,0 +1,32 @@
+from typing import Dict, Any
+from src.auth.domain.user import UserAuthFacts
+from src.auth.infrastructure.persistence.mongo_user_repository import MongoUserRepository
+from src.shared.infrastructure.cache.ttl_cache import TTLCache
+from src.shared.config import settings
+from src.shared.infrastructure.container import container
+
+class UserAuthFactsCache:
+    def __init__(self):
+        self.cache = TTLCache(
+            max_entries=settings.user_auth_cache_max_entries,
+            ttl_seconds=settings.user_auth_cache_ttl_seconds
+        )
+
+    @property
+    def user_repository(self) -> MongoUserRepository:
+        return container.get(MongoUserRepository)
+
+    async def get(self, user_id: str) -> UserAuthFacts:
+        facts = self.cache.get(user_id)
+        if facts is None:
+            facts = await self.user_repository.find_auth_facts(user_id)
+            self.cache.set(user_id, facts)
+        return facts
+
+    def invalidate(self, user_id: str) -> None:
+        self.cache.invalidate(user_id)
+
+    def stats(self) -> Dict[str, Any]:
+        return self.cache.stats()
+
+user_auth_facts_cache = UserAuthFactsCache()
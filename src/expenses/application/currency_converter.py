@@ -0,0 +1,91 @@
+import asyncio
+from collections import defaultdict
+from typing import Dict, List, Tuple
+import numpy as np
+import pandas as pd
+from src.expenses.domain.fx_rate import QUOTE_CURRENCY
+from src.expenses.infrastructure.persistence.mongo_fx_rate_repository import MongoFxRateRepository
+from src.shared.infrastructure.cache.ttl_cache import TTLCache
+from src.shared.infrastructure.container import container
+from src.shared.config import settings
+
+class CurrencyConverter:
+    def __init__(self):
+        self.rate_repository = container.get(MongoFxRateRepository)
+        # Memo por (moneda, día): un viaje con miles de gastos usa pocas combinaciones
+        self.rates = TTLCache(
+            max_entries=settings.fx_rate_cache_max_entries,
+            ttl_seconds=settings.fx_rate_cache_ttl_seconds
+        )
+
+    async def to_base(self, amounts: np.ndarray, currencies: np.ndarray, days: np.ndarray, base_currency: str) -> np.ndarray:
+        if len(amounts) == 0:
+            return np.asarray(amounts, dtype=float)
+
+        frame = pd.DataFrame({"currency": currencies, "day": pd.to_datetime(days)})
+        unique_days = frame["day"].drop_duplicates()
+        pairs = pd.concat([
+            frame.drop_duplicates(),
+            pd.DataFrame({"currency": base_currency, "day": unique_days})
+        ]).drop_duplicates()
+
+        rates = await self._lookup(list(pairs.itertuples(index=False, name=None)))
+        lookup = pd.Series(rates)
+        source_rates = lookup.reindex(pd.MultiIndex.from_frame(frame)).to_numpy(dtype=float)
+        base_rates = lookup.reindex(
+            pd.MultiIndex.from_arrays([np.full(len(frame), base_currency, dtype=object), frame["day"]])
+        ).to_numpy(dtype=float)
+
+        # Tasas expresadas en unidades por USD: moneda -> USD -> moneda base
+        return np.asarray(amounts, dtype=float) / source_rates * base_rates
+
+    def invalidate(self) -> None:
+        self.rates.clear()
+
+    def stats(self) -> Dict:
+        return self.rates.stats()
+
+    async def _lookup(self, pairs: List[Tuple[str, pd.Timestamp]]) -> Dict[Tuple[str, pd.Timestamp], float]:
+        found: Dict[Tuple[str, pd.Timestamp], float] = {}
+        missing: Dict[str, List[pd.Timestamp]] = defaultdict(list)
+
+        for currency, day in pairs:
+            if currency == QUOTE_CURRENCY:
+                found[(currency, day)] = 1.0
+                continue
+            rate = self.rates.get((currency, day))
+            if rate is None:
+                missing[currency].append(day)
+            else:
+                found[(currency, day)] = rate
+
+        resolved = await asyncio.gather(*[
+            self._resolve(currency, sorted(days)) for currency, days in missing.items()
+        ])
+        for currency_rates in resolved:
+            for key, rate in currency_rates.items():
+                self.rates.set(key, rate)
+                found[key] = rate
+        return found
+
+    async def _resolve(self, currency: str, days: List[pd.Timestamp]) -> Dict[Tuple[str, pd.Timestamp], float]:
+        window = await self.rate_repository.find_window(
+            currency, days[0].to_pydatetime(), days[-1].to_pydatetime()
+        )
+        if not window:
+            raise ValueError(f"No exchange rate available for {currency}")
+
+        table = pd.DataFrame(window, columns=["day", "rate"])
+        table["day"] = pd.to_datetime(table["day"])
+        wanted = pd.DataFrame({"day": pd.to_datetime(days)})
+
+        # Se usa la última tasa publicada hasta ese día; si no hay, la primera posterior
+        matched = pd.merge_asof(wanted, table, on="day", direction="backward")
+        if matched["rate"].isna().any():
+            forward = pd.merge_asof(wanted, table, on="day", direction="forward")
+            matched["rate"] = matched["rate"].fillna(forward["rate"])
+
+        return {
+            (currency, day): float(rate)
+            for day, rate in zip(days, matched["rate"].to_numpy())
+        }
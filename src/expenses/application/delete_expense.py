@@ -1,27 +1,32 @@
 from src.expenses.infrastructure.persistence.mongo_expense_repository import MongoExpenseRepository
-from src.trips.infrastructure.persistence.mongo_trip_repository import MongoTripRepository
+from src.expenses.application.expense_rollup_service import ExpenseRollupService
+from src.trips.application.trip_access import TripAccess
+from src.shared.infrastructure.container import container
 
 class DeleteExpense:
     def __init__(self):
-        self.expense_repository = MongoExpenseRepository()
-        self.trip_repository = MongoTripRepository()
+        self.expense_repository = container.get(MongoExpenseRepository)
+        self.trip_access = container.get(TripAccess)
+        self.rollup_service = container.get(ExpenseRollupService)
 
     async def execute(self, expense_id: str, user_id: str) -> bool:
         expense = await self.expense_repository.find_by_id(expense_id)
         if not expense:
             raise ValueError("Expense not found")
 
-        trip = await self.trip_repository.find_by_id(expense.trip_id)
+        trip = await self.trip_access.find(expense.trip_id)
         if not trip:
             raise ValueError("Trip not found")
 
-        user_role = None
-        for member in trip.members:
-            if member.user_id == user_id:
-                user_role = member.role
-                break
+        user_role = trip.role_of(user_id)
 
         if user_role not in ["owner", "editor"] and expense.user_id != user_id:
             raise ValueError("User not authorized to delete this expense")
 
-        return await self.expense_repository.delete(expense_id)
\ No newline at end of file
+        async with self.rollup_service.writing(expense.trip_id) as rollup:
+            deleted = await self.expense_repository.delete(expense_id)
+            if deleted:
+                rollup.expense_deleted(expense)
+        if deleted:
+            await self.trip_access.touch(expense.trip_id)
+        return deleted
\ No newline at end of file
@@ -0,0 +1,186 @@
+import asyncio
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import Any, AsyncIterator, Dict, Optional, Tuple
+from src.expenses.domain.expense import Expense
+from src.expenses.infrastructure.persistence.mongo_expense_repository import MongoExpenseRepository
+from src.expenses.infrastructure.persistence.mongo_expense_rollup_repository import (
+    MongoExpenseRollupRepository, BREAKDOWNS, rollup_path, balance_path
+)
+from src.shared.infrastructure.container import container
+
+# Una escritura que no se cerró en este tiempo se da por perdida (proceso caído a mitad de la escritura)
+STALE_WRITE_MINUTES = 10
+
+class RollupWrite:
+    """Cambios de gastos de una escritura en curso; se aplican al rollup al cerrarla."""
+
+    def __init__(self):
+        self.increments: Optional[Dict[str, Any]] = None
+        self.latest: Dict[str, datetime] = {}
+        self.needs_rebuild = False
+        self.announced = False
+
+    def expense_registered(self, expense: Expense) -> None:
+        self._add(*_contribution(expense, 1))
+
+    def expense_updated(self, before: Expense, after: Expense) -> None:
+        removed, _ = _contribution(before, -1)
+        self._add(removed, {})
+        self._add(*_contribution(after, 1))
+
+    def expense_deleted(self, expense: Expense) -> None:
+        increments, _ = _contribution(expense, -1)
+        self._add(increments, {})
+
+    def expenses_imported(self) -> None:
+        self.needs_rebuild = True
+
+    def _add(self, increments: Dict[str, Any], latest: Dict[str, datetime]) -> None:
+        if self.increments is None:
+            self.increments = defaultdict(int)
+        for path, amount in increments.items():
+            self.increments[path] += amount
+        self.latest.update(latest)
+
+class ExpenseRollupService:
+    def __init__(self):
+        self.rollup_repository = container.get(MongoExpenseRollupRepository)
+        self.expense_repository = container.get(MongoExpenseRepository)
+
+    async def get_totals(self, trip_id: str) -> Dict[str, Any]:
+        try:
+            totals = await self.rollup_repository.find_by_trip_id(trip_id)
+            if totals is not None:
+                return totals
+        except Exception as e:
+            self._log_error(f"Rollup lookup failed for trip {trip_id}: {str(e)}")
+
+        return await self.rebuild(trip_id)
+
+    async def rebuild(self, trip_id: str) -> Dict[str, Any]:
+        # La versión se lee antes de calcular: una escritura posterior la cambia y el reemplazo no aplica
+        state = None
+        try:
+            state = await self.rollup_repository.find_state(trip_id)
+        except Exception as e:
+            self._log_error(f"Rollup lookup failed for trip {trip_id}: {str(e)}")
+
+        totals = await self._compute(trip_id)
+        try:
+            await self.rollup_repository.replace(trip_id, totals, state["version"] if state else None)
+        except Exception as e:
+            self._log_error(f"Rollup rebuild failed for trip {trip_id}: {str(e)}")
+        return totals
+
+    @asynccontextmanager
+    async def writing(self, trip_id: str) -> AsyncIterator[RollupWrite]:
+        # Los gastos se escriben dentro de este bloque para que un recálculo concurrente no pierda ni duplique el cambio
+        write = RollupWrite()
+        try:
+            await self.rollup_repository.begin_write(trip_id)
+            write.announced = True
+        except Exception as e:
+            self._log_error(f"Rollup write intent failed for trip {trip_id}: {str(e)}")
+        try:
+            yield write
+        finally:
+            await self._finish(trip_id, write)
+
+    async def reconcile(self) -> Dict[str, int]:
+        results = {"checked": 0, "repaired": 0}
+        stale_before = datetime.utcnow() - timedelta(minutes=STALE_WRITE_MINUTES)
+        async for trip_id, _ in self.rollup_repository.find_versions():
+            results["checked"] += 1
+            try:
+                state = await self.rollup_repository.find_state(trip_id)
+                if state is None:
+                    continue
+                stale = state["pending"] > 0 and (state["pending_since"] or datetime.min) < stale_before
+                if state["pending"] > 0 and not stale:
+                    continue
+                current = await self.rollup_repository.find_by_trip_id(trip_id)
+                fresh = await self._compute(trip_id)
+                if current is not None and not stale and self._matches(current, fresh):
+                    continue
+                if await self.rollup_repository.replace(trip_id, fresh, state["version"], wait_for_writers=not stale):
+                    results["repaired"] += 1
+            except Exception as e:
+                self._log_error(f"Rollup reconciliation failed for trip {trip_id}: {str(e)}")
+        return results
+
+    async def _compute(self, trip_id: str) -> Dict[str, Any]:
+        totals, balances = await asyncio.gather(
+            self.expense_repository.summarize(trip_id),
+            self.expense_repository.net_balances(trip_id)
+        )
+        totals["balances"] = balances
+        return totals
+
+    async def _finish(self, trip_id: str, write: RollupWrite) -> None:
+        try:
+            if write.increments is not None and not write.needs_rebuild:
+                increments = {path: amount for path, amount in write.increments.items() if amount != 0}
+                # El delta cierra la escritura en la misma operación
+                if await self.rollup_repository.apply_delta(trip_id, increments, write.latest, release=write.announced):
+                    return
+            if write.announced:
+                await self.rollup_repository.end_write(trip_id)
+            if write.increments is not None or write.needs_rebuild:
+                await self.rebuild(trip_id)
+        except Exception as e:
+            self._log_error(f"Rollup update failed for trip {trip_id}: {str(e)}")
+
+    def _matches(self, current: Dict[str, Any], fresh: Dict[str, Any]) -> bool:
+        def normalize(totals: Dict[str, Any]) -> Tuple:
+            return (
+                totals["count"],
+                totals["total"],
+                tuple(
+                    sorted((key, bucket["count"], bucket["total"]) for key, bucket in totals[breakdown].items())
+                    for breakdown in BREAKDOWNS
+                ),
+                sorted(
+                    (currency, user_id, amount)
+                    for currency, users in totals.get("balances", {}).items()
+                    for user_id, amount in users.items()
+                    if amount != 0
+                )
+            )
+        return normalize(current) == normalize(fresh)
+
+    def _log_error(self, message: str) -> None:
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        print(f"[{timestamp}] [EXPENSE_ROLLUP] [ERROR] {message}")
+
+def _contribution(expense: Expense, sign: int) -> Tuple[Dict[str, Any], Dict[str, datetime]]:
+    amount = Decimal(str(expense.amount)) * sign
+    expense_date = datetime.combine(expense.date, datetime.min.time())
+    keys = {
+        "by_category": expense.category or "Uncategorized",
+        "by_user": expense.user_id,
+        "by_date": expense.date.strftime("%Y-%m-%d"),
+        "by_currency": expense.currency
+    }
+
+    increments: Dict[str, Any] = defaultdict(int)
+    increments["count"] += sign
+    increments["total"] += amount
+    latest = {}
+    for breakdown in BREAKDOWNS:
+        increments[rollup_path(breakdown, keys[breakdown], "count")] += sign
+        increments[rollup_path(breakdown, keys[breakdown], "total")] += amount
+        latest[rollup_path(breakdown, keys[breakdown], "latest")] = expense_date
+
+    for split in expense.splits:
+        split_amount = Decimal(str(split.amount)) * sign
+        increments[balance_path(expense.currency, expense.user_id)] += split_amount
+        increments[balance_path(expense.currency, split.user_id)] -= split_amount
+    return increments, latest
+
+# Función para ejecutar manualmente (desde FastAPI)
+async def execute_rollup_reconciliation():
+    service = container.get(ExpenseRollupService)
+    return await service.reconcile()
@@ -0,0 +1,141 @@
+from datetime import date
+from decimal import Decimal
+from typing import Any, Callable, Dict, List, Optional
+import numpy as np
+import pandas as pd
+from src.expenses.application.currency_converter import CurrencyConverter
+from src.expenses.application.expense_rollup_service import ExpenseRollupService
+from src.expenses.infrastructure.persistence.mongo_expense_repository import MongoExpenseRepository
+from src.shared.infrastructure.container import container
+from src.shared.domain.money import currency_exponent, quantize_money
+
+FX_BATCH_SIZE = 5000
+
+# Grupo más fino del que salen todos los desgloses
+_GROUP_COLUMNS = ["category", "user_id", "currency", "day"]
+
+_BREAKDOWN_COLUMNS = {
+    "by_category": "category",
+    "by_user": "user_id",
+    "by_date": "day_key",
+    "by_currency": "currency"
+}
+
+class ExpenseTotalsService:
+    """Totales de gastos expresados en la moneda base del viaje."""
+
+    def __init__(self):
+        self.expense_repository = container.get(MongoExpenseRepository)
+        self.rollup_service = container.get(ExpenseRollupService)
+        self.converter = container.get(CurrencyConverter)
+
+    async def get_totals(
+        self,
+        trip_id: str,
+        base_currency: str,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        category: Optional[str] = None
+    ) -> Dict[str, Any]:
+        if start_date or end_date or category:
+            totals = await self.expense_repository.summarize(trip_id, start_date, end_date, category)
+        else:
+            totals = await self.rollup_service.get_totals(trip_id)
+
+        # Caso habitual: todo en la moneda base, los totales ya son correctos
+        if set(totals["by_currency"]) <= {base_currency}:
+            return totals
+
+        return await self._convert(trip_id, base_currency, start_date, end_date, category)
+
+    async def _convert(
+        self,
+        trip_id: str,
+        base_currency: str,
+        start_date: Optional[date],
+        end_date: Optional[date],
+        category: Optional[str]
+    ) -> Dict[str, Any]:
+        partials: List[pd.DataFrame] = []
+        count = 0
+
+        batches = self.expense_repository.iter_documents_by_trip_id(
+            trip_id, FX_BATCH_SIZE,
+            start_date=start_date,
+            end_date=end_date,
+            category=category
+        )
+        async for docs in batches:
+            frame = self._frame(docs)
+            count += len(frame)
+            # Enteros en unidades menores: la suma es exacta y la conversión se hace por grupo, no por gasto
+            partials.append(frame.groupby(_GROUP_COLUMNS).agg(count=("minor", "size"), minor=("minor", "sum")))
+
+        groups = self._combine(partials)
+        base_amounts = await self.converter.to_base(
+            groups["amount"].astype(float).to_numpy(), groups["currency"].to_numpy(), groups["day"].to_numpy(), base_currency
+        )
+        groups["base_amount"] = [Decimal(repr(float(value))) for value in base_amounts]
+
+        def base_money(_: str, total: Decimal) -> Decimal:
+            return quantize_money(total, base_currency, strict=False)
+
+        def original_money(currency: str, total: Decimal) -> Decimal:
+            return quantize_money(total, currency, strict=False)
+
+        result: Dict[str, Any] = {"count": count, "total": base_money(base_currency, sum(groups["base_amount"], Decimal(0)))}
+        for name, column in _BREAKDOWN_COLUMNS.items():
+            # Por moneda se conserva el monto original; el resto va en moneda base
+            if name == "by_currency":
+                result[name] = self._merge(groups, column, "amount", original_money)
+            else:
+                result[name] = self._merge(groups, column, "base_amount", base_money)
+        return result
+
+    def _frame(self, docs: List[Dict[str, Any]]) -> pd.DataFrame:
+        raw = pd.DataFrame(docs, columns=["amount", "currency", "category", "userId", "date"])
+        category = raw["category"].fillna("")
+        amount = pd.to_numeric(raw["amount"].astype(str), errors="coerce").fillna(0.0)
+        currency = raw["currency"].fillna("USD").str.upper()
+        exponents = currency.map({code: currency_exponent(code) for code in currency.unique()})
+        return pd.DataFrame({
+            # Los montos guardados tienen como mucho los decimales de su moneda: el entero es exacto
+            "minor": np.rint(amount.to_numpy() * 10.0 ** exponents.to_numpy()).astype("int64"),
+            "currency": currency,
+            "category": category.where(category != "", "Uncategorized"),
+            "user_id": raw["userId"].astype(str),
+            "day": pd.to_datetime(raw["date"]).dt.normalize()
+        })
+
+    def _combine(self, partials: List[pd.DataFrame]) -> pd.DataFrame:
+        if not partials:
+            groups = pd.DataFrame({column: pd.Series(dtype=object) for column in _GROUP_COLUMNS + ["count", "minor"]})
+            groups["day"] = pd.to_datetime(groups["day"])
+        else:
+            groups = pd.concat(partials).groupby(level=_GROUP_COLUMNS).sum().reset_index()
+        groups["day_key"] = groups["day"].dt.strftime("%Y-%m-%d")
+        groups["amount"] = [
+            Decimal(int(minor)).scaleb(-currency_exponent(currency))
+            for minor, currency in zip(groups["minor"], groups["currency"])
+        ]
+        return groups
+
+    def _merge(
+        self,
+        groups: pd.DataFrame,
+        column: str,
+        amount_column: str,
+        money: Callable[[str, Decimal], Decimal]
+    ) -> Dict[str, Dict[str, Any]]:
+        merged: Dict[str, Dict[str, Any]] = {}
+        for key, count, amount, day in groups[[column, "count", amount_column, "day"]].itertuples(index=False, name=None):
+            row = merged.setdefault(str(key), {"count": 0, "total": Decimal(0), "latest": day})
+            row["count"] += int(count)
+            row["total"] += amount
+            row["latest"] = max(row["latest"], day)
+        # Mismo orden que la agregación: fecha más reciente primero
+        ordered = sorted(sorted(merged.items()), key=lambda item: item[1]["latest"], reverse=True)
+        return {
+            key: {"count": row["count"], "total": money(key, row["total"]), "latest": row["latest"].to_pydatetime()}
+            for key, row in ordered
+        }
@@ -0,0 +1,55 @@
+from datetime import date
+from typing import Any, Dict, List, Optional
+import pandas as pd
+from src.expenses.infrastructure.persistence.mongo_expense_repository import MongoExpenseRepository
+from src.trips.application.trip_access import TripAccess
+from src.shared.infrastructure.services.tabular_export import TabularExport, tabular_export, EXPORT_BATCH_SIZE
+from src.shared.infrastructure.container import container
+
+EXPENSE_COLUMNS = ["_id", "date", "description", "amount", "currency", "category", "userId", "activityId"]
+
+def expenses_frame(docs: List[Dict[str, Any]]) -> pd.DataFrame:
+    # Formateo vectorizado por lote, sin recorrer fila por fila
+    frame = pd.DataFrame(docs, columns=EXPENSE_COLUMNS)
+    return pd.DataFrame({
+        "id": frame["_id"].astype(str),
+        "date": pd.to_datetime(frame["date"]).dt.strftime("%Y-%m-%d").fillna(""),
+        "description": frame["description"].fillna(""),
+        "amount": pd.to_numeric(frame["amount"].astype(str), errors="coerce").fillna(0),
+        "currency": frame["currency"].fillna("USD"),
+        "category": frame["category"].fillna(""),
+        "user_id": frame["userId"].astype(str),
+        "activity_id": frame["activityId"].where(frame["activityId"].notna(), "").astype(str)
+    })
+
+class ExportTripExpenses:
+    def __init__(self):
+        self.expense_repository = container.get(MongoExpenseRepository)
+        self.trip_access = container.get(TripAccess)
+
+    async def execute(
+        self,
+        trip_id: str,
+        user_id: str,
+        export_format: str,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        category: Optional[str] = None,
+        member_id: Optional[str] = None
+    ) -> TabularExport:
+        trip = await self.trip_access.find(trip_id)
+        if not trip:
+            raise ValueError("Trip not found")
+
+        is_member = trip.is_member(user_id)
+        if not is_member:
+            raise ValueError("User is not a trip member")
+
+        batches = self.expense_repository.iter_documents_by_trip_id(
+            trip_id, EXPORT_BATCH_SIZE,
+            start_date=start_date,
+            end_date=end_date,
+            category=category,
+            member_id=member_id
+        )
+        return tabular_export(batches, expenses_frame, export_format, f"trip_{trip_id}_expenses")
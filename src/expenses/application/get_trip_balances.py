@@ -0,0 +1,20 @@
+from typing import Any, Dict
+from src.expenses.application.trip_balances_service import TripBalancesService
+from src.trips.application.trip_access import TripAccess
+from src.shared.infrastructure.container import container
+
+class GetTripBalances:
+    def __init__(self):
+        self.trip_access = container.get(TripAccess)
+        self.balances_service = container.get(TripBalancesService)
+
+    async def execute(self, trip_id: str, user_id: str) -> Dict[str, Any]:
+        trip = await self.trip_access.find(trip_id)
+        if not trip:
+            raise ValueError("Trip not found")
+
+        if not trip.is_member(user_id):
+            raise ValueError("User not authorized to view trip balances")
+
+        snapshot = await self.balances_service.get(trip)
+        return {"trip_id": trip_id, "balances": snapshot["balances"]}
@@ -0,0 +1,24 @@
+from typing import Any, Dict
+from src.expenses.application.trip_balances_service import TripBalancesService
+from src.trips.application.trip_access import TripAccess
+from src.shared.infrastructure.container import container
+
+class GetTripSettlement:
+    def __init__(self):
+        self.trip_access = container.get(TripAccess)
+        self.balances_service = container.get(TripBalancesService)
+
+    async def execute(self, trip_id: str, user_id: str) -> Dict[str, Any]:
+        trip = await self.trip_access.find(trip_id)
+        if not trip:
+            raise ValueError("Trip not found")
+
+        if not trip.is_member(user_id):
+            raise ValueError("User not authorized to view trip settlement")
+
+        snapshot = await self.balances_service.get(trip)
+        return {
+            "trip_id": trip_id,
+            "settlement": snapshot["settlement"],
+            "transfer_count": sum(len(transfers) for transfers in snapshot["settlement"].values())
+        }
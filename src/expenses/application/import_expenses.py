@@ -0,0 +1,206 @@
+import io
+import json
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Dict, List, Optional
+import numpy as np
+import pandas as pd
+from bson import ObjectId
+from src.expenses.infrastructure.persistence.mongo_expense_repository import MongoExpenseRepository
+from src.expenses.application.expense_rollup_service import ExpenseRollupService
+from src.trips.application.trip_access import TripAccess
+from src.shared.domain.money import currency_exponent
+from src.shared.infrastructure.container import container
+from src.shared.config import settings
+
+IMPORT_COLUMNS = ["amount", "description", "date", "currency", "category", "activity_id", "splits"]
+INSERT_BATCH_SIZE = 1000
+
+class ImportExpenses:
+    def __init__(self):
+        self.expense_repository = container.get(MongoExpenseRepository)
+        self.trip_access = container.get(TripAccess)
+        self.rollup_service = container.get(ExpenseRollupService)
+
+    async def execute(self, trip_id: str, user_id: str, payload: bytes, content_type: str) -> Dict[str, Any]:
+        trip = await self.trip_access.find(trip_id)
+        if not trip:
+            raise ValueError("Trip not found")
+
+        if not trip.is_member(user_id):
+            raise ValueError("User is not a trip member")
+
+        frame = _read_rows(payload, content_type)
+        if frame.empty:
+            raise ValueError("No expenses to import")
+        if len(frame) > settings.expense_import_max_rows:
+            raise ValueError(f"Too many rows: the limit is {settings.expense_import_max_rows}")
+
+        columns, errors = _validate(frame)
+        valid = errors.isna().to_numpy()
+        rows = _build_rows(trip_id, user_id, columns, valid)
+        positions = np.flatnonzero(valid)
+
+        failed: Dict[int, str] = {}
+        async with self.rollup_service.writing(trip_id) as rollup:
+            for start in range(0, len(rows), INSERT_BATCH_SIZE):
+                batch_errors = await self.expense_repository.create_many(rows[start:start + INSERT_BATCH_SIZE])
+                for index, message in batch_errors.items():
+                    failed[int(positions[start + index])] = message
+
+            inserted = len(rows) - len(failed)
+            if inserted:
+                # Un solo recálculo del rollup al cerrar la escritura en lugar de un delta por gasto
+                rollup.expenses_imported()
+        if inserted:
+            await self.trip_access.touch(trip_id)
+
+        row_errors = [{"row": int(row), "error": message} for row, message in errors.dropna().items()]
+        row_errors += [{"row": row, "error": message} for row, message in failed.items()]
+        row_errors.sort(key=lambda item: item["row"])
+        return {
+            "received": len(frame),
+            "inserted": inserted,
+            "failed": len(row_errors),
+            "errors": row_errors
+        }
+
+def _read_rows(payload: bytes, content_type: str) -> pd.DataFrame:
+    if "csv" in (content_type or ""):
+        try:
+            frame = pd.read_csv(io.BytesIO(payload), dtype=str, keep_default_na=False)
+        except ValueError:
+            raise ValueError("Invalid CSV payload")
+    else:
+        try:
+            rows = json.loads(payload or b"[]")
+        except ValueError:
+            raise ValueError("Invalid JSON payload")
+        if not isinstance(rows, list) or not all(isinstance(row, dict) for row in rows):
+            raise ValueError("Expected a JSON array of expenses")
+        frame = pd.DataFrame(rows)
+
+    frame.columns = [str(column).strip() for column in frame.columns]
+    # Las filas se numeran desde 0, igual que en el arreglo o el CSV sin encabezado
+    return frame.reindex(columns=IMPORT_COLUMNS).reset_index(drop=True)
+
+def _text(column: pd.Series) -> pd.Series:
+    return column.where(column.notna(), "").astype(str).str.strip()
+
+def _validate(frame: pd.DataFrame):
+    errors = pd.Series(None, index=frame.index, dtype=object)
+
+    def flag(mask, message: str) -> None:
+        # Solo se informa el primer error de cada fila
+        errors[np.asarray(mask, dtype=bool) & errors.isna().to_numpy()] = message
+
+    amount = pd.to_numeric(frame["amount"], errors="coerce")
+    flag(~np.isfinite(amount.to_numpy(dtype=float)), "Invalid amount")
+    flag(amount.to_numpy(dtype=float) <= 0, "Amount must be positive")
+
+    day = pd.to_datetime(_text(frame["date"]), format="%Y-%m-%d", errors="coerce")
+    flag(day.isna(), "Invalid date")
+
+    description = _text(frame["description"])
+    flag(description == "", "Description is required")
+
+    currency = _text(frame["currency"]).str.upper()
+    currency = currency.where(currency != "", "USD")
+    flag(~currency.str.fullmatch("[A-Z]{3}"), "Invalid currency")
+
+    # Los montos se llevan a unidades menores enteras según la moneda
+    exponent = currency.map(currency_exponent).to_numpy()
+    scale = 10.0 ** exponent
+    scaled = amount.to_numpy(dtype=float) * scale
+    minor = np.round(scaled)
+    flag(np.abs(scaled - minor) > 1e-3, "Amount has too many decimals for its currency")
+
+    activity_id = _text(frame["activity_id"])
+    flag((activity_id != "") & ~activity_id.map(ObjectId.is_valid), "Invalid activity_id")
+
+    splits = _splits_frame(frame["splits"])
+    split_scaled = splits["amount"].to_numpy(dtype=float) * scale[splits["row"].to_numpy(dtype=int)]
+    splits["minor"] = np.round(split_scaled)
+    malformed = (
+        splits["user_id"].isna()
+        | ~splits["user_id"].fillna("").map(ObjectId.is_valid)
+        | splits["amount"].isna()
+        | (np.abs(split_scaled - splits["minor"]) > 1e-3)
+    )
+    flag(frame.index.isin(splits.loc[malformed, "row"]), "Invalid splits")
+
+    # Suma exacta en unidades menores, sin depender de la representación binaria
+    split_minor = splits.groupby("row")["minor"].sum()
+    mismatch = split_minor.to_numpy() != minor[split_minor.index.to_numpy(dtype=int)]
+    flag(frame.index.isin(split_minor.index[mismatch]), "Split amounts must equal total expense")
+
+    columns = {
+        "minor": minor,
+        "exponent": exponent,
+        "day": day,
+        "description": description,
+        "currency": currency,
+        "category": _text(frame["category"]),
+        "activity_id": activity_id,
+        "splits": splits
+    }
+    return columns, errors
+
+def _split_items(raw: Any) -> Optional[List[tuple]]:
+    # JSON: [{"user_id": ..., "amount": ...}]; CSV: "user_id:monto;user_id:monto"
+    if raw is None or (isinstance(raw, float) and np.isnan(raw)) or raw == "":
+        return []
+    if isinstance(raw, str):
+        items = []
+        for part in raw.split(";"):
+            user_id, _, amount = part.partition(":")
+            items.append((user_id.strip() or None, amount.strip() or None))
+        return items
+    if isinstance(raw, list) and all(isinstance(item, dict) for item in raw):
+        return [(item.get("user_id"), item.get("amount")) for item in raw]
+    return None
+
+def _splits_frame(column: pd.Series) -> pd.DataFrame:
+    parsed = column.map(_split_items)
+    # Un valor con formato desconocido cuenta como una parte inválida
+    parsed = parsed.where(parsed.notna(), pd.Series([[(None, None)]] * len(parsed), index=parsed.index))
+    exploded = parsed.explode().dropna()
+    if exploded.empty:
+        return pd.DataFrame({"row": pd.Series(dtype=int), "user_id": pd.Series(dtype=object), "amount": pd.Series(dtype=float)})
+
+    pairs = pd.DataFrame(exploded.tolist(), columns=["user_id", "amount"], index=exploded.index)
+    return pd.DataFrame({
+        "row": exploded.index.to_numpy(),
+        "user_id": pairs["user_id"].map(lambda user_id: str(user_id) if user_id is not None else None).to_numpy(),
+        "amount": pd.to_numeric(pairs["amount"], errors="coerce").to_numpy()
+    })
+
+def _build_rows(trip_id: str, user_id: str, columns: Dict[str, Any], valid: np.ndarray) -> List[Dict[str, Any]]:
+    splits = columns["splits"]
+    splits = splits[valid[splits["row"].to_numpy(dtype=int)]] if len(splits) else splits
+    splits_by_row: Dict[int, List[Dict[str, Any]]] = {}
+    for row, split_user_id, minor in splits[["row", "user_id", "minor"]].itertuples(index=False, name=None):
+        splits_by_row.setdefault(int(row), []).append({
+            "user_id": split_user_id,
+            "amount": _from_minor(minor, columns["exponent"][int(row)])
+        })
+
+    days = columns["day"][valid].dt.to_pydatetime()
+    rows = []
+    for row, day in zip(np.flatnonzero(valid), days):
+        rows.append({
+            "trip_id": trip_id,
+            "user_id": user_id,
+            "activity_id": columns["activity_id"].iat[row] or None,
+            "amount": _from_minor(columns["minor"][row], columns["exponent"][row]),
+            "currency": columns["currency"].iat[row],
+            "category": columns["category"].iat[row] or None,
+            "description": columns["description"].iat[row],
+            "date": datetime(day.year, day.month, day.day),
+            "splits": splits_by_row.get(int(row), []),
+            "is_deleted": False
+        })
+    return rows
+
+def _from_minor(minor: float, exponent: int) -> Decimal:
+    return Decimal(int(minor)).scaleb(-int(exponent))
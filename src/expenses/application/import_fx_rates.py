@@ -0,0 +1,31 @@
+from typing import List
+from src.expenses.domain.fx_rate import FxRate
+from src.expenses.application.currency_converter import CurrencyConverter
+from src.expenses.infrastructure.persistence.mongo_fx_rate_repository import MongoFxRateRepository
+from src.trips.infrastructure.persistence.trip_analytics_cache import trip_analytics_cache
+from src.trips.infrastructure.export.trip_export_cache import TripExportCache
+from src.shared.infrastructure.container import container
+
+class ImportFxRates:
+    def __init__(self):
+        self.rate_repository = container.get(MongoFxRateRepository)
+        self.converter = container.get(CurrencyConverter)
+        self.export_cache = container.get(TripExportCache)
+
+    async def execute(self, rates: List[dict]) -> dict:
+        parsed = []
+        for data in rates:
+            currency = (data.get("currency") or "").strip().upper()
+            if len(currency) != 3 or not currency.isalpha():
+                raise ValueError(f"Invalid currency: {data.get('currency')}")
+            if not data.get("rate") or data["rate"] <= 0:
+                raise ValueError(f"Invalid rate for {currency}")
+            parsed.append(FxRate(currency=currency, date=data["date"], rate=data["rate"]))
+
+        written = await self.rate_repository.upsert_many(parsed)
+
+        # Las tasas no cambian la versión de los viajes: se descartan los resultados memorizados
+        self.converter.invalidate()
+        trip_analytics_cache.clear()
+        self.export_cache.invalidate()
+        return {"received": len(parsed), "written": written}
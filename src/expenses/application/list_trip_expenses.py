@@ -1,23 +1,38 @@
-from typing import List
-from src.expenses.domain.expense import Expense
+from datetime import date
+from typing import Optional
+from src.shared.infrastructure.database.pagination import Page, DEFAULT_PAGE_LIMIT
 from src.expenses.infrastructure.persistence.mongo_expense_repository import MongoExpenseRepository
-from src.trips.infrastructure.persistence.mongo_trip_repository import MongoTripRepository
+from src.trips.application.trip_access import TripAccess
+from src.shared.infrastructure.container import container
 
 class ListTripExpenses:
     def __init__(self):
-        self.expense_repository = MongoExpenseRepository()
-        self.trip_repository = MongoTripRepository()
+        self.expense_repository = container.get(MongoExpenseRepository)
+        self.trip_access = container.get(TripAccess)
 
-    async def execute(self, trip_id: str, user_id: str) -> List[Expense]:
-        trip = await self.trip_repository.find_by_id(trip_id)
+    async def execute(
+        self,
+        trip_id: str,
+        user_id: str,
+        limit: int = DEFAULT_PAGE_LIMIT,
+        cursor: Optional[str] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        category: Optional[str] = None,
+        member_id: Optional[str] = None
+    ) -> Page:
+        trip = await self.trip_access.find(trip_id)
         if not trip:
             raise ValueError("Trip not found")
 
-        is_member = any(
-            member.user_id == user_id
-            for member in trip.members
-        )
+        is_member = trip.is_member(user_id)
         if not is_member:
             raise ValueError("User is not a trip member")
 
-        return await self.expense_repository.find_by_trip_id(trip_id)
\ No newline at end of file
+        return await self.expense_repository.find_page_by_trip_id(
+            trip_id, limit, cursor,
+            start_date=start_date,
+            end_date=end_date,
+            category=category,
+            member_id=member_id
+        )
\ No newline at end of file
@@ -3,12 +3,16 @@ from decimal import Decimal
 from typing import List, Dict
 from src.expenses.domain.expense import Expense, Split
 from src.expenses.infrastructure.persistence.mongo_expense_repository import MongoExpenseRepository
-from src.trips.infrastructure.persistence.mongo_trip_repository import MongoTripRepository
+from src.expenses.application.expense_rollup_service import ExpenseRollupService
+from src.trips.application.trip_access import TripAccess
+from src.shared.domain.money import quantize_money
+from src.shared.infrastructure.container import container
 
 class RegisterExpense:
     def __init__(self):
-        self.expense_repository = MongoExpenseRepository()
-        self.trip_repository = MongoTripRepository()
+        self.expense_repository = container.get(MongoExpenseRepository)
+        self.trip_access = container.get(TripAccess)
+        self.rollup_service = container.get(ExpenseRollupService)
 
     async def execute(
         self,
@@ -22,26 +26,26 @@ class RegisterExpense:
         activity_id: str = None,
         splits: List[Dict[str, any]] = None
     ) -> Expense:
-        trip = await self.trip_repository.find_by_id(trip_id)
+        trip = await self.trip_access.find(trip_id)
         if not trip:
             raise ValueError("Trip not found")
 
-        is_member = any(
-            member.user_id == user_id
-            for member in trip.members
-        )
+        is_member = trip.is_member(user_id)
         if not is_member:
             raise ValueError("User is not a trip member")
 
+        amount = quantize_money(amount, currency)
+
         splits_objects = []
         if splits:
-            total_split = sum(Decimal(str(split["amount"])) for split in splits)
+            split_amounts = [quantize_money(split["amount"], currency) for split in splits]
+            total_split = sum(split_amounts)
             if total_split != amount:
                 raise ValueError("Split amounts must equal total expense")
             
             splits_objects = [
-                Split(user_id=split["user_id"], amount=Decimal(str(split["amount"])))
-                for split in splits
+                Split(user_id=split["user_id"], amount=split_amount)
+                for split, split_amount in zip(splits, split_amounts)
             ]
 
         expense = Expense(
@@ -56,4 +60,8 @@ class RegisterExpense:
             splits=splits_objects
         )
 
-        return await self.expense_repository.create(expense)
\ No newline at end of file
+        async with self.rollup_service.writing(trip_id) as rollup:
+            expense = await self.expense_repository.create(expense)
+            rollup.expense_registered(expense)
+        await self.trip_access.touch(trip_id)
+        return expense
\ No newline at end of file
@@ -0,0 +1,39 @@
+from copy import deepcopy
+from typing import Any, Dict
+from src.expenses.application.expense_rollup_service import ExpenseRollupService
+from src.expenses.domain.settlement import settle
+from src.expenses.infrastructure.persistence.trip_balances_cache import trip_balances_cache
+from src.trips.domain.trip import TripAccessView
+from src.shared.infrastructure.container import container
+
+class TripBalancesService:
+    """Saldos netos por moneda y las transferencias mínimas para saldarlos.
+
+    Los saldos se mantienen en el rollup del viaje con cada gasto; aquí solo se
+    leen y se resuelve la liquidación, que queda en caché hasta el siguiente cambio.
+    """
+
+    def __init__(self):
+        self.rollup_service = container.get(ExpenseRollupService)
+
+    async def get(self, access: TripAccessView) -> Dict[str, Any]:
+        cached = trip_balances_cache.get(access.id, access.data_version)
+        if cached is not None:
+            return deepcopy(cached)
+
+        totals = await self.rollup_service.get_totals(access.id)
+
+        # No se convierte entre monedas: cada una se liquida por separado
+        snapshot: Dict[str, Any] = {"balances": {}, "settlement": {}}
+        for currency, users in sorted(totals.get("balances", {}).items()):
+            ordered = sorted(users.items(), key=lambda item: (-item[1], item[0]))
+            snapshot["balances"][currency] = [
+                {"user_id": user_id, "balance": float(amount)} for user_id, amount in ordered
+            ]
+            snapshot["settlement"][currency] = [
+                {"from_user_id": transfer.from_user_id, "to_user_id": transfer.to_user_id, "amount": float(transfer.amount)}
+                for transfer in settle(users)
+            ]
+
+        trip_balances_cache.store(access.id, access.data_version, snapshot)
+        return deepcopy(snapshot)
@@ -3,12 +3,17 @@ from decimal import Decimal
 from typing import Optional, List, Dict
 from src.expenses.domain.expense import Expense, Split
 from src.expenses.infrastructure.persistence.mongo_expense_repository import MongoExpenseRepository
-from src.trips.infrastructure.persistence.mongo_trip_repository import MongoTripRepository
+from src.expenses.application.expense_rollup_service import ExpenseRollupService
+from src.trips.application.trip_access import TripAccess
+from src.shared.domain.money import quantize_money
+from src.shared.infrastructure.database.decimal_fields import to_decimal128
+from src.shared.infrastructure.container import container
 
 class UpdateExpense:
     def __init__(self):
-        self.expense_repository = MongoExpenseRepository()
-        self.trip_repository = MongoTripRepository()
+        self.expense_repository = container.get(MongoExpenseRepository)
+        self.trip_access = container.get(TripAccess)
+        self.rollup_service = container.get(ExpenseRollupService)
 
     async def execute(
         self,
@@ -26,22 +31,23 @@ class UpdateExpense:
         if not expense:
             raise ValueError("Expense not found")
 
-        trip = await self.trip_repository.find_by_id(expense.trip_id)
+        trip = await self.trip_access.find(expense.trip_id)
         if not trip:
             raise ValueError("Trip not found")
 
-        user_role = None
-        for member in trip.members:
-            if member.user_id == user_id:
-                user_role = member.role
-                break
+        user_role = trip.role_of(user_id)
 
         if user_role not in ["owner", "editor"] and expense.user_id != user_id:
             raise ValueError("User not authorized to update this expense")
 
+        target_currency = currency or expense.currency
         update_data = {}
         if amount is not None:
-            update_data["amount"] = float(amount)
+            amount = quantize_money(amount, target_currency)
+            update_data["amount"] = to_decimal128(amount)
+        elif currency is not None:
+            # El monto guardado también tiene que ser válido en la nueva moneda
+            quantize_money(expense.amount, target_currency)
         if description is not None:
             update_data["description"] = description
         if expense_date is not None:
@@ -59,20 +65,28 @@ class UpdateExpense:
             if amount is None:
                 amount = expense.amount
             
-            total_split = sum(Decimal(str(split["amount"])) for split in splits)
+            split_amounts = [quantize_money(split["amount"], target_currency) for split in splits]
+            total_split = sum(split_amounts)
             if total_split != amount:
                 raise ValueError("Split amounts must equal total expense")
             
             splits_data = []
-            for split in splits:
+            for split, split_amount in zip(splits, split_amounts):
                 from bson import ObjectId
                 splits_data.append({
                     "userId": ObjectId(split["user_id"]),
-                    "amount": float(Decimal(str(split["amount"])))
+                    "amount": to_decimal128(split_amount)
                 })
             update_data["splits"] = splits_data
 
-        if update_data:
-            await self.expense_repository.update(expense_id, update_data)
+        if not update_data:
+            return expense
 
-        return await self.expense_repository.find_by_id(expense_id)
\ No newline at end of file
+        async with self.rollup_service.writing(expense.trip_id) as rollup:
+            await self.expense_repository.update(expense_id, update_data)
+            updated = await self.expense_repository.find_by_id(expense_id)
+            if updated:
+                rollup.expense_updated(expense, updated)
+        if updated:
+            await self.trip_access.touch(expense.trip_id)
+        return updated
\ No newline at end of file
@@ -0,0 +1,10 @@
+from datetime import date
+from pydantic import BaseModel
+
+# Las tasas se guardan como unidades de la moneda por 1 USD
+QUOTE_CURRENCY = "USD"
+
+class FxRate(BaseModel):
+    currency: str
+    date: date
+    rate: float
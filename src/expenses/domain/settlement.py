@@ -0,0 +1,35 @@
+import heapq
+from decimal import Decimal
+from typing import Dict, List
+from pydantic import BaseModel
+
+class Transfer(BaseModel):
+    from_user_id: str
+    to_user_id: str
+    amount: Decimal
+
+def settle(balances: Dict[str, Decimal]) -> List[Transfer]:
+    """Transferencias para dejar todos los saldos en cero.
+
+    Greedy con dos montículos: el mayor deudor le paga al mayor acreedor y el
+    remanente vuelve al montículo. Cada paso salda al menos a una persona, así
+    que hay como máximo n - 1 transferencias en O(n log n).
+    """
+    # heapq es de mínimos: se guardan montos negativos para sacar el mayor
+    creditors = [(-amount, user_id) for user_id, amount in balances.items() if amount > 0]
+    debtors = [(amount, user_id) for user_id, amount in balances.items() if amount < 0]
+    heapq.heapify(creditors)
+    heapq.heapify(debtors)
+
+    transfers: List[Transfer] = []
+    while creditors and debtors:
+        credit, creditor = heapq.heappop(creditors)
+        debt, debtor = heapq.heappop(debtors)
+        amount = min(-credit, -debt)
+        transfers.append(Transfer(from_user_id=debtor, to_user_id=creditor, amount=amount))
+
+        if -credit > amount:
+            heapq.heappush(creditors, (credit + amount, creditor))
+        if -debt > amount:
+            heapq.heappush(debtors, (debt + amount, debtor))
+    return transfers
@@ -1,5 +1,6 @@
 from datetime import date
-from fastapi import APIRouter, HTTPException, Query, status, Depends
+from fastapi import APIRouter, HTTPException, Query, Request, Response, status, Depends
+from fastapi.responses import StreamingResponse
 from typing import Any, Dict, List, Optional
 from src.expenses.infrastructure.http.expenses_schemas import RegisterExpenseRequest, UpdateExpenseRequest, ExpenseResponse
 from src.expenses.application.register_expense import RegisterExpense
@@ -7,14 +8,23 @@ from src.expenses.application.list_trip_expenses import ListTripExpenses
 from src.expenses.application.get_expense_summary import GetExpenseSummary
 from src.expenses.application.update_expense import UpdateExpense
 from src.expenses.application.delete_expense import DeleteExpense
+from src.expenses.application.export_trip_expenses import ExportTripExpenses
+from src.expenses.application.import_expenses import ImportExpenses
 from src.shared.infrastructure.security.authentication import get_current_user_id
+from src.auth.application.user_loader import UserLoader
+from src.shared.infrastructure.container import provide
+from src.shared.infrastructure.database.pagination import DEFAULT_PAGE_LIMIT, MAX_PAGE_LIMIT, NEXT_CURSOR_HEADER
 
 router = APIRouter(prefix="/trips/{trip_id}/expenses", tags=["expenses"])
 
 @router.post("/", response_model=ExpenseResponse)
-async def register_expense(trip_id: str, request: RegisterExpenseRequest, user_id: str = Depends(get_current_user_id)):
+async def register_expense(
+    trip_id: str,
+    request: RegisterExpenseRequest,
+    user_id: str = Depends(get_current_user_id),
+    register_expense_uc: RegisterExpense = Depends(provide(RegisterExpense))
+):
     try:
-        register_expense_uc = RegisterExpense()
         splits_data = None
         if request.splits:
             splits_data = [{"user_id": split.user_id, "amount": split.amount} for split in request.splits]
@@ -34,19 +44,57 @@ async def register_expense(trip_id: str, request: RegisterExpenseRequest, user_i
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
+@router.post("/bulk")
+async def import_expenses(
+    trip_id: str,
+    request: Request,
+    user_id: str = Depends(get_current_user_id),
+    import_expenses_uc: ImportExpenses = Depends(provide(ImportExpenses))
+) -> Dict[str, Any]:
+    try:
+        payload = await request.body()
+        return await import_expenses_uc.execute(trip_id, user_id, payload, request.headers.get("content-type", ""))
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
 @router.get("/", response_model=List[ExpenseResponse])
-async def list_trip_expenses(trip_id: str, user_id: str = Depends(get_current_user_id)):
+async def list_trip_expenses(
+    trip_id: str,
+    response: Response,
+    limit: int = Query(DEFAULT_PAGE_LIMIT, ge=1, le=MAX_PAGE_LIMIT),
+    cursor: Optional[str] = Query(None),
+    start_date: Optional[date] = Query(None),
+    end_date: Optional[date] = Query(None),
+    category: Optional[str] = Query(None),
+    member_id: Optional[str] = Query(None),
+    user_id: str = Depends(get_current_user_id),
+    list_expenses: ListTripExpenses = Depends(provide(ListTripExpenses)),
+    user_loader: UserLoader = Depends(provide(UserLoader))
+):
     try:
-        list_expenses = ListTripExpenses()
-        expenses = await list_expenses.execute(trip_id, user_id)
-        return [ExpenseResponse(**expense.dict()) for expense in expenses]
+        page = await list_expenses.execute(
+            trip_id, user_id, limit, cursor,
+            start_date=start_date,
+            end_date=end_date,
+            category=category,
+            member_id=member_id
+        )
+        if page.next_cursor:
+            response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+        payers = await user_loader.load_many(expense.user_id for expense in page.items)
+        return [ExpenseResponse(**expense.dict(), user=payers.get(expense.user_id)) for expense in page.items]
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 @router.put("/{expense_id}", response_model=ExpenseResponse)
-async def update_expense(trip_id: str, expense_id: str, request: UpdateExpenseRequest, user_id: str = Depends(get_current_user_id)):
+async def update_expense(
+    trip_id: str,
+    expense_id: str,
+    request: UpdateExpenseRequest,
+    user_id: str = Depends(get_current_user_id),
+    update_expense_uc: UpdateExpense = Depends(provide(UpdateExpense))
+):
     try:
-        update_expense_uc = UpdateExpense()
         splits_data = None
         if request.splits:
             splits_data = [{"user_id": split.user_id, "amount": split.amount} for split in request.splits]
@@ -67,9 +115,13 @@ async def update_expense(trip_id: str, expense_id: str, request: UpdateExpenseRe
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 @router.delete("/{expense_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_expense(trip_id: str, expense_id: str, user_id: str = Depends(get_current_user_id)):
+async def delete_expense(
+    trip_id: str,
+    expense_id: str,
+    user_id: str = Depends(get_current_user_id),
+    delete_expense_uc: DeleteExpense = Depends(provide(DeleteExpense))
+):
     try:
-        delete_expense_uc = DeleteExpense()
         await delete_expense_uc.execute(expense_id, user_id)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
@@ -80,10 +132,38 @@ async def get_expense_summary(
     start_date: Optional[date] = Query(None),
     end_date: Optional[date] = Query(None),
     category: Optional[str] = Query(None),
-    user_id: str = Depends(get_current_user_id)
+    user_id: str = Depends(get_current_user_id),
+    summary_uc: GetExpenseSummary = Depends(provide(GetExpenseSummary))
 ) -> Dict[str, Any]:
     try:
-        summary_uc = GetExpenseSummary()
         return await summary_uc.execute(trip_id, user_id, start_date, end_date, category)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+@router.get("/export")
+async def export_trip_expenses(
+    trip_id: str,
+    format: str = Query("csv", pattern="^(csv|xlsx|ndjson)$"),
+    start_date: Optional[date] = Query(None),
+    end_date: Optional[date] = Query(None),
+    category: Optional[str] = Query(None),
+    member_id: Optional[str] = Query(None),
+    user_id: str = Depends(get_current_user_id),
+    export_uc: ExportTripExpenses = Depends(provide(ExportTripExpenses))
+):
+    try:
+        export = await export_uc.execute(
+            trip_id, user_id, format,
+            start_date=start_date,
+            end_date=end_date,
+            category=category,
+            member_id=member_id
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    return StreamingResponse(
+        export.chunks,
+        media_type=export.media_type,
+        headers={"Content-Disposition": f"attachment; filename={export.filename}"}
+    )
@@ -2,6 +2,7 @@ from pydantic import BaseModel
 from datetime import date
 from decimal import Decimal
 from typing import Optional, List
+from src.auth.infrastructure.http.auth_schemas import UserSummaryResponse
 
 class SplitRequest(BaseModel):
     user_id: str
@@ -25,6 +26,11 @@ class UpdateExpenseRequest(BaseModel):
    activity_id: Optional[str] = None
    splits: Optional[List[SplitRequest]] = None
 
+class FxRateRequest(BaseModel):
+    currency: str
+    date: date
+    rate: float
+
 class SplitResponse(BaseModel):
     user_id: str
     amount: Decimal
@@ -39,4 +45,5 @@ class ExpenseResponse(BaseModel):
     category: Optional[str] = None
     description: str
     date: date
-    splits: List[SplitResponse] = []
\ No newline at end of file
+    splits: List[SplitResponse] = []
+    user: Optional[UserSummaryResponse] = None
\ No newline at end of file
@@ -1,69 +1,82 @@
-from typing import Optional, List, Dict, Any
-from bson import ObjectId
+from typing import Optional, List, Dict, Any, AsyncIterator
+from datetime import date
+from decimal import Decimal
+from bson import ObjectId, Decimal128
 from datetime import datetime
+from pymongo import IndexModel, ASCENDING, DESCENDING
+from pymongo.errors import BulkWriteError
 from src.shared.infrastructure.database.mongo_client import get_database
-from src.expenses.domain.expense import Expense
+from src.shared.infrastructure.database.index_registry import index_registry, QueryShape
+from src.shared.infrastructure.database.pagination import Page, DEFAULT_PAGE_LIMIT, find_page, iter_batches, date_range_filter, object_id_filter
+from src.shared.infrastructure.database.decimal_fields import to_decimal, decimal_sum, from_decimal128
+from src.shared.infrastructure.database.document_mapper import DocumentMapper, object_id, date_field, decimal_field, nested, value
+from src.expenses.domain.expense import Expense, Split
+
+split_mapper = DocumentMapper(Split, {
+    "user_id": object_id("userId", default=""),
+    "amount": decimal_field(default=0)
+})
+
+def _read_expense(doc: Dict[str, Any]) -> Expense:
+    # Lectura escrita a mano: listados y exportaciones leen miles de gastos por viaje
+    expense_date, amount = doc.get("date"), doc.get("amount", 0)
+    return Expense.model_validate({
+        "id": str(doc["_id"]),
+        "trip_id": str(doc.get("tripId", "")),
+        "user_id": str(doc.get("userId", "")),
+        "activity_id": str(doc["activityId"]) if doc.get("activityId") is not None else None,
+        "amount": amount.to_decimal() if isinstance(amount, Decimal128) else amount,
+        "currency": doc.get("currency", "USD"),
+        "category": doc.get("category"),
+        "description": doc.get("description", ""),
+        "date": expense_date.date() if isinstance(expense_date, datetime) else expense_date,
+        "splits": [
+            {"user_id": str(split.get("userId", "")), "amount": from_decimal128(split.get("amount", 0))}
+            for split in doc.get("splits") or []
+        ],
+        "is_deleted": doc.get("isDeleted", False)
+    })
+
+expense_mapper = DocumentMapper(Expense, {
+    "id": object_id("_id"),
+    "trip_id": object_id("tripId", default=""),
+    "user_id": object_id("userId", default=""),
+    "activity_id": object_id("activityId"),
+    "amount": decimal_field(default=0),
+    "currency": value(default="USD"),
+    "description": value(default=""),
+    "date": date_field(default=None),
+    "splits": nested(split_mapper),
+    "is_deleted": value("isDeleted", default=False)
+}, reader=_read_expense)
 
 class MongoExpenseRepository:
     def __init__(self):
         self.db = get_database()
         self.collection = self.db.expenses
 
-    def _convert_doc_to_expense(self, doc: Dict[str, Any]) -> Dict[str, Any]:
-        """Convert MongoDB document to Expense-compatible dict"""
-        converted = {
-            "id": str(doc["_id"]),
-            "trip_id": str(doc.get("tripId", "")),
-            "user_id": str(doc.get("userId", "")),
-            "activity_id": str(doc.get("activityId")) if doc.get("activityId") else None,
-            "amount": doc.get("amount", 0),
-            "currency": doc.get("currency", "USD"),
-            "category": doc.get("category"),
-            "description": doc.get("description", ""),
-            "date": doc.get("date").date() if doc.get("date") else None,
-            "is_deleted": doc.get("isDeleted", False)
-        }
-        
-        splits_converted = []
-        for split in doc.get("splits", []):
-            split_data = {
-                "user_id": str(split.get("userId", "")),
-                "amount": split.get("amount", 0)
-            }
-            splits_converted.append(split_data)
-        converted["splits"] = splits_converted
-        
-        return converted
-
     async def create(self, expense: Expense) -> Expense:
-        expense_dict = expense.dict(exclude={"id"})
-        expense_dict["tripId"] = ObjectId(expense.trip_id)
-        expense_dict["userId"] = ObjectId(expense.user_id)
-        expense_dict["activityId"] = ObjectId(expense.activity_id) if expense.activity_id else None
-        expense_dict["amount"] = float(expense.amount)
-        expense_dict["date"] = datetime.combine(expense.date, datetime.min.time())
-        
-        for split in expense_dict["splits"]:
-            split["userId"] = ObjectId(split["user_id"])
-            split["amount"] = float(split["amount"])
-            del split["user_id"]
-        
-        if "trip_id" in expense_dict:
-            del expense_dict["trip_id"]
-        if "user_id" in expense_dict:
-            del expense_dict["user_id"]
-        if "activity_id" in expense_dict:
-            del expense_dict["activity_id"]
-        
+        expense_dict = expense_mapper.to_document(expense, exclude=("id",))
         result = await self.collection.insert_one(expense_dict)
         expense.id = str(result.inserted_id)
         return expense
 
+    async def create_many(self, rows: List[Dict[str, Any]]) -> Dict[int, str]:
+        # Filas con los atributos del dominio; devuelve los errores por posición
+        docs = [expense_mapper.to_document(row, exclude=("id",)) for row in rows]
+        try:
+            await self.collection.insert_many(docs, ordered=False)
+            return {}
+        except BulkWriteError as e:
+            return {
+                error["index"]: error.get("errmsg", "Insert failed")
+                for error in e.details.get("writeErrors", [])
+            }
+
     async def find_by_id(self, expense_id: str) -> Optional[Expense]:
         doc: Optional[Dict[str, Any]] = await self.collection.find_one({"_id": ObjectId(expense_id), "isDeleted": {"$ne": True}})
         if doc:
-            converted = self._convert_doc_to_expense(doc)
-            return Expense(**converted)
+            return expense_mapper.to_domain(doc)
         return None
 
     async def find_by_trip_id(self, trip_id: str) -> List[Expense]:
@@ -74,10 +87,149 @@ class MongoExpenseRepository:
         
         expenses = []
         async for doc in cursor:
-            converted = self._convert_doc_to_expense(doc)
-            expenses.append(Expense(**converted))
+            expenses.append(expense_mapper.to_domain(doc))
         return expenses
 
+    async def iter_by_trip_id(self, trip_id: str, batch_size: int = 500) -> AsyncIterator[Expense]:
+        # Orden cronológico y por lotes: no se carga la colección completa en memoria
+        cursor = self.collection.find({
+            "tripId": ObjectId(trip_id),
+            "isDeleted": {"$ne": True}
+        }).sort([("date", 1), ("_id", 1)]).batch_size(batch_size)
+
+        async for doc in cursor:
+            yield expense_mapper.to_domain(doc)
+
+    async def find_page_by_trip_id(
+        self,
+        trip_id: str,
+        limit: int = DEFAULT_PAGE_LIMIT,
+        cursor: Optional[str] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        category: Optional[str] = None,
+        member_id: Optional[str] = None
+    ) -> Page:
+        query = self._trip_query(trip_id, start_date, end_date, category, member_id)
+        return await find_page(self.collection, query, expense_mapper, "date", -1, limit, cursor)
+
+    def iter_documents_by_trip_id(
+        self,
+        trip_id: str,
+        batch_size: int,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        category: Optional[str] = None,
+        member_id: Optional[str] = None
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        # Documentos crudos por lotes para exportaciones tabulares; la consulta se
+        # arma antes de iterar para que un filtro inválido falle de inmediato
+        query = self._trip_query(trip_id, start_date, end_date, category, member_id)
+        cursor = self.collection.find(query, {"splits": 0, "isDeleted": 0}).sort([("date", 1), ("_id", 1)]).batch_size(batch_size)
+        return iter_batches(cursor, batch_size)
+
+    def _trip_query(
+        self,
+        trip_id: str,
+        start_date: Optional[date],
+        end_date: Optional[date],
+        category: Optional[str],
+        member_id: Optional[str]
+    ) -> Dict[str, Any]:
+        query: Dict[str, Any] = {"tripId": ObjectId(trip_id), "isDeleted": {"$ne": True}}
+        date_range = date_range_filter(start_date, end_date)
+        if date_range:
+            query["date"] = date_range
+        if category:
+            query["category"] = category
+        if member_id:
+            query["userId"] = object_id_filter(member_id, "member_id")
+        return query
+
+    async def summarize(
+        self,
+        trip_id: str,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        category: Optional[str] = None
+    ) -> Dict[str, Any]:
+        match: Dict[str, Any] = {"tripId": ObjectId(trip_id), "isDeleted": {"$ne": True}}
+        date_range = date_range_filter(start_date, end_date)
+        if date_range:
+            match["date"] = date_range
+        if category:
+            match["category"] = category
+
+        # Se suma en decimal para obtener los mismos totales que con Decimal en Python
+        amount = decimal_sum("$amount")
+
+        def breakdown(key: Any) -> List[Dict[str, Any]]:
+            # Conserva el orden de aparición que tenía el listado por fecha descendente
+            return [
+                {"$group": {"_id": key, "count": {"$sum": 1}, "total": amount, "latest": {"$max": "$date"}}},
+                {"$sort": {"latest": -1, "_id": 1}}
+            ]
+
+        pipeline = [
+            {"$match": match},
+            {"$facet": {
+                "summary": [{"$group": {"_id": None, "count": {"$sum": 1}, "total": amount}}],
+                "by_category": breakdown({
+                    "$cond": [{"$eq": [{"$ifNull": ["$category", ""]}, ""]}, "Uncategorized", "$category"]
+                }),
+                "by_user": breakdown("$userId"),
+                "by_date": breakdown({"$dateToString": {"format": "%Y-%m-%d", "date": "$date"}}),
+                "by_currency": breakdown({"$ifNull": ["$currency", "USD"]})
+            }}
+        ]
+
+        result = await self.collection.aggregate(pipeline).to_list(length=1)
+        facets = result[0] if result else {}
+
+        def totals(rows: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+            return {
+                str(row["_id"]): {"count": row["count"], "total": to_decimal(row["total"]), "latest": row.get("latest")}
+                for row in rows
+            }
+
+        summary = (facets.get("summary") or [{"count": 0, "total": 0}])[0]
+        return {
+            "count": summary["count"],
+            "total": to_decimal(summary["total"]),
+            "by_category": totals(facets.get("by_category", [])),
+            "by_user": totals(facets.get("by_user", [])),
+            "by_date": totals(facets.get("by_date", [])),
+            "by_currency": totals(facets.get("by_currency", []))
+        }
+
+    async def net_balances(self, trip_id: str) -> Dict[str, Dict[str, Decimal]]:
+        # Quien paga acredita cada parte; cada participante debe la suya
+        pipeline = [
+            {"$match": {"tripId": ObjectId(trip_id), "isDeleted": {"$ne": True}, "splits.0": {"$exists": True}}},
+            {"$unwind": "$splits"},
+            {"$project": {
+                "currency": {"$ifNull": ["$currency", "USD"]},
+                "payer": "$userId",
+                "debtor": "$splits.userId",
+                "amount": "$splits.amount"
+            }},
+            {"$facet": {
+                "paid": [{"$group": {"_id": {"currency": "$currency", "user": "$payer"}, "total": decimal_sum("$amount")}}],
+                "owed": [{"$group": {"_id": {"currency": "$currency", "user": "$debtor"}, "total": decimal_sum("$amount")}}]
+            }}
+        ]
+
+        result = await self.collection.aggregate(pipeline).to_list(length=1)
+        facets = result[0] if result else {}
+
+        balances: Dict[str, Dict[str, Decimal]] = {}
+        for facet, sign in (("paid", 1), ("owed", -1)):
+            for row in facets.get(facet, []):
+                users = balances.setdefault(row["_id"]["currency"], {})
+                user_id = str(row["_id"]["user"])
+                users[user_id] = users.get(user_id, Decimal(0)) + sign * to_decimal(row["total"])
+        return balances
+
     async def find_by_user_id(self, user_id: str) -> List[Expense]:
         cursor = self.collection.find({
             "userId": ObjectId(user_id),
@@ -86,8 +238,7 @@ class MongoExpenseRepository:
         
         expenses = []
         async for doc in cursor:
-            converted = self._convert_doc_to_expense(doc)
-            expenses.append(Expense(**converted))
+            expenses.append(expense_mapper.to_domain(doc))
         return expenses
 
     async def update(self, expense_id: str, update_data: dict) -> bool:
@@ -102,4 +253,23 @@ class MongoExpenseRepository:
             {"_id": ObjectId(expense_id)},
             {"$set": {"isDeleted": True}}
         )
-        return result.modified_count > 0
\ No newline at end of file
+        return result.modified_count > 0
+
+index_registry.register(
+    "expenses",
+    indexes=[
+        IndexModel([("tripId", ASCENDING), ("date", DESCENDING), ("_id", DESCENDING)]),
+        IndexModel([("tripId", ASCENDING), ("category", ASCENDING), ("date", DESCENDING), ("_id", DESCENDING)]),
+        IndexModel([("tripId", ASCENDING), ("userId", ASCENDING), ("date", DESCENDING), ("_id", DESCENDING)]),
+        IndexModel([("userId", ASCENDING), ("date", DESCENDING)])
+    ],
+    query_shapes=[
+        QueryShape("find_by_trip_id", {"tripId": ObjectId(), "isDeleted": {"$ne": True}}, [("date", -1)]),
+        QueryShape("find_page_by_trip_id", {"tripId": ObjectId(), "isDeleted": {"$ne": True}}, [("date", -1), ("_id", -1)]),
+        QueryShape("iter_by_trip_id", {"tripId": ObjectId(), "isDeleted": {"$ne": True}}, [("date", 1), ("_id", 1)]),
+        QueryShape("find_page_by_trip_id_category", {"tripId": ObjectId(), "category": "food", "isDeleted": {"$ne": True}}, [("date", -1), ("_id", -1)]),
+        QueryShape("find_page_by_trip_id_member", {"tripId": ObjectId(), "userId": ObjectId(), "isDeleted": {"$ne": True}}, [("date", -1), ("_id", -1)]),
+        QueryShape("summarize_date_range", {"tripId": ObjectId(), "isDeleted": {"$ne": True}, "date": {"$gte": datetime(2025, 1, 1), "$lt": datetime(2025, 2, 1)}}),
+        QueryShape("find_by_user_id", {"userId": ObjectId(), "isDeleted": {"$ne": True}}, [("date", -1)])
+    ]
+)
@@ -0,0 +1,165 @@
+from typing import Any, Dict, Optional
+from datetime import datetime
+from decimal import Decimal
+from bson import ObjectId
+from pymongo.errors import DuplicateKeyError
+from src.shared.infrastructure.database.mongo_client import get_database
+from src.shared.infrastructure.database.decimal_fields import to_decimal, to_decimal128
+
+BREAKDOWNS = ("by_category", "by_user", "by_date", "by_currency")
+
+_FIELDS = {
+    "by_category": "byCategory",
+    "by_user": "byUser",
+    "by_date": "byDay",
+    "by_currency": "byCurrency"
+}
+
+def encode_key(key: str) -> str:
+    # Las claves vienen del usuario: "." y "$" no pueden ir en rutas de Mongo
+    return key.replace("%", "%25").replace(".", "%2E").replace("$", "%24")
+
+def decode_key(key: str) -> str:
+    return key.replace("%24", "$").replace("%2E", ".").replace("%25", "%")
+
+class MongoExpenseRollupRepository:
+    def __init__(self):
+        self.db = get_database()
+        self.collection = self.db.tripExpenseRollups
+
+    async def begin_write(self, trip_id: str) -> None:
+        # Se anuncia la escritura antes de tocar los gastos: sube la versión y marca un escritor pendiente.
+        # Si el rollup no existe queda un documento sin saldos que impide insertar uno calculado antes
+        await self.collection.update_one(
+            {"_id": ObjectId(trip_id)},
+            {"$inc": {"version": 1, "pending": 1}, "$set": {"pendingSince": datetime.utcnow()}},
+            upsert=True
+        )
+
+    async def end_write(self, trip_id: str) -> None:
+        await self.collection.update_one({"_id": ObjectId(trip_id)}, {"$inc": {"version": 1, "pending": -1}})
+
+    async def apply_delta(
+        self,
+        trip_id: str,
+        increments: Dict[str, Decimal],
+        latest: Dict[str, datetime],
+        release: bool = False
+    ) -> bool:
+        # Sin upsert: un rollup inexistente se reconstruye desde los gastos
+        update: Dict[str, Any] = {
+            "$inc": {
+                path: to_decimal128(amount) if isinstance(amount, Decimal) else amount
+                for path, amount in increments.items()
+            },
+            "$set": {"updatedAt": datetime.utcnow()}
+        }
+        update["$inc"]["version"] = 1
+        if release:
+            update["$inc"]["pending"] = -1
+        if latest:
+            update["$max"] = latest
+
+        # Un rollup anterior a los saldos no se actualiza: se reconstruye completo
+        result = await self.collection.update_one({"_id": ObjectId(trip_id), "balances": {"$exists": True}}, update)
+        return result.matched_count > 0
+
+    async def find_by_trip_id(self, trip_id: str) -> Optional[Dict[str, Any]]:
+        doc = await self.collection.find_one({"_id": ObjectId(trip_id)})
+        if not doc or "balances" not in doc:
+            return None
+        return self._to_totals(doc)
+
+    async def find_state(self, trip_id: str) -> Optional[Dict[str, Any]]:
+        doc = await self.collection.find_one({"_id": ObjectId(trip_id)}, {"version": 1, "pending": 1, "pendingSince": 1})
+        if not doc:
+            return None
+        return {
+            "version": doc.get("version", 0),
+            "pending": doc.get("pending", 0),
+            "pending_since": doc.get("pendingSince")
+        }
+
+    async def replace(
+        self,
+        trip_id: str,
+        totals: Dict[str, Any],
+        expected_version: Optional[int],
+        wait_for_writers: bool = True
+    ) -> bool:
+        doc = self._to_document(totals)
+        doc["version"] = (expected_version or 0) + 1
+        doc["pending"] = 0
+        doc["updatedAt"] = datetime.utcnow()
+
+        if expected_version is None:
+            # Solo se inserta si nadie creó el rollup mientras se calculaba
+            try:
+                await self.collection.insert_one({"_id": ObjectId(trip_id), **doc})
+                return True
+            except DuplicateKeyError:
+                return False
+
+        # Si llegó un delta o hay una escritura en curso, el cálculo ya no vale y se deja para la siguiente pasada
+        query: Dict[str, Any] = {"_id": ObjectId(trip_id), "version": expected_version}
+        if wait_for_writers:
+            query["pending"] = {"$not": {"$gt": 0}}
+        result = await self.collection.replace_one(query, doc)
+        return result.matched_count > 0
+
+    async def find_versions(self):
+        async for doc in self.collection.find({}, {"version": 1}):
+            yield str(doc["_id"]), doc.get("version", 0)
+
+    def _to_document(self, totals: Dict[str, Any]) -> Dict[str, Any]:
+        doc: Dict[str, Any] = {
+            "count": totals["count"],
+            "total": to_decimal128(totals["total"])
+        }
+        for name, field in _FIELDS.items():
+            doc[field] = {
+                encode_key(key): {
+                    "count": bucket["count"],
+                    "total": to_decimal128(bucket["total"]),
+                    "latest": bucket.get("latest")
+                }
+                for key, bucket in totals[name].items()
+            }
+        doc["balances"] = {
+            encode_key(currency): {user_id: to_decimal128(amount) for user_id, amount in users.items()}
+            for currency, users in totals.get("balances", {}).items()
+        }
+        return doc
+
+    def _to_totals(self, doc: Dict[str, Any]) -> Dict[str, Any]:
+        totals: Dict[str, Any] = {
+            "count": doc.get("count", 0),
+            "total": to_decimal(doc.get("total")),
+            "version": doc.get("version", 0)
+        }
+        for name, field in _FIELDS.items():
+            buckets = [
+                (decode_key(key), bucket)
+                for key, bucket in (doc.get(field) or {}).items()
+                if bucket.get("count", 0) > 0
+            ]
+            # Mismo orden que el resumen calculado: fecha más reciente primero
+            buckets.sort(key=lambda item: item[0])
+            buckets.sort(key=lambda item: item[1].get("latest") or datetime.min, reverse=True)
+            totals[name] = {
+                key: {"count": bucket["count"], "total": to_decimal(bucket.get("total")), "latest": bucket.get("latest")}
+                for key, bucket in buckets
+            }
+        totals["balances"] = {}
+        for currency, users in (doc.get("balances") or {}).items():
+            # Un saldo en cero es de alguien que ya no debe ni le deben
+            nonzero = {user_id: to_decimal(raw) for user_id, raw in users.items() if to_decimal(raw) != 0}
+            if nonzero:
+                totals["balances"][decode_key(currency)] = nonzero
+        return totals
+
+def rollup_path(breakdown: str, key: str, leaf: str) -> str:
+    return f"{_FIELDS[breakdown]}.{encode_key(key)}.{leaf}"
+
+def balance_path(currency: str, user_id: str) -> str:
+    return f"balances.{encode_key(currency)}.{user_id}"
@@ -0,0 +1,49 @@
+from typing import List, Tuple
+from datetime import datetime
+from pymongo import IndexModel, UpdateOne, ASCENDING
+from src.shared.infrastructure.database.mongo_client import get_database
+from src.shared.infrastructure.database.index_registry import index_registry, QueryShape
+from src.expenses.domain.fx_rate import FxRate
+
+class MongoFxRateRepository:
+    def __init__(self):
+        self.db = get_database()
+        self.collection = self.db.fxRates
+
+    async def upsert_many(self, rates: List[FxRate]) -> int:
+        if not rates:
+            return 0
+        operations = [
+            UpdateOne(
+                {"currency": rate.currency, "date": datetime.combine(rate.date, datetime.min.time())},
+                {"$set": {"rate": rate.rate, "updatedAt": datetime.utcnow()}},
+                upsert=True
+            )
+            for rate in rates
+        ]
+        result = await self.collection.bulk_write(operations, ordered=False)
+        return result.upserted_count + result.modified_count
+
+    async def find_window(self, currency: str, start: datetime, end: datetime) -> List[Tuple[datetime, float]]:
+        # Además del rango se trae la tasa vigente antes del inicio y la primera después del fin
+        projection = {"_id": 0, "date": 1, "rate": 1}
+        inside = await self.collection.find(
+            {"currency": currency, "date": {"$gte": start, "$lte": end}}, projection
+        ).sort("date", 1).to_list(length=None)
+        before = await self.collection.find(
+            {"currency": currency, "date": {"$lt": start}}, projection
+        ).sort("date", -1).limit(1).to_list(length=1)
+        after = await self.collection.find(
+            {"currency": currency, "date": {"$gt": end}}, projection
+        ).sort("date", 1).limit(1).to_list(length=1)
+        return [(doc["date"], doc["rate"]) for doc in before + inside + after]
+
+index_registry.register(
+    "fxRates",
+    indexes=[
+        IndexModel([("currency", ASCENDING), ("date", ASCENDING)], unique=True)
+    ],
+    query_shapes=[
+        QueryShape("find_window", {"currency": "EUR", "date": {"$gte": datetime(2025, 1, 1), "$lte": datetime(2025, 2, 1)}}, [("date", 1)])
+    ]
+)
@@ -0,0 +1,22 @@
+from typing import Optional, Dict, Any
+from src.shared.infrastructure.cache.ttl_cache import TTLCache
+from src.shared.config import settings
+
+class TripBalancesCache:
+    def __init__(self):
+        self.cache = TTLCache(
+            max_entries=settings.trip_balances_cache_max_entries,
+            ttl_seconds=settings.trip_balances_cache_ttl_seconds
+        )
+
+    def get(self, trip_id: str, data_version: int) -> Optional[Dict[str, Any]]:
+        # Cada gasto registrado, editado o borrado incrementa la versión del viaje
+        return self.cache.get((trip_id, data_version))
+
+    def store(self, trip_id: str, data_version: int, balances: Dict[str, Any]) -> None:
+        self.cache.set((trip_id, data_version), balances)
+
+    def stats(self) -> Dict[str, Any]:
+        return self.cache.stats()
+
+trip_balances_cache = TripBalancesCache()
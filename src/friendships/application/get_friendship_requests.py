@@ -1,10 +1,11 @@
 from typing import List, Dict
 from src.friendships.domain.friendship_invitation import FriendshipInvitation
 from src.friendships.infrastructure.persistence.mongo_friendship_repository import MongoFriendshipRepository
+from src.shared.infrastructure.container import container
 
 class GetFriendshipRequests:
     def __init__(self):
-        self.friendship_repository = MongoFriendshipRepository()
+        self.friendship_repository = container.get(MongoFriendshipRepository)
 
     async def execute(self, user_id: str) -> Dict[str, List[FriendshipInvitation]]:
         received_invitations = await self.friendship_repository.find_received_invitations(user_id)
@@ -1,20 +1,18 @@
 from typing import List
+from bson import ObjectId
 from src.auth.domain.user import User
 from src.auth.infrastructure.persistence.mongo_user_repository import MongoUserRepository
+from src.shared.infrastructure.container import container
 
 class ListFriends:
     def __init__(self):
-        self.user_repository = MongoUserRepository()
+        self.user_repository = container.get(MongoUserRepository)
 
     async def execute(self, user_id: str) -> List[User]:
         user = await self.user_repository.find_by_id(user_id)
         if not user:
             raise ValueError("User not found")
 
-        friends = []
-        for friend in user.friends:
-            friend_user = await self.user_repository.find_by_id(friend.user_id)
-            if friend_user:
-                friends.append(friend_user)
-
-        return friends
\ No newline at end of file
+        # Una sola consulta para todos los amigos, en el orden en que se agregaron
+        friend_ids = [friend.user_id for friend in user.friends if ObjectId.is_valid(friend.user_id)]
+        return await self.user_repository.find_by_ids(friend_ids)
\ No newline at end of file
@@ -1,8 +1,9 @@
 from src.auth.infrastructure.persistence.mongo_user_repository import MongoUserRepository
+from src.shared.infrastructure.container import container
 
 class RemoveFriend:
     def __init__(self):
-        self.user_repository = MongoUserRepository()
+        self.user_repository = container.get(MongoUserRepository)
 
     async def execute(self, user_id: str, friend_id: str) -> bool:
         user = await self.user_repository.find_by_id(user_id)
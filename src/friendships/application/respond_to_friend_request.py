@@ -1,11 +1,12 @@
 from datetime import datetime
 from src.friendships.infrastructure.persistence.mongo_friendship_repository import MongoFriendshipRepository
 from src.auth.infrastructure.persistence.mongo_user_repository import MongoUserRepository
+from src.shared.infrastructure.container import container
 
 class RespondToFriendRequest:
     def __init__(self):
-        self.friendship_repository = MongoFriendshipRepository()
-        self.user_repository = MongoUserRepository()
+        self.friendship_repository = container.get(MongoFriendshipRepository)
+        self.user_repository = container.get(MongoUserRepository)
 
     async def execute(
         self,
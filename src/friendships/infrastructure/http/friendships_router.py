@@ -8,13 +8,18 @@ from src.friendships.application.list_friends import ListFriends
 from src.friendships.application.remove_friend import RemoveFriend
 from src.auth.infrastructure.http.auth_schemas import UserResponse
 from src.shared.infrastructure.security.authentication import get_current_user_id
+from src.auth.application.user_loader import UserLoader
+from src.shared.infrastructure.container import provide
 
 router = APIRouter(prefix="/friendships", tags=["friendships"])
 
 @router.post("/requests", response_model=FriendshipInvitationResponse)
-async def send_friend_request(request: SendFriendRequestRequest, user_id: str = Depends(get_current_user_id)):
+async def send_friend_request(
+    request: SendFriendRequestRequest,
+    user_id: str = Depends(get_current_user_id),
+    send_request_uc: SendFriendRequest = Depends(provide(SendFriendRequest))
+):
     try:
-        send_request_uc = SendFriendRequest()
         invitation = await send_request_uc.execute(
             sender_id=user_id,
             recipient_id=request.recipient_id,
@@ -25,22 +30,36 @@ async def send_friend_request(request: SendFriendRequestRequest, user_id: str =
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 @router.get("/requests")
-async def get_friendship_requests(user_id: str = Depends(get_current_user_id)) -> Dict[str, List[FriendshipInvitationResponse]]:
+async def get_friendship_requests(
+    user_id: str = Depends(get_current_user_id),
+    requests_uc: GetFriendshipRequests = Depends(provide(GetFriendshipRequests)),
+    user_loader: UserLoader = Depends(provide(UserLoader))
+) -> Dict[str, List[FriendshipInvitationResponse]]:
     try:
-        requests_uc = GetFriendshipRequests()
         requests = await requests_uc.execute(user_id)
-        
+        invitations = requests["received"] + requests["sent"]
+        users = await user_loader.load_many(
+            [inv.sender_id for inv in invitations] + [inv.recipient_id for inv in invitations]
+        )
+
+        def invitation_response(inv) -> FriendshipInvitationResponse:
+            return FriendshipInvitationResponse(**inv.dict(), sender=users.get(inv.sender_id), recipient=users.get(inv.recipient_id))
+
         return {
-            "received": [FriendshipInvitationResponse(**inv.dict()) for inv in requests["received"]],
-            "sent": [FriendshipInvitationResponse(**inv.dict()) for inv in requests["sent"]]
+            "received": [invitation_response(inv) for inv in requests["received"]],
+            "sent": [invitation_response(inv) for inv in requests["sent"]]
         }
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 @router.post("/requests/{invitation_id}/respond", status_code=status.HTTP_200_OK)
-async def respond_to_friend_request(invitation_id: str, request: RespondFriendRequestRequest, user_id: str = Depends(get_current_user_id)):
+async def respond_to_friend_request(
+    invitation_id: str,
+    request: RespondFriendRequestRequest,
+    user_id: str = Depends(get_current_user_id),
+    respond_uc: RespondToFriendRequest = Depends(provide(RespondToFriendRequest))
+):
     try:
-        respond_uc = RespondToFriendRequest()
         await respond_uc.execute(
             invitation_id=invitation_id,
             user_id=user_id,
@@ -51,18 +70,23 @@ async def respond_to_friend_request(invitation_id: str, request: RespondFriendRe
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 @router.get("/", response_model=List[UserResponse])
-async def list_friends(user_id: str = Depends(get_current_user_id)):
+async def list_friends(
+    user_id: str = Depends(get_current_user_id),
+    list_friends_uc: ListFriends = Depends(provide(ListFriends))
+):
     try:
-        list_friends_uc = ListFriends()
         friends = await list_friends_uc.execute(user_id)
         return [UserResponse(**friend.dict()) for friend in friends]
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 @router.delete("/{friend_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def remove_friend(friend_id: str, user_id: str = Depends(get_current_user_id)):
+async def remove_friend(
+    friend_id: str,
+    user_id: str = Depends(get_current_user_id),
+    remove_friend_uc: RemoveFriend = Depends(provide(RemoveFriend))
+):
     try:
-        remove_friend_uc = RemoveFriend()
         await remove_friend_uc.execute(user_id, friend_id)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
\ No newline at end of file
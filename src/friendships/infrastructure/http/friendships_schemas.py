@@ -1,6 +1,7 @@
 from pydantic import BaseModel
 from datetime import datetime
 from typing import Optional
+from src.auth.infrastructure.http.auth_schemas import UserSummaryResponse
 
 class SendFriendRequestRequest(BaseModel):
     recipient_id: str
@@ -16,4 +17,6 @@ class FriendshipInvitationResponse(BaseModel):
     status: str
     message: Optional[str] = None
     sent_at: datetime
-    responded_at: Optional[datetime] = None
\ No newline at end of file
+    responded_at: Optional[datetime] = None
+    sender: Optional[UserSummaryResponse] = None
+    recipient: Optional[UserSummaryResponse] = None
\ No newline at end of file
@@ -1,43 +1,29 @@
 from typing import Optional, List, Dict, Any
 from bson import ObjectId
 from datetime import datetime
+from pymongo import IndexModel, ASCENDING, DESCENDING
 from src.shared.infrastructure.database.mongo_client import get_database
+from src.shared.infrastructure.database.index_registry import index_registry, QueryShape
+from src.shared.infrastructure.database.document_mapper import DocumentMapper, object_id, value
 from src.friendships.domain.friendship_invitation import FriendshipInvitation
 
+friendship_invitation_mapper = DocumentMapper(FriendshipInvitation, {
+    "id": object_id("_id"),
+    "sender_id": object_id("senderId", default=""),
+    "recipient_id": object_id("recipientId", default=""),
+    "status": value(default="pending"),
+    "message": value(default=None),
+    "sent_at": value("sentAt", default=datetime.utcnow),
+    "responded_at": value("respondedAt", default=None)
+})
+
 class MongoFriendshipRepository:
     def __init__(self):
         self.db = get_database()
         self.collection = self.db.friendshipInvitations
 
-    def _convert_doc_to_friendship_invitation(self, doc: Dict[str, Any]) -> Dict[str, Any]:
-        """Convert MongoDB document to FriendshipInvitation-compatible dict"""
-        converted = {
-            "id": str(doc["_id"]),
-            "sender_id": str(doc.get("senderId", "")),
-            "recipient_id": str(doc.get("recipientId", "")),
-            "status": doc.get("status", "pending"),
-            "message": doc.get("message"),
-            "sent_at": doc.get("sentAt", datetime.utcnow()),
-            "responded_at": doc.get("respondedAt")
-        }
-        return converted
-
     async def create(self, invitation: FriendshipInvitation) -> FriendshipInvitation:
-        invitation_dict = invitation.dict(exclude={"id"})
-        invitation_dict["senderId"] = ObjectId(invitation.sender_id)
-        invitation_dict["recipientId"] = ObjectId(invitation.recipient_id)
-        invitation_dict["sentAt"] = invitation.sent_at
-        invitation_dict["respondedAt"] = invitation.responded_at
-        
-        if "sender_id" in invitation_dict:
-            del invitation_dict["sender_id"]
-        if "recipient_id" in invitation_dict:
-            del invitation_dict["recipient_id"]
-        if "sent_at" in invitation_dict:
-            del invitation_dict["sent_at"]
-        if "responded_at" in invitation_dict:
-            del invitation_dict["responded_at"]
-        
+        invitation_dict = friendship_invitation_mapper.to_document(invitation, exclude=("id",))
         result = await self.collection.insert_one(invitation_dict)
         invitation.id = str(result.inserted_id)
         return invitation
@@ -45,8 +31,7 @@ class MongoFriendshipRepository:
     async def find_by_id(self, invitation_id: str) -> Optional[FriendshipInvitation]:
         doc: Optional[Dict[str, Any]] = await self.collection.find_one({"_id": ObjectId(invitation_id)})
         if doc:
-            converted = self._convert_doc_to_friendship_invitation(doc)
-            return FriendshipInvitation(**converted)
+            return friendship_invitation_mapper.to_domain(doc)
         return None
 
     async def find_existing_invitation(self, sender_id: str, recipient_id: str) -> Optional[FriendshipInvitation]:
@@ -58,8 +43,7 @@ class MongoFriendshipRepository:
             "status": {"$in": ["pending", "accepted"]}
         })
         if doc:
-            converted = self._convert_doc_to_friendship_invitation(doc)
-            return FriendshipInvitation(**converted)
+            return friendship_invitation_mapper.to_domain(doc)
         return None
 
     async def find_received_invitations(self, user_id: str) -> List[FriendshipInvitation]:
@@ -70,8 +54,7 @@ class MongoFriendshipRepository:
         
         invitations = []
         async for doc in cursor:
-            converted = self._convert_doc_to_friendship_invitation(doc)
-            invitations.append(FriendshipInvitation(**converted))
+            invitations.append(friendship_invitation_mapper.to_domain(doc))
         return invitations
 
     async def find_sent_invitations(self, user_id: str) -> List[FriendshipInvitation]:
@@ -82,8 +65,7 @@ class MongoFriendshipRepository:
         
         invitations = []
         async for doc in cursor:
-            converted = self._convert_doc_to_friendship_invitation(doc)
-            invitations.append(FriendshipInvitation(**converted))
+            invitations.append(friendship_invitation_mapper.to_domain(doc))
         return invitations
 
     async def update_status(self, invitation_id: str, status: str) -> bool:
@@ -91,4 +73,24 @@ class MongoFriendshipRepository:
             {"_id": ObjectId(invitation_id)},
             {"$set": {"status": status, "respondedAt": datetime.utcnow()}}
         )
-        return result.modified_count > 0
\ No newline at end of file
+        return result.modified_count > 0
+
+index_registry.register(
+    "friendshipInvitations",
+    indexes=[
+        IndexModel([("senderId", ASCENDING), ("recipientId", ASCENDING), ("status", ASCENDING)]),
+        IndexModel([("recipientId", ASCENDING), ("status", ASCENDING), ("sentAt", DESCENDING)]),
+        IndexModel([("senderId", ASCENDING), ("status", ASCENDING), ("sentAt", DESCENDING)])
+    ],
+    query_shapes=[
+        QueryShape("find_existing_invitation", {
+            "$or": [
+                {"senderId": ObjectId(), "recipientId": ObjectId()},
+                {"senderId": ObjectId(), "recipientId": ObjectId()}
+            ],
+            "status": {"$in": ["pending", "accepted"]}
+        }),
+        QueryShape("find_received_invitations", {"recipientId": ObjectId(), "status": "pending"}, [("sentAt", -1)]),
+        QueryShape("find_sent_invitations", {"senderId": ObjectId(), "status": "pending"}, [("sentAt", -1)])
+    ]
+)
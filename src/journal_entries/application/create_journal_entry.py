@@ -1,12 +1,13 @@
 from typing import Dict, List, Any
 from src.journal_entries.domain.journal_entry import JournalEntry, Recommendation
 from src.journal_entries.infrastructure.persistence.mongo_journal_entry_repository import MongoJournalEntryRepository
-from src.trips.infrastructure.persistence.mongo_trip_repository import MongoTripRepository
+from src.trips.application.trip_access import TripAccess
+from src.shared.infrastructure.container import container
 
 class CreateJournalEntry:
     def __init__(self):
-        self.journal_repository = MongoJournalEntryRepository()
-        self.trip_repository = MongoTripRepository()
+        self.journal_repository = container.get(MongoJournalEntryRepository)
+        self.trip_access = container.get(TripAccess)
 
     async def execute(
         self,
@@ -17,18 +18,15 @@ class CreateJournalEntry:
         emotions: Dict[str, Any] = None,
         recommendations: List[Dict[str, str]] = None
     ) -> JournalEntry:
-        trip = await self.trip_repository.find_by_id(trip_id)
+        trip = await self.trip_access.find(trip_id)
         if not trip:
             raise ValueError("Trip not found")
 
-        is_member = any(
-            member.user_id == user_id
-            for member in trip.members
-        )
+        is_member = trip.is_member(user_id)
         if not is_member:
             raise ValueError("User is not a trip member")
 
-        day_exists = any(day.id == day_id for day in trip.days)
+        day_exists = await self.trip_access.has_day(trip_id, day_id)
         if not day_exists:
             raise ValueError("Day not found in trip")
 
@@ -48,4 +46,6 @@ class CreateJournalEntry:
             recommendations=recommendations_objects
         )
 
-        return await self.journal_repository.create(entry)
\ No newline at end of file
+        entry = await self.journal_repository.create(entry)
+        await self.trip_access.touch(trip_id)
+        return entry
\ No newline at end of file
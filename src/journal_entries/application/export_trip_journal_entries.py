@@ -0,0 +1,58 @@
+import json
+from datetime import date
+from typing import Any, Dict, List, Optional
+import pandas as pd
+from src.journal_entries.infrastructure.persistence.mongo_journal_entry_repository import MongoJournalEntryRepository
+from src.trips.application.trip_access import TripAccess
+from src.shared.infrastructure.services.tabular_export import TabularExport, tabular_export, EXPORT_BATCH_SIZE
+from src.shared.infrastructure.container import container
+
+JOURNAL_COLUMNS = ["_id", "createdAt", "modifiedAt", "dayId", "userId", "content", "emotions", "recommendations"]
+
+def journal_entries_frame(docs: List[Dict[str, Any]]) -> pd.DataFrame:
+    frame = pd.DataFrame(docs, columns=JOURNAL_COLUMNS)
+    return pd.DataFrame({
+        "id": frame["_id"].astype(str),
+        "created_at": pd.to_datetime(frame["createdAt"]).dt.strftime("%Y-%m-%dT%H:%M:%S").fillna(""),
+        "modified_at": pd.to_datetime(frame["modifiedAt"]).dt.strftime("%Y-%m-%dT%H:%M:%S").fillna(""),
+        "day_id": frame["dayId"].fillna("").astype(str),
+        "user_id": frame["userId"].fillna("").astype(str),
+        "content": frame["content"].fillna(""),
+        # Los campos anidados se exportan como JSON en una sola celda; un campo ausente llega como NaN
+        "emotions": frame["emotions"].map(lambda raw: json.dumps(raw if isinstance(raw, dict) else {}, ensure_ascii=False)),
+        "recommendations": frame["recommendations"].map(
+            lambda raw: json.dumps(raw if isinstance(raw, list) else [], ensure_ascii=False)
+        )
+    })
+
+class ExportTripJournalEntries:
+    def __init__(self):
+        self.journal_repository = container.get(MongoJournalEntryRepository)
+        self.trip_access = container.get(TripAccess)
+
+    async def execute(
+        self,
+        trip_id: str,
+        user_id: str,
+        export_format: str,
+        day_id: Optional[str] = None,
+        member_id: Optional[str] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None
+    ) -> TabularExport:
+        trip = await self.trip_access.find(trip_id)
+        if not trip:
+            raise ValueError("Trip not found")
+
+        is_member = trip.is_member(user_id)
+        if not is_member:
+            raise ValueError("User is not a trip member")
+
+        batches = self.journal_repository.iter_documents_by_trip_id(
+            trip_id, EXPORT_BATCH_SIZE,
+            day_id=day_id,
+            member_id=member_id,
+            start_date=start_date,
+            end_date=end_date
+        )
+        return tabular_export(batches, journal_entries_frame, export_format, f"trip_{trip_id}_journal_entries")
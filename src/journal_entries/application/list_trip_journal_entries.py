@@ -1,23 +1,38 @@
-from typing import List
-from src.journal_entries.domain.journal_entry import JournalEntry
+from datetime import date
+from typing import Optional
+from src.shared.infrastructure.database.pagination import Page, DEFAULT_PAGE_LIMIT
 from src.journal_entries.infrastructure.persistence.mongo_journal_entry_repository import MongoJournalEntryRepository
-from src.trips.infrastructure.persistence.mongo_trip_repository import MongoTripRepository
+from src.trips.application.trip_access import TripAccess
+from src.shared.infrastructure.container import container
 
 class ListTripJournalEntries:
     def __init__(self):
-        self.journal_repository = MongoJournalEntryRepository()
-        self.trip_repository = MongoTripRepository()
+        self.journal_repository = container.get(MongoJournalEntryRepository)
+        self.trip_access = container.get(TripAccess)
 
-    async def execute(self, trip_id: str, user_id: str) -> List[JournalEntry]:
-        trip = await self.trip_repository.find_by_id(trip_id)
+    async def execute(
+        self,
+        trip_id: str,
+        user_id: str,
+        limit: int = DEFAULT_PAGE_LIMIT,
+        cursor: Optional[str] = None,
+        day_id: Optional[str] = None,
+        member_id: Optional[str] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None
+    ) -> Page:
+        trip = await self.trip_access.find(trip_id)
         if not trip:
             raise ValueError("Trip not found")
 
-        is_member = any(
-            member.user_id == user_id
-            for member in trip.members
-        )
+        is_member = trip.is_member(user_id)
         if not is_member:
             raise ValueError("User is not a trip member")
 
-        return await self.journal_repository.find_by_trip_id(trip_id)
\ No newline at end of file
+        return await self.journal_repository.find_page_by_trip_id(
+            trip_id, limit, cursor,
+            day_id=day_id,
+            member_id=member_id,
+            start_date=start_date,
+            end_date=end_date
+        )
\ No newline at end of file
@@ -1,42 +1,124 @@
-from typing import List
+import asyncio
+import html
+import math
+from typing import Any, Dict, List, Optional
+from pydantic import BaseModel
 from src.journal_entries.domain.journal_entry import JournalEntry
+from src.journal_entries.domain.search_text import highlight, query_terms
 from src.journal_entries.infrastructure.persistence.mongo_journal_entry_repository import MongoJournalEntryRepository
-from src.trips.infrastructure.persistence.mongo_trip_repository import MongoTripRepository
+from src.trips.application.trip_access import TripAccess
+from src.shared.infrastructure.database.pagination import Page, DEFAULT_PAGE_LIMIT, MAX_PAGE_LIMIT, encode_cursor, decode_cursor
+from src.shared.infrastructure.container import container
+
+# Tope de candidatos que se puntúan por búsqueda; los más recientes primero
+MAX_CANDIDATES = 5000
+# Parámetros habituales de BM25
+BM25_K1 = 1.2
+BM25_B = 0.75
+# Una palabra que solo empieza con el término pesa la mitad que una coincidencia exacta
+PREFIX_WEIGHT = 0.5
+
+class JournalSearchHit(BaseModel):
+    entry: JournalEntry
+    score: float
+    snippet: str
 
 class SearchEntries:
     def __init__(self):
-        self.journal_repository = MongoJournalEntryRepository()
-        self.trip_repository = MongoTripRepository()
+        self.journal_repository = container.get(MongoJournalEntryRepository)
+        self.trip_access = container.get(TripAccess)
 
-    async def execute(self, trip_id: str, user_id: str, query: str) -> List[JournalEntry]:
+    async def execute(
+        self,
+        trip_id: str,
+        user_id: str,
+        query: str,
+        limit: int = DEFAULT_PAGE_LIMIT,
+        cursor: Optional[str] = None
+    ) -> Page:
         if not query or len(query) < 2:
             raise ValueError("Search query must be at least 2 characters")
 
-        trip = await self.trip_repository.find_by_id(trip_id)
+        trip = await self.trip_access.find(trip_id)
         if not trip:
             raise ValueError("Trip not found")
 
-        is_member = any(
-            member.user_id == user_id
-            for member in trip.members
-        )
+        is_member = trip.is_member(user_id)
         if not is_member:
             raise ValueError("User not authorized to search journal entries")
 
-        all_entries = await self.journal_repository.find_by_trip_id(trip_id)
-        
-        query_lower = query.lower()
-        matching_entries = []
-        
-        for entry in all_entries:
-            content_matches = query_lower in entry.content.lower()
-            
-            recommendation_matches = any(
-                query_lower in rec.note.lower() 
-                for rec in entry.recommendations
+        terms = query_terms(query)
+        if not terms:
+            raise ValueError("Search query must contain at least one word of 2 characters")
+
+        after = decode_cursor(cursor, "score") if cursor else None
+        if after and not isinstance(after[0], (int, float)):
+            raise ValueError("Invalid cursor")
+        limit = max(1, min(limit, MAX_PAGE_LIMIT))
+
+        await self.journal_repository.index_missing_search_fields(trip_id)
+        candidates = await self.journal_repository.find_search_candidates(trip_id, terms, MAX_CANDIDATES)
+        if not candidates:
+            return Page([])
+
+        total, *document_frequencies = await asyncio.gather(
+            self.journal_repository.count_by_trip_id(trip_id),
+            *(self.journal_repository.count_search_matches(trip_id, term) for term in terms)
+        )
+        ranked = _rank(candidates, terms, total, document_frequencies)
+
+        if after:
+            after_score, after_id = after
+            ranked = [
+                (score, entry_id) for score, entry_id in ranked
+                if score < after_score or (score == after_score and entry_id < after_id)
+            ]
+
+        page = ranked[:limit]
+        entries = await self.journal_repository.find_by_ids([str(entry_id) for _, entry_id in page])
+        scores = {str(entry_id): score for score, entry_id in page}
+        hits = [
+            JournalSearchHit(entry=entry, score=scores[entry.id], snippet=_snippet(entry, terms))
+            for entry in entries
+        ]
+
+        next_cursor = None
+        if len(ranked) > limit:
+            last_score, last_id = page[-1]
+            next_cursor = encode_cursor("score", last_score, last_id)
+        return Page(hits, next_cursor)
+
+def _rank(candidates: List[Dict[str, Any]], terms: List[str], total: int, document_frequencies: List[int]) -> List[tuple]:
+    lengths = [doc.get("searchLength") or 0 for doc in candidates]
+    average_length = (sum(lengths) / len(lengths)) or 1
+    total = max(total, len(candidates))
+    idf = [
+        math.log(1 + (total - frequency + 0.5) / (frequency + 0.5))
+        for frequency in document_frequencies
+    ]
+
+    ranked = []
+    for doc, length in zip(candidates, lengths):
+        frequencies = doc.get("searchFreq") or {}
+        score = 0.0
+        for term, term_idf in zip(terms, idf):
+            tf = frequencies.get(term, 0) + PREFIX_WEIGHT * sum(
+                count for token, count in frequencies.items() if token != term and token.startswith(term)
             )
-            
-            if content_matches or recommendation_matches:
-                matching_entries.append(entry)
-        
-        return matching_entries
\ No newline at end of file
+            norm = BM25_K1 * (1 - BM25_B + BM25_B * length / average_length)
+            score += term_idf * tf * (BM25_K1 + 1) / (tf + norm)
+        # Se redondea para que el valor del cursor se compare igual tras serializarlo
+        ranked.append((round(score, 6), doc["_id"]))
+
+    ranked.sort(key=lambda item: (item[0], item[1]), reverse=True)
+    return ranked
+
+def _snippet(entry: JournalEntry, terms: List[str]) -> str:
+    snippet = highlight(entry.content, terms)
+    if snippet:
+        return snippet
+    for recommendation in entry.recommendations:
+        snippet = highlight(recommendation.note, terms)
+        if snippet:
+            return snippet
+    return html.escape(entry.content[:160])
@@ -1,12 +1,13 @@
 from typing import Optional, List, Dict, Any
 from src.journal_entries.domain.journal_entry import JournalEntry, Recommendation
-from src.journal_entries.infrastructure.persistence.mongo_journal_entry_repository import MongoJournalEntryRepository
-from src.trips.infrastructure.persistence.mongo_trip_repository import MongoTripRepository
+from src.journal_entries.infrastructure.persistence.mongo_journal_entry_repository import MongoJournalEntryRepository, search_fields
+from src.trips.application.trip_access import TripAccess
+from src.shared.infrastructure.container import container
 
 class UpdateJournalEntry:
     def __init__(self):
-        self.journal_repository = MongoJournalEntryRepository()
-        self.trip_repository = MongoTripRepository()
+        self.journal_repository = container.get(MongoJournalEntryRepository)
+        self.trip_access = container.get(TripAccess)
 
     async def execute(
         self,
@@ -20,7 +21,7 @@ class UpdateJournalEntry:
         if not entry:
             raise ValueError("Journal entry not found")
 
-        trip = await self.trip_repository.find_by_id(entry.trip_id)
+        trip = await self.trip_access.find(entry.trip_id)
         if not trip:
             raise ValueError("Trip not found")
 
@@ -38,8 +39,13 @@ class UpdateJournalEntry:
                 for rec in recommendations
             ]
             update_data["recommendations"] = recommendations_data
+        if content is not None or recommendations is not None:
+            # Los términos de búsqueda se recalculan con el texto final de la entrada
+            notes = [rec["note"] for rec in update_data.get("recommendations", [])] if recommendations is not None else [rec.note for rec in entry.recommendations]
+            update_data.update(search_fields(update_data.get("content", entry.content), notes))
 
         if update_data:
             await self.journal_repository.update(entry_id, update_data)
+            await self.trip_access.touch(entry.trip_id)
 
         return await self.journal_repository.find_by_id(entry_id)
\ No newline at end of file
@@ -0,0 +1,59 @@
+import html
+import re
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Sequence
+from src.shared.domain.text import fold, fold_with_offsets
+
+TOKEN_PATTERN = re.compile(r"\w+")
+MIN_TOKEN_LENGTH = 2
+
+# Palabras vacías que solo se ignoran si la búsqueda trae otros términos
+STOPWORDS = {
+    "al", "con", "de", "del", "el", "en", "es", "la", "las", "lo", "los", "me", "mi", "muy",
+    "no", "por", "que", "se", "su", "un", "una", "y", "ya", "the", "and", "of", "to", "in"
+}
+
+def tokenize(text: str) -> List[str]:
+    return [token for token in TOKEN_PATTERN.findall(fold(text)) if len(token) >= MIN_TOKEN_LENGTH]
+
+def term_frequencies(texts: Iterable[str]) -> Dict[str, int]:
+    counts: Counter = Counter()
+    for text in texts:
+        counts.update(tokenize(text))
+    return dict(counts)
+
+def query_terms(query: str) -> List[str]:
+    terms = list(dict.fromkeys(tokenize(query)))
+    meaningful = [term for term in terms if term not in STOPWORDS]
+    return meaningful or terms
+
+def highlight(text: str, terms: Sequence[str], width: int = 160) -> Optional[str]:
+    folded, offsets = fold_with_offsets(text)
+    spans = [
+        (offsets[match.start()], offsets[match.end() - 1] + 1)
+        for match in TOKEN_PATTERN.finditer(folded)
+        if any(match.group().startswith(term) for term in terms)
+    ]
+    if not spans:
+        return None
+
+    # Ventana alrededor de la primera coincidencia, sin cortar palabras
+    start = max(0, spans[0][0] - width // 3)
+    end = min(len(text), start + width)
+    while start > 0 and not text[start - 1].isspace():
+        start -= 1
+    while end < len(text) and not text[end].isspace():
+        end += 1
+
+    parts = ["…"] if start > 0 else []
+    cursor = start
+    for span_start, span_end in spans:
+        if span_start < start or span_end > end:
+            continue
+        parts.append(html.escape(text[cursor:span_start]))
+        parts.append(f"<mark>{html.escape(text[span_start:span_end])}</mark>")
+        cursor = span_end
+    parts.append(html.escape(text[cursor:end]))
+    if end < len(text):
+        parts.append("…")
+    return "".join(parts).strip()
@@ -1,19 +1,29 @@
-from fastapi import APIRouter, HTTPException, Query, status, Depends
-from typing import List
-from src.journal_entries.infrastructure.http.journal_entries_schemas import CreateJournalEntryRequest, UpdateJournalEntryRequest, JournalEntryResponse
+from datetime import date
+from fastapi import APIRouter, HTTPException, Query, Response, status, Depends
+from fastapi.responses import StreamingResponse
+from typing import List, Optional
+from src.journal_entries.infrastructure.http.journal_entries_schemas import CreateJournalEntryRequest, UpdateJournalEntryRequest, JournalEntryResponse, JournalSearchHitResponse
 from src.journal_entries.application.create_journal_entry import CreateJournalEntry
 from src.journal_entries.application.list_trip_journal_entries import ListTripJournalEntries
 from src.journal_entries.application.get_journal_entry import GetJournalEntry
 from src.journal_entries.application.update_journal_entry import UpdateJournalEntry
 from src.journal_entries.application.search_entries import SearchEntries
+from src.journal_entries.application.export_trip_journal_entries import ExportTripJournalEntries
 from src.shared.infrastructure.security.authentication import get_current_user_id
+from src.auth.application.user_loader import UserLoader
+from src.shared.infrastructure.container import provide
+from src.shared.infrastructure.database.pagination import DEFAULT_PAGE_LIMIT, MAX_PAGE_LIMIT, NEXT_CURSOR_HEADER
 
 router = APIRouter(prefix="/trips/{trip_id}/journal-entries", tags=["journal-entries"])
 
 @router.post("/", response_model=JournalEntryResponse)
-async def create_journal_entry(trip_id: str, request: CreateJournalEntryRequest, user_id: str = Depends(get_current_user_id)):
+async def create_journal_entry(
+    trip_id: str,
+    request: CreateJournalEntryRequest,
+    user_id: str = Depends(get_current_user_id),
+    create_entry_uc: CreateJournalEntry = Depends(provide(CreateJournalEntry))
+):
     try:
-        create_entry_uc = CreateJournalEntry()
         recommendations_data = None
         if request.recommendations:
             recommendations_data = [{"note": rec.note, "type": rec.type} for rec in request.recommendations]
@@ -30,41 +40,108 @@ async def create_journal_entry(trip_id: str, request: CreateJournalEntryRequest,
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
-@router.get("/search", response_model=List[JournalEntryResponse])
+@router.get("/search", response_model=List[JournalSearchHitResponse])
 async def search_journal_entries(
     trip_id: str,
+    response: Response,
     q: str = Query(..., min_length=2),
-    user_id: str = Depends(get_current_user_id)
+    limit: int = Query(DEFAULT_PAGE_LIMIT, ge=1, le=MAX_PAGE_LIMIT),
+    cursor: Optional[str] = Query(None),
+    user_id: str = Depends(get_current_user_id),
+    search_uc: SearchEntries = Depends(provide(SearchEntries)),
+    user_loader: UserLoader = Depends(provide(UserLoader))
 ):
     try:
-        search_uc = SearchEntries()
-        entries = await search_uc.execute(trip_id, user_id, q)
-        return [JournalEntryResponse(**entry.dict()) for entry in entries]
+        page = await search_uc.execute(trip_id, user_id, q, limit, cursor)
+        if page.next_cursor:
+            response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+        authors = await user_loader.load_many(hit.entry.user_id for hit in page.items)
+        return [
+            JournalSearchHitResponse(**hit.entry.dict(), score=hit.score, snippet=hit.snippet, author=authors.get(hit.entry.user_id))
+            for hit in page.items
+        ]
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 @router.get("/", response_model=List[JournalEntryResponse])
-async def list_trip_journal_entries(trip_id: str, user_id: str = Depends(get_current_user_id)):
+async def list_trip_journal_entries(
+    trip_id: str,
+    response: Response,
+    limit: int = Query(DEFAULT_PAGE_LIMIT, ge=1, le=MAX_PAGE_LIMIT),
+    cursor: Optional[str] = Query(None),
+    day_id: Optional[str] = Query(None),
+    member_id: Optional[str] = Query(None),
+    start_date: Optional[date] = Query(None),
+    end_date: Optional[date] = Query(None),
+    user_id: str = Depends(get_current_user_id),
+    list_entries: ListTripJournalEntries = Depends(provide(ListTripJournalEntries)),
+    user_loader: UserLoader = Depends(provide(UserLoader))
+):
     try:
-        list_entries = ListTripJournalEntries()
-        entries = await list_entries.execute(trip_id, user_id)
-        return [JournalEntryResponse(**entry.dict()) for entry in entries]
+        page = await list_entries.execute(
+            trip_id, user_id, limit, cursor,
+            day_id=day_id,
+            member_id=member_id,
+            start_date=start_date,
+            end_date=end_date
+        )
+        if page.next_cursor:
+            response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+        authors = await user_loader.load_many(entry.user_id for entry in page.items)
+        return [JournalEntryResponse(**entry.dict(), author=authors.get(entry.user_id)) for entry in page.items]
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
+@router.get("/export")
+async def export_trip_journal_entries(
+    trip_id: str,
+    format: str = Query("csv", pattern="^(csv|xlsx|ndjson)$"),
+    day_id: Optional[str] = Query(None),
+    member_id: Optional[str] = Query(None),
+    start_date: Optional[date] = Query(None),
+    end_date: Optional[date] = Query(None),
+    user_id: str = Depends(get_current_user_id),
+    export_uc: ExportTripJournalEntries = Depends(provide(ExportTripJournalEntries))
+):
+    try:
+        export = await export_uc.execute(
+            trip_id, user_id, format,
+            day_id=day_id,
+            member_id=member_id,
+            start_date=start_date,
+            end_date=end_date
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    return StreamingResponse(
+        export.chunks,
+        media_type=export.media_type,
+        headers={"Content-Disposition": f"attachment; filename={export.filename}"}
+    )
+
 @router.get("/{entry_id}", response_model=JournalEntryResponse)
-async def get_journal_entry(trip_id: str, entry_id: str, user_id: str = Depends(get_current_user_id)):
+async def get_journal_entry(
+    trip_id: str,
+    entry_id: str,
+    user_id: str = Depends(get_current_user_id),
+    get_entry_uc: GetJournalEntry = Depends(provide(GetJournalEntry))
+):
     try:
-        get_entry_uc = GetJournalEntry()
         entry = await get_entry_uc.execute(entry_id, user_id)
         return JournalEntryResponse(**entry.dict())
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
 
 @router.put("/{entry_id}", response_model=JournalEntryResponse)
-async def update_journal_entry(trip_id: str, entry_id: str, request: UpdateJournalEntryRequest, user_id: str = Depends(get_current_user_id)):
+async def update_journal_entry(
+    trip_id: str,
+    entry_id: str,
+    request: UpdateJournalEntryRequest,
+    user_id: str = Depends(get_current_user_id),
+    update_entry_uc: UpdateJournalEntry = Depends(provide(UpdateJournalEntry))
+):
     try:
-        update_entry_uc = UpdateJournalEntry()
         recommendations_data = None
         if request.recommendations:
             recommendations_data = [{"note": rec.note, "type": rec.type} for rec in request.recommendations]
@@ -1,6 +1,7 @@
 from pydantic import BaseModel
 from datetime import datetime
 from typing import Optional, List, Dict, Any
+from src.auth.infrastructure.http.auth_schemas import UserSummaryResponse
 
 class RecommendationRequest(BaseModel):
     note: str
@@ -30,4 +31,9 @@ class JournalEntryResponse(BaseModel):
     emotions: Dict[str, Any] = {}
     recommendations: List[RecommendationResponse] = []
     created_at: datetime
-    modified_at: datetime
\ No newline at end of file
+    modified_at: datetime
+    author: Optional[UserSummaryResponse] = None
+
+class JournalSearchHitResponse(JournalEntryResponse):
+    score: float
+    snippet: str
@@ -1,49 +1,47 @@
-from typing import Optional, List, Dict, Any
+import re
+from typing import Optional, List, Dict, Any, AsyncIterator
 from bson import ObjectId
-from datetime import datetime
+from datetime import date, datetime
+from pymongo import IndexModel, UpdateOne, ASCENDING, DESCENDING
 from src.shared.infrastructure.database.mongo_client import get_database
-from src.journal_entries.domain.journal_entry import JournalEntry
+from src.shared.infrastructure.database.index_registry import index_registry, QueryShape
+from src.shared.infrastructure.database.pagination import Page, DEFAULT_PAGE_LIMIT, find_page, iter_batches, date_range_filter, object_id_filter
+from src.shared.infrastructure.database.document_mapper import DocumentMapper, object_id, nested, value
+from src.journal_entries.domain.journal_entry import JournalEntry, Recommendation
+from src.journal_entries.domain.search_text import term_frequencies
+
+recommendation_mapper = DocumentMapper(Recommendation)
+
+journal_entry_mapper = DocumentMapper(JournalEntry, {
+    "id": object_id("_id"),
+    "trip_id": object_id("tripId", default=""),
+    "day_id": object_id("dayId", default=""),
+    "user_id": object_id("userId", default=""),
+    "content": value(default=""),
+    "emotions": value(default=dict),
+    "recommendations": nested(recommendation_mapper),
+    "is_deleted": value("isDeleted", default=False),
+    "created_at": value("createdAt", default=datetime.utcnow),
+    "modified_at": value("modifiedAt", default=datetime.utcnow)
+})
+
+def search_fields(content: str, notes: List[str]) -> Dict[str, Any]:
+    # Términos normalizados que se guardan junto a la entrada para buscar sin leer el texto
+    frequencies = term_frequencies([content or ""] + list(notes))
+    return {
+        "searchTerms": sorted(frequencies),
+        "searchFreq": frequencies,
+        "searchLength": sum(frequencies.values())
+    }
 
 class MongoJournalEntryRepository:
     def __init__(self):
         self.db = get_database()
         self.collection = self.db.journalEntries
 
-    def _convert_doc_to_journal_entry(self, doc: Dict[str, Any]) -> Dict[str, Any]:
-        """Convert MongoDB document to JournalEntry-compatible dict"""
-        converted = {
-            "id": str(doc["_id"]),
-            "trip_id": str(doc.get("tripId", "")),
-            "day_id": str(doc.get("dayId", "")),
-            "user_id": str(doc.get("userId", "")),
-            "content": doc.get("content", ""),
-            "emotions": doc.get("emotions", {}),
-            "recommendations": doc.get("recommendations", []),
-            "is_deleted": doc.get("isDeleted", False),
-            "created_at": doc.get("createdAt", datetime.utcnow()),
-            "modified_at": doc.get("modifiedAt", datetime.utcnow())
-        }
-        return converted
-
     async def create(self, entry: JournalEntry) -> JournalEntry:
-        entry_dict = entry.dict(exclude={"id"})
-        entry_dict["tripId"] = ObjectId(entry.trip_id)
-        entry_dict["dayId"] = ObjectId(entry.day_id)
-        entry_dict["userId"] = ObjectId(entry.user_id)
-        entry_dict["createdAt"] = entry.created_at
-        entry_dict["modifiedAt"] = entry.modified_at
-        
-        if "trip_id" in entry_dict:
-            del entry_dict["trip_id"]
-        if "day_id" in entry_dict:
-            del entry_dict["day_id"]
-        if "user_id" in entry_dict:
-            del entry_dict["user_id"]
-        if "created_at" in entry_dict:
-            del entry_dict["created_at"]
-        if "modified_at" in entry_dict:
-            del entry_dict["modified_at"]
-        
+        entry_dict = journal_entry_mapper.to_document(entry, exclude=("id",))
+        entry_dict.update(search_fields(entry.content, [rec.note for rec in entry.recommendations]))
         result = await self.collection.insert_one(entry_dict)
         entry.id = str(result.inserted_id)
         return entry
@@ -51,8 +49,7 @@ class MongoJournalEntryRepository:
     async def find_by_id(self, entry_id: str) -> Optional[JournalEntry]:
         doc: Optional[Dict[str, Any]] = await self.collection.find_one({"_id": ObjectId(entry_id), "isDeleted": {"$ne": True}})
         if doc:
-            converted = self._convert_doc_to_journal_entry(doc)
-            return JournalEntry(**converted)
+            return journal_entry_mapper.to_domain(doc)
         return None
 
     async def find_by_trip_id(self, trip_id: str) -> List[JournalEntry]:
@@ -63,10 +60,114 @@ class MongoJournalEntryRepository:
         
         entries = []
         async for doc in cursor:
-            converted = self._convert_doc_to_journal_entry(doc)
-            entries.append(JournalEntry(**converted))
+            entries.append(journal_entry_mapper.to_domain(doc))
         return entries
 
+    async def count_by_trip_id(self, trip_id: str) -> int:
+        return await self.collection.count_documents({
+            "tripId": ObjectId(trip_id),
+            "isDeleted": {"$ne": True}
+        })
+
+    async def iter_by_trip_id(self, trip_id: str, batch_size: int = 500) -> AsyncIterator[JournalEntry]:
+        # Orden cronológico y por lotes: no se carga la colección completa en memoria
+        cursor = self.collection.find({
+            "tripId": ObjectId(trip_id),
+            "isDeleted": {"$ne": True}
+        }).sort([("createdAt", 1), ("_id", 1)]).batch_size(batch_size)
+
+        async for doc in cursor:
+            yield journal_entry_mapper.to_domain(doc)
+
+    async def find_page_by_trip_id(
+        self,
+        trip_id: str,
+        limit: int = DEFAULT_PAGE_LIMIT,
+        cursor: Optional[str] = None,
+        day_id: Optional[str] = None,
+        member_id: Optional[str] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None
+    ) -> Page:
+        query = self._trip_query(trip_id, day_id, member_id, start_date, end_date)
+        return await find_page(self.collection, query, journal_entry_mapper, "createdAt", -1, limit, cursor)
+
+    def iter_documents_by_trip_id(
+        self,
+        trip_id: str,
+        batch_size: int,
+        day_id: Optional[str] = None,
+        member_id: Optional[str] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        # Documentos crudos por lotes para exportaciones tabulares; la consulta se
+        # arma antes de iterar para que un filtro inválido falle de inmediato
+        query = self._trip_query(trip_id, day_id, member_id, start_date, end_date)
+        cursor = self.collection.find(query, {"isDeleted": 0}).sort([("createdAt", 1), ("_id", 1)]).batch_size(batch_size)
+        return iter_batches(cursor, batch_size)
+
+    def _trip_query(
+        self,
+        trip_id: str,
+        day_id: Optional[str],
+        member_id: Optional[str],
+        start_date: Optional[date],
+        end_date: Optional[date]
+    ) -> Dict[str, Any]:
+        query: Dict[str, Any] = {"tripId": ObjectId(trip_id), "isDeleted": {"$ne": True}}
+        if day_id:
+            query["dayId"] = object_id_filter(day_id, "day_id")
+        if member_id:
+            query["userId"] = object_id_filter(member_id, "member_id")
+        date_range = date_range_filter(start_date, end_date)
+        if date_range:
+            query["createdAt"] = date_range
+        return query
+
+    async def find_search_candidates(self, trip_id: str, terms: List[str], limit: int) -> List[Dict[str, Any]]:
+        # Cada término es un prefijo anclado: el índice multikey resuelve el rango
+        query: Dict[str, Any] = {
+            "tripId": ObjectId(trip_id),
+            "isDeleted": {"$ne": True},
+            "$and": [{"searchTerms": {"$regex": f"^{re.escape(term)}"}} for term in terms]
+        }
+        cursor = self.collection.find(query, {"searchFreq": 1, "searchLength": 1}).sort("_id", -1).limit(limit)
+        return await cursor.to_list(length=limit)
+
+    async def count_search_matches(self, trip_id: str, term: str) -> int:
+        return await self.collection.count_documents({
+            "tripId": ObjectId(trip_id),
+            "isDeleted": {"$ne": True},
+            "searchTerms": {"$regex": f"^{re.escape(term)}"}
+        })
+
+    async def find_by_ids(self, entry_ids: List[str]) -> List[JournalEntry]:
+        cursor = self.collection.find({"_id": {"$in": [ObjectId(entry_id) for entry_id in entry_ids]}, "isDeleted": {"$ne": True}})
+        entries = {str(doc["_id"]): journal_entry_mapper.to_domain(doc) async for doc in cursor}
+        return [entries[entry_id] for entry_id in entry_ids if entry_id in entries]
+
+    async def index_missing_search_fields(self, trip_id: str, batch_size: int = 500) -> int:
+        # Entradas escritas antes del buscador: se indexan la primera vez que se busca en el viaje
+        indexed = 0
+        while True:
+            docs = await self.collection.find(
+                {"tripId": ObjectId(trip_id), "searchTerms": None},
+                {"content": 1, "recommendations.note": 1}
+            ).limit(batch_size).to_list(length=batch_size)
+            if not docs:
+                return indexed
+
+            operations = [
+                UpdateOne(
+                    {"_id": doc["_id"]},
+                    {"$set": search_fields(doc.get("content", ""), [rec.get("note", "") for rec in doc.get("recommendations") or []])}
+                )
+                for doc in docs
+            ]
+            await self.collection.bulk_write(operations, ordered=False)
+            indexed += len(docs)
+
     async def find_by_user_id(self, user_id: str) -> List[JournalEntry]:
         cursor = self.collection.find({
             "userId": ObjectId(user_id),
@@ -75,8 +176,7 @@ class MongoJournalEntryRepository:
         
         entries = []
         async for doc in cursor:
-            converted = self._convert_doc_to_journal_entry(doc)
-            entries.append(JournalEntry(**converted))
+            entries.append(journal_entry_mapper.to_domain(doc))
         return entries
 
     async def find_by_day_id(self, day_id: str) -> List[JournalEntry]:
@@ -87,8 +187,7 @@ class MongoJournalEntryRepository:
         
         entries = []
         async for doc in cursor:
-            converted = self._convert_doc_to_journal_entry(doc)
-            entries.append(JournalEntry(**converted))
+            entries.append(journal_entry_mapper.to_domain(doc))
         return entries
 
     async def update(self, entry_id: str, update_data: dict) -> bool:
@@ -104,4 +203,28 @@ class MongoJournalEntryRepository:
             {"_id": ObjectId(entry_id)},
             {"$set": {"isDeleted": True}}
         )
-        return result.modified_count > 0
\ No newline at end of file
+        return result.modified_count > 0
+
+index_registry.register(
+    "journalEntries",
+    indexes=[
+        IndexModel([("tripId", ASCENDING), ("createdAt", DESCENDING), ("_id", DESCENDING)]),
+        IndexModel([("tripId", ASCENDING), ("dayId", ASCENDING), ("createdAt", DESCENDING), ("_id", DESCENDING)]),
+        IndexModel([("tripId", ASCENDING), ("userId", ASCENDING), ("createdAt", DESCENDING), ("_id", DESCENDING)]),
+        IndexModel([("userId", ASCENDING), ("createdAt", DESCENDING)]),
+        IndexModel([("dayId", ASCENDING), ("createdAt", DESCENDING)]),
+        IndexModel([("tripId", ASCENDING), ("searchTerms", ASCENDING)])
+    ],
+    query_shapes=[
+        QueryShape("find_by_trip_id", {"tripId": ObjectId(), "isDeleted": {"$ne": True}}, [("createdAt", -1)]),
+        QueryShape("count_by_trip_id", {"tripId": ObjectId(), "isDeleted": {"$ne": True}}),
+        QueryShape("find_page_by_trip_id", {"tripId": ObjectId(), "isDeleted": {"$ne": True}}, [("createdAt", -1), ("_id", -1)]),
+        QueryShape("iter_by_trip_id", {"tripId": ObjectId(), "isDeleted": {"$ne": True}}, [("createdAt", 1), ("_id", 1)]),
+        QueryShape("find_page_by_trip_id_day", {"tripId": ObjectId(), "dayId": ObjectId(), "isDeleted": {"$ne": True}}, [("createdAt", -1), ("_id", -1)]),
+        QueryShape("find_page_by_trip_id_member", {"tripId": ObjectId(), "userId": ObjectId(), "isDeleted": {"$ne": True}}, [("createdAt", -1), ("_id", -1)]),
+        QueryShape("find_by_user_id", {"userId": ObjectId(), "isDeleted": {"$ne": True}}, [("createdAt", -1)]),
+        QueryShape("find_by_day_id", {"dayId": ObjectId(), "isDeleted": {"$ne": True}}, [("createdAt", -1)]),
+        QueryShape("find_search_candidates", {"tripId": ObjectId(), "isDeleted": {"$ne": True}, "searchTerms": {"$regex": "^playa"}}),
+        QueryShape("index_missing_search_fields", {"tripId": ObjectId(), "searchTerms": None})
+    ]
+)
@@ -1,27 +1,24 @@
 from src.photos.infrastructure.persistence.mongo_photo_repository import MongoPhotoRepository
-from src.trips.infrastructure.persistence.mongo_trip_repository import MongoTripRepository
+from src.trips.application.trip_access import TripAccess
 from src.shared.infrastructure.services.file_storage_service import FileStorageService
+from src.shared.infrastructure.container import container
 
 class DeletePhoto:
     def __init__(self):
-        self.photo_repository = MongoPhotoRepository()
-        self.trip_repository = MongoTripRepository()
-        self.file_storage_service = FileStorageService()
+        self.photo_repository = container.get(MongoPhotoRepository)
+        self.trip_access = container.get(TripAccess)
+        self.file_storage_service = container.get(FileStorageService)
 
     async def execute(self, photo_id: str, user_id: str) -> bool:
         photo = await self.photo_repository.find_by_id(photo_id)
         if not photo:
             raise ValueError("Photo not found")
 
-        trip = await self.trip_repository.find_by_id(photo.trip_id)
+        trip = await self.trip_access.find(photo.trip_id)
         if not trip:
             raise ValueError("Trip not found")
 
-        user_role = None
-        for member in trip.members:
-            if member.user_id == user_id:
-                user_role = member.role
-                break
+        user_role = trip.role_of(user_id)
 
         if user_role not in ["owner", "editor"] and photo.user_id != user_id:
             raise ValueError("User not authorized to delete this photo")
@@ -33,5 +30,6 @@ class DeletePhoto:
             )
 
         await self.photo_repository.delete(photo_id)
+        await self.trip_access.touch(photo.trip_id)
 
         return True
\ No newline at end of file
@@ -1,42 +1,41 @@
 from typing import Dict, List
 from src.photos.domain.photo import Photo
 from src.photos.infrastructure.persistence.mongo_photo_repository import MongoPhotoRepository
+from src.trips.application.trip_access import TripAccess
 from src.trips.infrastructure.persistence.mongo_trip_repository import MongoTripRepository
+from src.shared.infrastructure.container import container
 
 class ListPhotosByDay:
     def __init__(self):
-        self.photo_repository = MongoPhotoRepository()
-        self.trip_repository = MongoTripRepository()
+        self.photo_repository = container.get(MongoPhotoRepository)
+        self.trip_access = container.get(TripAccess)
+        self.trip_repository = container.get(MongoTripRepository)
 
     async def execute(self, trip_id: str, user_id: str) -> Dict[str, List[Photo]]:
-        trip = await self.trip_repository.find_by_id(trip_id)
+        trip = await self.trip_access.find(trip_id)
         if not trip:
             raise ValueError("Trip not found")
 
-        is_member = any(
-            member.user_id == user_id
-            for member in trip.members
-        )
+        is_member = trip.is_member(user_id)
         if not is_member and not trip.is_public:
             raise ValueError("User not authorized to view trip photos")
 
         photos = await self.photo_repository.find_by_trip_id(trip_id)
+        days = await self.trip_repository.find_day_dates(trip_id)
         
         photos_by_day = {}
         
-        for day in trip.days:
-            day_date = day.date.strftime("%Y-%m-%d")
-            photos_by_day[day_date] = []
+        for _, day_date in days:
+            photos_by_day[day_date.strftime("%Y-%m-%d")] = []
 
         unassigned_photos = []
         
         for photo in photos:
             if photo.associated_day_id:
                 day_found = False
-                for day in trip.days:
-                    if day.id == photo.associated_day_id:
-                        day_date = day.date.strftime("%Y-%m-%d")
-                        photos_by_day[day_date].append(photo)
+                for day_id, day_date in days:
+                    if day_id == photo.associated_day_id:
+                        photos_by_day[day_date.strftime("%Y-%m-%d")].append(photo)
                         day_found = True
                         break
                 if not day_found:
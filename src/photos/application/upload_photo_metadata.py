@@ -1,12 +1,13 @@
 from datetime import datetime
 from src.photos.domain.photo import Photo
 from src.photos.infrastructure.persistence.mongo_photo_repository import MongoPhotoRepository
-from src.trips.infrastructure.persistence.mongo_trip_repository import MongoTripRepository
+from src.trips.application.trip_access import TripAccess
+from src.shared.infrastructure.container import container
 
 class UploadPhotoMetadata:
     def __init__(self):
-        self.photo_repository = MongoPhotoRepository()
-        self.trip_repository = MongoTripRepository()
+        self.photo_repository = container.get(MongoPhotoRepository)
+        self.trip_access = container.get(TripAccess)
 
     async def execute(
         self,
@@ -18,14 +19,11 @@ class UploadPhotoMetadata:
         associated_day_id: str = None,
         associated_journal_entry_id: str = None
     ) -> Photo:
-        trip = await self.trip_repository.find_by_id(trip_id)
+        trip = await self.trip_access.find(trip_id)
         if not trip:
             raise ValueError("Trip not found")
 
-        is_member = any(
-            member.user_id == user_id
-            for member in trip.members
-        )
+        is_member = trip.is_member(user_id)
         if not is_member:
             raise ValueError("User is not a trip member")
 
@@ -39,4 +37,6 @@ class UploadPhotoMetadata:
             associated_journal_entry_id=associated_journal_entry_id
         )
 
-        return await self.photo_repository.create(photo)
\ No newline at end of file
+        photo = await self.photo_repository.create(photo)
+        await self.trip_access.touch(trip_id)
+        return photo
\ No newline at end of file
@@ -2,14 +2,15 @@ from datetime import datetime
 from typing import Optional
 from src.photos.domain.photo import Photo
 from src.photos.infrastructure.persistence.mongo_photo_repository import MongoPhotoRepository
-from src.trips.infrastructure.persistence.mongo_trip_repository import MongoTripRepository
+from src.trips.application.trip_access import TripAccess
 from src.shared.infrastructure.services.file_storage_service import FileStorageService
+from src.shared.infrastructure.container import container
 
 class UploadPhotoToCloudinary:
     def __init__(self):
-        self.photo_repository = MongoPhotoRepository()
-        self.trip_repository = MongoTripRepository()
-        self.file_storage_service = FileStorageService()
+        self.photo_repository = container.get(MongoPhotoRepository)
+        self.trip_access = container.get(TripAccess)
+        self.file_storage_service = container.get(FileStorageService)
 
     async def execute(
         self,
@@ -22,14 +23,11 @@ class UploadPhotoToCloudinary:
         associated_day_id: Optional[str] = None,
         associated_journal_entry_id: Optional[str] = None
     ) -> Photo:
-        trip = await self.trip_repository.find_by_id(trip_id)
+        trip = await self.trip_access.find(trip_id)
         if not trip:
             raise ValueError("Trip not found")
 
-        is_member = any(
-            member.user_id == user_id
-            for member in trip.members
-        )
+        is_member = trip.is_member(user_id)
         if not is_member:
             raise ValueError("User is not a trip member")
 
@@ -59,6 +57,7 @@ class UploadPhotoToCloudinary:
 
             await self.photo_repository.update(photo_id, {"file_url": cloudinary_url})
             created_photo.file_url = cloudinary_url
+            await self.trip_access.touch(trip_id)
 
             return created_photo
 
@@ -71,15 +70,11 @@ class UploadPhotoToCloudinary:
         if not photo:
             raise ValueError("Photo not found")
 
-        trip = await self.trip_repository.find_by_id(photo.trip_id)
+        trip = await self.trip_access.find(photo.trip_id)
         if not trip:
             raise ValueError("Trip not found")
 
-        user_role = None
-        for member in trip.members:
-            if member.user_id == user_id:
-                user_role = member.role
-                break
+        user_role = trip.role_of(user_id)
 
         if user_role not in ["owner", "editor"] and photo.user_id != user_id:
             raise ValueError("User not authorized to delete this photo")
@@ -93,5 +88,6 @@ class UploadPhotoToCloudinary:
             await self.photo_repository.delete(photo_id)
         else:
             await self.photo_repository.delete(photo_id)
+        await self.trip_access.touch(photo.trip_id)
 
         return True
\ No newline at end of file
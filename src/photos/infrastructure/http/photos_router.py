@@ -1,6 +1,6 @@
-from fastapi import APIRouter, HTTPException, status, Depends, File, UploadFile, Form
+from fastapi import APIRouter, HTTPException, Query, Response, status, Depends, File, UploadFile, Form
 from typing import Dict, List, Optional
-from datetime import datetime
+from datetime import date, datetime
 from src.photos.infrastructure.http.photos_schemas import UploadPhotoRequest, PhotoResponse
 from src.photos.application.upload_photo_metadata import UploadPhotoMetadata
 from src.photos.application.upload_photo_to_cloudinary import UploadPhotoToCloudinary
@@ -9,6 +9,7 @@ from src.photos.application.list_trip_photos import ListTripPhotos
 from src.photos.application.get_photo_details import GetPhotoDetails
 from src.photos.application.delete_photo import DeletePhoto
 from src.shared.infrastructure.security.authentication import get_current_user_id
+from src.shared.infrastructure.database.pagination import DEFAULT_PAGE_LIMIT, MAX_PAGE_LIMIT, NEXT_CURSOR_HEADER
 
 router = APIRouter(prefix="/trips/{trip_id}/photos", tags=["photos"])
 
@@ -75,11 +76,29 @@ async def list_photos_by_day(trip_id: str, user_id: str = Depends(get_current_us
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 @router.get("/", response_model=List[PhotoResponse])
-async def list_trip_photos(trip_id: str, user_id: str = Depends(get_current_user_id)):
+async def list_trip_photos(
+    trip_id: str,
+    response: Response,
+    limit: int = Query(DEFAULT_PAGE_LIMIT, ge=1, le=MAX_PAGE_LIMIT),
+    cursor: Optional[str] = Query(None),
+    day_id: Optional[str] = Query(None),
+    member_id: Optional[str] = Query(None),
+    start_date: Optional[date] = Query(None),
+    end_date: Optional[date] = Query(None),
+    user_id: str = Depends(get_current_user_id)
+):
     try:
         list_photos = ListTripPhotos()
-        photos = await list_photos.execute(trip_id, user_id)
-        return [PhotoResponse(**photo.dict()) for photo in photos]
+        page = await list_photos.execute(
+            trip_id, user_id, limit, cursor,
+            day_id=day_id,
+            member_id=member_id,
+            start_date=start_date,
+            end_date=end_date
+        )
+        if page.next_cursor:
+            response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+        return [PhotoResponse(**photo.dict()) for photo in page.items]
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
@@ -1,50 +1,32 @@
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, AsyncIterator
+from datetime import date
 from bson import ObjectId
+from pymongo import IndexModel, ASCENDING, DESCENDING
 from src.shared.infrastructure.database.mongo_client import get_database
+from src.shared.infrastructure.database.index_registry import index_registry, QueryShape
+from src.shared.infrastructure.database.pagination import Page, DEFAULT_PAGE_LIMIT, find_page, date_range_filter, object_id_filter
+from src.shared.infrastructure.database.document_mapper import DocumentMapper, object_id, value
 from src.photos.domain.photo import Photo
 
+photo_mapper = DocumentMapper(Photo, {
+    "id": object_id("_id"),
+    "trip_id": object_id("tripId", default=""),
+    "user_id": object_id("userId", default=""),
+    "file_url": value("fileUrl", default=""),
+    "taken_at": value("takenAt", default=None),
+    "location": value(default=None),
+    "associated_day_id": object_id("associatedDayId"),
+    "associated_journal_entry_id": object_id("associatedJournalEntryId"),
+    "is_deleted": value("isDeleted", default=False)
+})
+
 class MongoPhotoRepository:
     def __init__(self):
         self.db = get_database()
         self.collection = self.db.photos
 
-    def _convert_doc_to_photo(self, doc: Dict[str, Any]) -> Dict[str, Any]:
-        """Convert MongoDB document to Photo-compatible dict"""
-        converted = {
-            "id": str(doc["_id"]),
-            "trip_id": str(doc.get("tripId", "")),
-            "user_id": str(doc.get("userId", "")),
-            "file_url": doc.get("fileUrl", ""),
-            "taken_at": doc.get("takenAt"),
-            "location": doc.get("location"),
-            "associated_day_id": str(doc.get("associatedDayId")) if doc.get("associatedDayId") else None,
-            "associated_journal_entry_id": str(doc.get("associatedJournalEntryId")) if doc.get("associatedJournalEntryId") else None,
-            "is_deleted": doc.get("isDeleted", False)
-        }
-        return converted
-
     async def create(self, photo: Photo) -> Photo:
-        photo_dict = photo.dict(exclude={"id"})
-        photo_dict["tripId"] = ObjectId(photo.trip_id)
-        photo_dict["userId"] = ObjectId(photo.user_id)
-        photo_dict["associatedDayId"] = ObjectId(photo.associated_day_id) if photo.associated_day_id else None
-        photo_dict["associatedJournalEntryId"] = ObjectId(photo.associated_journal_entry_id) if photo.associated_journal_entry_id else None
-        photo_dict["fileUrl"] = photo.file_url
-        photo_dict["takenAt"] = photo.taken_at
-        
-        if "file_url" in photo_dict:
-            del photo_dict["file_url"]
-        if "trip_id" in photo_dict:
-            del photo_dict["trip_id"]
-        if "user_id" in photo_dict:
-            del photo_dict["user_id"]
-        if "associated_day_id" in photo_dict:
-            del photo_dict["associated_day_id"]
-        if "associated_journal_entry_id" in photo_dict:
-            del photo_dict["associated_journal_entry_id"]
-        if "taken_at" in photo_dict:
-            del photo_dict["taken_at"]
-        
+        photo_dict = photo_mapper.to_document(photo, exclude=("id",))
         result = await self.collection.insert_one(photo_dict)
         photo.id = str(result.inserted_id)
         return photo
@@ -52,8 +34,7 @@ class MongoPhotoRepository:
     async def find_by_id(self, photo_id: str) -> Optional[Photo]:
         doc: Optional[Dict[str, Any]] = await self.collection.find_one({"_id": ObjectId(photo_id), "isDeleted": {"$ne": True}})
         if doc:
-            converted = self._convert_doc_to_photo(doc)
-            return Photo(**converted)
+            return photo_mapper.to_domain(doc)
         return None
 
     async def find_by_trip_id(self, trip_id: str) -> List[Photo]:
@@ -64,10 +45,47 @@ class MongoPhotoRepository:
         
         photos = []
         async for doc in cursor:
-            converted = self._convert_doc_to_photo(doc)
-            photos.append(Photo(**converted))
+            photos.append(photo_mapper.to_domain(doc))
         return photos
 
+    async def count_by_trip_id(self, trip_id: str) -> int:
+        return await self.collection.count_documents({
+            "tripId": ObjectId(trip_id),
+            "isDeleted": {"$ne": True}
+        })
+
+    async def iter_by_trip_id(self, trip_id: str, batch_size: int = 500) -> AsyncIterator[Photo]:
+        # Orden cronológico y por lotes: no se carga la colección completa en memoria
+        cursor = self.collection.find({
+            "tripId": ObjectId(trip_id),
+            "isDeleted": {"$ne": True}
+        }).sort([("takenAt", 1), ("_id", 1)]).batch_size(batch_size)
+
+        async for doc in cursor:
+            yield photo_mapper.to_domain(doc)
+
+    async def find_page_by_trip_id(
+        self,
+        trip_id: str,
+        limit: int = DEFAULT_PAGE_LIMIT,
+        cursor: Optional[str] = None,
+        day_id: Optional[str] = None,
+        member_id: Optional[str] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None
+    ) -> Page:
+        query: Dict[str, Any] = {"tripId": ObjectId(trip_id), "isDeleted": {"$ne": True}}
+        if day_id:
+            query["associatedDayId"] = object_id_filter(day_id, "day_id")
+        if member_id:
+            query["userId"] = object_id_filter(member_id, "member_id")
+        date_range = date_range_filter(start_date, end_date)
+        if date_range:
+            query["takenAt"] = date_range
+
+        # takenAt es opcional: las fotos sin fecha quedan al final
+        return await find_page(self.collection, query, photo_mapper, "takenAt", -1, limit, cursor, nullable=True)
+
     async def find_by_user_id(self, user_id: str) -> List[Photo]:
         cursor = self.collection.find({
             "userId": ObjectId(user_id),
@@ -76,8 +94,7 @@ class MongoPhotoRepository:
         
         photos = []
         async for doc in cursor:
-            converted = self._convert_doc_to_photo(doc)
-            photos.append(Photo(**converted))
+            photos.append(photo_mapper.to_domain(doc))
         return photos
 
     async def find_by_day_id(self, day_id: str) -> List[Photo]:
@@ -88,8 +105,7 @@ class MongoPhotoRepository:
         
         photos = []
         async for doc in cursor:
-            converted = self._convert_doc_to_photo(doc)
-            photos.append(Photo(**converted))
+            photos.append(photo_mapper.to_domain(doc))
         return photos
 
     async def update(self, photo_id: str, update_data: dict) -> bool:
@@ -110,4 +126,25 @@ class MongoPhotoRepository:
             {"_id": ObjectId(photo_id)},
             {"$set": {"isDeleted": True}}
         )
-        return result.modified_count > 0
\ No newline at end of file
+        return result.modified_count > 0
+
+index_registry.register(
+    "photos",
+    indexes=[
+        IndexModel([("tripId", ASCENDING), ("takenAt", DESCENDING), ("_id", DESCENDING)]),
+        IndexModel([("tripId", ASCENDING), ("associatedDayId", ASCENDING), ("takenAt", DESCENDING), ("_id", DESCENDING)]),
+        IndexModel([("tripId", ASCENDING), ("userId", ASCENDING), ("takenAt", DESCENDING), ("_id", DESCENDING)]),
+        IndexModel([("userId", ASCENDING), ("takenAt", DESCENDING)]),
+        IndexModel([("associatedDayId", ASCENDING), ("takenAt", DESCENDING)])
+    ],
+    query_shapes=[
+        QueryShape("find_by_trip_id", {"tripId": ObjectId(), "isDeleted": {"$ne": True}}, [("takenAt", -1)]),
+        QueryShape("count_by_trip_id", {"tripId": ObjectId(), "isDeleted": {"$ne": True}}),
+        QueryShape("find_page_by_trip_id", {"tripId": ObjectId(), "isDeleted": {"$ne": True}}, [("takenAt", -1), ("_id", -1)]),
+        QueryShape("iter_by_trip_id", {"tripId": ObjectId(), "isDeleted": {"$ne": True}}, [("takenAt", 1), ("_id", 1)]),
+        QueryShape("find_page_by_trip_id_day", {"tripId": ObjectId(), "associatedDayId": ObjectId(), "isDeleted": {"$ne": True}}, [("takenAt", -1), ("_id", -1)]),
+        QueryShape("find_page_by_trip_id_member", {"tripId": ObjectId(), "userId": ObjectId(), "isDeleted": {"$ne": True}}, [("takenAt", -1), ("_id", -1)]),
+        QueryShape("find_by_user_id", {"userId": ObjectId(), "isDeleted": {"$ne": True}}, [("takenAt", -1)]),
+        QueryShape("find_by_day_id", {"associatedDayId": ObjectId(), "isDeleted": {"$ne": True}}, [("takenAt", -1)])
+    ]
+)
@@ -1,16 +1,23 @@
-from typing import List
-from src.plan_deviations.domain.plan_deviation import PlanDeviation
+from typing import Optional
+from src.shared.infrastructure.database.pagination import Page, DEFAULT_PAGE_LIMIT
 from src.plan_deviations.infrastructure.persistence.mongo_plan_deviation_repository import MongoPlanDeviationRepository
-from src.trips.infrastructure.persistence.mongo_trip_repository import MongoTripRepository
+from src.trips.application.trip_access import TripAccess
+from src.shared.infrastructure.container import container
 
 class ListTripDeviations:
     def __init__(self):
-        self.deviation_repository = MongoPlanDeviationRepository()
-        self.trip_repository = MongoTripRepository()
+        self.deviation_repository = container.get(MongoPlanDeviationRepository)
+        self.trip_access = container.get(TripAccess)
 
-    async def execute(self, trip_id: str) -> List[PlanDeviation]:
-        trip = await self.trip_repository.find_by_id(trip_id)
+    async def execute(
+        self,
+        trip_id: str,
+        limit: int = DEFAULT_PAGE_LIMIT,
+        cursor: Optional[str] = None,
+        day_id: Optional[str] = None
+    ) -> Page:
+        trip = await self.trip_access.find(trip_id)
         if not trip:
             raise ValueError("Trip not found")
 
-        return await self.deviation_repository.find_by_trip_id(trip_id)
\ No newline at end of file
+        return await self.deviation_repository.find_page_by_trip_id(trip_id, limit, cursor, day_id=day_id)
\ No newline at end of file
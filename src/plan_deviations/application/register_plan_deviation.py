@@ -1,11 +1,12 @@
 from src.plan_deviations.domain.plan_deviation import PlanDeviation
 from src.plan_deviations.infrastructure.persistence.mongo_plan_deviation_repository import MongoPlanDeviationRepository
-from src.trips.infrastructure.persistence.mongo_trip_repository import MongoTripRepository
+from src.trips.application.trip_access import TripAccess
+from src.shared.infrastructure.container import container
 
 class RegisterPlanDeviation:
     def __init__(self):
-        self.deviation_repository = MongoPlanDeviationRepository()
-        self.trip_repository = MongoTripRepository()
+        self.deviation_repository = container.get(MongoPlanDeviationRepository)
+        self.trip_access = container.get(TripAccess)
 
     async def execute(
         self,
@@ -17,12 +18,12 @@ class RegisterPlanDeviation:
         activity_id: str = None,
         notes: str = None
     ) -> PlanDeviation:
-        trip = await self.trip_repository.find_by_id(trip_id)
+        trip = await self.trip_access.find(trip_id)
         if not trip:
             raise ValueError("Trip not found")
 
         if day_id:
-            day_exists = any(day.id == day_id for day in trip.days)
+            day_exists = await self.trip_access.has_day(trip_id, day_id)
             if not day_exists:
                 raise ValueError("Day not found in trip")
 
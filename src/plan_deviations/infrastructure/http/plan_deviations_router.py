@@ -1,16 +1,22 @@
-from fastapi import APIRouter, HTTPException, status, Depends
-from typing import List
+from fastapi import APIRouter, HTTPException, Query, Response, status, Depends
+from typing import List, Optional
 from src.plan_deviations.infrastructure.http.plan_deviations_schemas import RegisterPlanDeviationRequest, PlanDeviationResponse
 from src.plan_deviations.application.register_plan_deviation import RegisterPlanDeviation
 from src.plan_deviations.application.list_trip_deviations import ListTripDeviations
 from src.shared.infrastructure.security.authentication import get_current_user_id
+from src.shared.infrastructure.container import provide
+from src.shared.infrastructure.database.pagination import DEFAULT_PAGE_LIMIT, MAX_PAGE_LIMIT, NEXT_CURSOR_HEADER
 
 router = APIRouter(prefix="/trips/{trip_id}/plan-deviations", tags=["plan-deviations"])
 
 @router.post("/", response_model=PlanDeviationResponse)
-async def register_plan_deviation(trip_id: str, request: RegisterPlanDeviationRequest, user_id: str = Depends(get_current_user_id)):
+async def register_plan_deviation(
+    trip_id: str,
+    request: RegisterPlanDeviationRequest,
+    user_id: str = Depends(get_current_user_id),
+    register_deviation_uc: RegisterPlanDeviation = Depends(provide(RegisterPlanDeviation))
+):
     try:
-        register_deviation_uc = RegisterPlanDeviation()
         deviation = await register_deviation_uc.execute(
             trip_id=trip_id,
             day_id=request.day_id,
@@ -25,10 +31,19 @@ async def register_plan_deviation(trip_id: str, request: RegisterPlanDeviationRe
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 @router.get("/", response_model=List[PlanDeviationResponse])
-async def list_trip_deviations(trip_id: str, user_id: str = Depends(get_current_user_id)):
+async def list_trip_deviations(
+    trip_id: str,
+    response: Response,
+    limit: int = Query(DEFAULT_PAGE_LIMIT, ge=1, le=MAX_PAGE_LIMIT),
+    cursor: Optional[str] = Query(None),
+    day_id: Optional[str] = Query(None),
+    user_id: str = Depends(get_current_user_id),
+    list_deviations: ListTripDeviations = Depends(provide(ListTripDeviations))
+):
     try:
-        list_deviations = ListTripDeviations()
-        deviations = await list_deviations.execute(trip_id)
-        return [PlanDeviationResponse(**deviation.dict()) for deviation in deviations]
+        page = await list_deviations.execute(trip_id, limit, cursor, day_id=day_id)
+        if page.next_cursor:
+            response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+        return [PlanDeviationResponse(**deviation.dict()) for deviation in page.items]
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
\ No newline at end of file
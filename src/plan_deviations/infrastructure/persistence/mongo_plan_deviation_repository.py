@@ -1,8 +1,20 @@
-from typing import Optional, List
+from typing import Optional, List, Dict, Any
 from bson import ObjectId
+from pymongo import IndexModel, ASCENDING, DESCENDING
 from src.shared.infrastructure.database.mongo_client import get_database
+from src.shared.infrastructure.database.index_registry import index_registry, QueryShape
+from src.shared.infrastructure.database.pagination import Page, DEFAULT_PAGE_LIMIT, find_page, object_id_filter
+from src.shared.infrastructure.database.document_mapper import DocumentMapper, object_id, value
 from src.plan_deviations.domain.plan_deviation import PlanDeviation
 
+plan_deviation_mapper = DocumentMapper(PlanDeviation, {
+    "id": object_id("_id"),
+    "trip_id": object_id("tripId"),
+    "day_id": object_id("dayId"),
+    "activity_id": object_id("activityId"),
+    "is_deleted": value(aliases=("isDeleted",))
+})
+
 class MongoPlanDeviationRepository:
     def __init__(self):
         self.db = get_database()
@@ -57,6 +69,20 @@ class MongoPlanDeviationRepository:
             deviations.append(PlanDeviation(**doc))
         return deviations
 
+    async def find_page_by_trip_id(
+        self,
+        trip_id: str,
+        limit: int = DEFAULT_PAGE_LIMIT,
+        cursor: Optional[str] = None,
+        day_id: Optional[str] = None
+    ) -> Page:
+        query: Dict[str, Any] = {"tripId": ObjectId(trip_id), "isDeleted": {"$ne": True}}
+        if day_id:
+            query["dayId"] = object_id_filter(day_id, "day_id")
+
+        # Las desviaciones no guardan fecha; el _id conserva el orden de registro
+        return await find_page(self.collection, query, plan_deviation_mapper, "_id", -1, limit, cursor)
+
     async def find_by_day_id(self, day_id: str) -> List[PlanDeviation]:
         cursor = self.collection.find({
             "dayId": ObjectId(day_id),
@@ -95,4 +121,21 @@ class MongoPlanDeviationRepository:
             {"_id": ObjectId(deviation_id)},
             {"$set": {"isDeleted": True}}
         )
-        return result.modified_count > 0
\ No newline at end of file
+        return result.modified_count > 0
+
+index_registry.register(
+    "planRealityDeviations",
+    indexes=[
+        IndexModel([("tripId", ASCENDING), ("_id", DESCENDING)]),
+        IndexModel([("tripId", ASCENDING), ("dayId", ASCENDING), ("_id", DESCENDING)]),
+        IndexModel([("dayId", ASCENDING)]),
+        IndexModel([("activityId", ASCENDING)])
+    ],
+    query_shapes=[
+        QueryShape("find_by_trip_id", {"tripId": ObjectId(), "isDeleted": {"$ne": True}}),
+        QueryShape("find_page_by_trip_id", {"tripId": ObjectId(), "isDeleted": {"$ne": True}}, [("_id", -1)]),
+        QueryShape("find_page_by_trip_id_day", {"tripId": ObjectId(), "dayId": ObjectId(), "isDeleted": {"$ne": True}}, [("_id", -1)]),
+        QueryShape("find_by_day_id", {"dayId": ObjectId(), "isDeleted": {"$ne": True}}),
+        QueryShape("find_by_activity_id", {"activityId": ObjectId(), "isDeleted": {"$ne": True}})
+    ]
+)
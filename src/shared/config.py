@@ -10,12 +10,49 @@ class Settings(BaseSettings):
     
     mongodb_url: str
     mongodb_database: str
+    check_index_coverage: bool = False
     
     jwt_secret_key: str
     jwt_refresh_secret: str
     jwt_algorithm: str = "HS256"
     access_token_expire_minutes: int = 30
     refresh_token_expire_days: int = 7
+    admin_api_key: Optional[str] = None
+
+    user_auth_cache_ttl_seconds: int = 60
+    user_auth_cache_max_entries: int = 10000
+    subscription_cache_ttl_seconds: int = 300
+    subscription_cache_max_entries: int = 10000
+    trip_analytics_cache_ttl_seconds: int = 600
+    trip_analytics_cache_max_entries: int = 2000
+    trip_balances_cache_ttl_seconds: int = 600
+    trip_balances_cache_max_entries: int = 2000
+
+    render_pool_workers: int = 2
+    password_hash_rounds: int = 12
+    password_hash_workers: int = 4
+    password_hash_max_pending: int = 64
+    export_cache_dir: Optional[str] = None
+    export_cache_max_files: int = 500
+    export_cache_grace_seconds: int = 60
+    export_job_concurrency: int = 2
+    export_job_retention_hours: int = 24
+    export_job_stale_minutes: int = 30
+
+    fx_rate_cache_ttl_seconds: int = 3600
+    fx_rate_cache_max_entries: int = 100000
+
+    expense_import_max_rows: int = 10000
+
+    email_outbox_workers: int = 2
+    email_outbox_batch_size: int = 20
+    email_outbox_max_attempts: int = 6
+    email_outbox_retry_base_seconds: int = 30
+    email_outbox_retry_max_seconds: int = 3600
+    email_outbox_poll_seconds: int = 5
+    email_outbox_stale_minutes: int = 10
+    email_outbox_retention_days: int = 30
+    smtp_idle_timeout_seconds: int = 60
     
     smtp_host: Optional[str] = None
     smtp_port: Optional[int] = None
@@ -0,0 +1,28 @@
+from decimal import Decimal, ROUND_HALF_UP, InvalidOperation
+from typing import Any
+
+# Decimales de la unidad menor (ISO 4217); el resto de monedas usa 2
+MINOR_UNIT_EXPONENTS = {
+    "BIF": 0, "CLP": 0, "DJF": 0, "GNF": 0, "ISK": 0, "JPY": 0, "KMF": 0, "KRW": 0,
+    "PYG": 0, "RWF": 0, "UGX": 0, "UYI": 0, "VND": 0, "VUV": 0, "XAF": 0, "XOF": 0, "XPF": 0,
+    "BHD": 3, "IQD": 3, "JOD": 3, "KWD": 3, "LYD": 3, "OMR": 3, "TND": 3
+}
+DEFAULT_EXPONENT = 2
+
+def currency_exponent(currency: str) -> int:
+    return MINOR_UNIT_EXPONENTS.get((currency or "").upper(), DEFAULT_EXPONENT)
+
+def quantize_money(amount: Any, currency: str, strict: bool = True) -> Decimal:
+    try:
+        value = amount if isinstance(amount, Decimal) else Decimal(str(amount))
+    except InvalidOperation:
+        raise ValueError("Invalid amount")
+    if not value.is_finite():
+        raise ValueError("Invalid amount")
+
+    exponent = currency_exponent(currency)
+    rounded = value.quantize(Decimal(1).scaleb(-exponent), rounding=ROUND_HALF_UP)
+    # Con strict no se redondea en silencio lo que escribió el usuario
+    if strict and rounded != value:
+        raise ValueError(f"Amount {amount} has more than {exponent} decimals for {currency}")
+    return rounded
@@ -0,0 +1,28 @@
+from datetime import datetime
+from typing import Optional
+from pydantic import BaseModel
+from bson import ObjectId
+
+class OutboxEmailStatus:
+    PENDING = "pending"
+    SENDING = "sending"
+    SENT = "sent"
+    FAILED = "failed"
+
+class OutboxEmail(BaseModel):
+    id: Optional[str] = None
+    to_email: str
+    template_type: str
+    subject: str
+    html: str
+    status: str = OutboxEmailStatus.PENDING
+    attempts: int = 0
+    last_error: Optional[str] = None
+    next_attempt_at: datetime = datetime.utcnow()
+    created_at: datetime = datetime.utcnow()
+    finished_at: Optional[datetime] = None
+
+    class Config:
+        json_encoders = {
+            ObjectId: str
+        }
@@ -0,0 +1,16 @@
+import unicodedata
+from typing import List, Tuple
+
+def fold_with_offsets(text: str) -> Tuple[str, List[int]]:
+    # Quita acentos y pasa a minúsculas conservando la posición original de cada carácter
+    folded: List[str] = []
+    offsets: List[int] = []
+    for index, char in enumerate(text or ""):
+        decomposed = unicodedata.normalize("NFKD", char)
+        for base in "".join(c for c in decomposed if not unicodedata.combining(c)).lower():
+            folded.append(base)
+            offsets.append(index)
+    return "".join(folded), offsets
+
+def fold(text: str) -> str:
+    return fold_with_offsets(text)[0]
@@ -0,0 +1,42 @@
+from typing import Any, Callable, Dict, Type, TypeVar
+
+T = TypeVar("T")
+
+class Container:
+    def __init__(self):
+        self._instances: Dict[type, Any] = {}
+        self._factories: Dict[type, Callable[[], Any]] = {}
+        self._overrides: Dict[type, Any] = {}
+
+    def register(self, cls: Type[T], factory: Callable[[], T]) -> None:
+        self._factories[cls] = factory
+        self._instances.pop(cls, None)
+
+    def override(self, cls: Type[T], instance: T) -> None:
+        self._overrides[cls] = instance
+
+    def clear_overrides(self) -> None:
+        self._overrides.clear()
+
+    def get(self, cls: Type[T]) -> T:
+        if cls in self._overrides:
+            return self._overrides[cls]
+
+        instance = self._instances.get(cls)
+        if instance is None:
+            # Si la construcción falla no se guarda nada y se reintenta en la siguiente llamada
+            factory = self._factories.get(cls, cls)
+            instance = factory()
+            self._instances[cls] = instance
+        return instance
+
+    def reset(self) -> None:
+        self._instances.clear()
+
+container = Container()
+
+def provide(cls: Type[T]) -> Callable[[], T]:
+    def dependency() -> T:
+        return container.get(cls)
+    dependency.__name__ = f"provide_{cls.__name__}"
+    return dependency
\ No newline at end of file
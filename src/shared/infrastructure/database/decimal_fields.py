@@ -0,0 +1,22 @@
+from decimal import Decimal
+from typing import Any, Dict, Optional
+from bson import Decimal128
+
+def to_decimal128(value: Any) -> Optional[Decimal128]:
+    if value is None or isinstance(value, Decimal128):
+        return value
+    return Decimal128(value if isinstance(value, Decimal) else Decimal(str(value)))
+
+def to_decimal(raw: Any) -> Decimal:
+    # Acepta Decimal128 y también los float de documentos aún sin migrar
+    if isinstance(raw, Decimal128):
+        return raw.to_decimal()
+    return Decimal(str(raw or 0))
+
+def from_decimal128(raw: Any) -> Any:
+    # Los float y textos de documentos antiguos los convierte la validación del modelo
+    return raw.to_decimal() if isinstance(raw, Decimal128) else raw
+
+def decimal_sum(expression: Any) -> Dict[str, Any]:
+    # $toDecimal no cambia un Decimal128 y hace exacta la suma de los float antiguos
+    return {"$sum": {"$toDecimal": expression}}
@@ -0,0 +1,167 @@
+from datetime import date, datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
+from bson import ObjectId
+from pydantic import BaseModel
+from src.shared.infrastructure.database.decimal_fields import to_decimal128, from_decimal128
+
+_MISSING = object()
+
+class MappedField:
+    VALUE = "value"
+    OBJECT_ID = "object_id"
+    DATE = "date"
+    DECIMAL = "decimal"
+    NESTED = "nested"
+
+    def __init__(
+        self,
+        source: Optional[str] = None,
+        kind: str = VALUE,
+        default: Any = _MISSING,
+        mapper: Optional["DocumentMapper"] = None,
+        many: bool = False,
+        aliases: Tuple[str, ...] = ()
+    ):
+        self.source = source
+        self.kind = kind
+        self.default = default
+        self.mapper = mapper
+        self.many = many
+        self.aliases = aliases
+
+def object_id(source: Optional[str] = None, default: Any = _MISSING) -> MappedField:
+    return MappedField(source, MappedField.OBJECT_ID, default)
+
+def date_field(source: Optional[str] = None, default: Any = _MISSING) -> MappedField:
+    return MappedField(source, MappedField.DATE, default)
+
+def decimal_field(source: Optional[str] = None, default: Any = _MISSING) -> MappedField:
+    return MappedField(source, MappedField.DECIMAL, default)
+
+def nested(mapper: "DocumentMapper", source: Optional[str] = None, many: bool = True) -> MappedField:
+    return MappedField(source, MappedField.NESTED, [] if many else None, mapper, many)
+
+def value(source: Optional[str] = None, default: Any = _MISSING, aliases: Tuple[str, ...] = ()) -> MappedField:
+    return MappedField(source, MappedField.VALUE, default, aliases=aliases)
+
+def _write_object_id(raw: Any) -> Any:
+    return ObjectId(raw) if raw else None
+
+def _write_date(raw: Any) -> Any:
+    if isinstance(raw, date) and not isinstance(raw, datetime):
+        return datetime.combine(raw, datetime.min.time())
+    return raw
+
+def _write_decimal(raw: Any) -> Any:
+    # Decimal128 conserva el valor exacto y permite $sum en el servidor
+    return to_decimal128(raw)
+
+def _identity(raw: Any) -> Any:
+    return raw
+
+def _read_object_id(raw: Any) -> Any:
+    return str(raw) if raw is not None else None
+
+def _read_date(raw: Any) -> Any:
+    return raw.date() if isinstance(raw, datetime) else raw
+
+_READERS = {
+    MappedField.VALUE: None,
+    MappedField.OBJECT_ID: _read_object_id,
+    MappedField.DATE: _read_date,
+    MappedField.DECIMAL: from_decimal128
+}
+
+class DocumentMapper:
+    """Traduce documentos de Mongo a modelos de dominio y viceversa.
+
+    Los campos se renombran y convierten según el mapa declarado y el modelo
+    se arma con una sola llamada a model_validate. Las lecturas más usadas
+    pasan un reader escrito a mano, que evita recorrer el mapa en cada documento;
+    el mapa sigue definiendo las escrituras.
+    """
+
+    def __init__(
+        self,
+        model: Type[BaseModel],
+        fields: Optional[Dict[str, MappedField]] = None,
+        reader: Optional[Callable[[Dict[str, Any]], BaseModel]] = None
+    ):
+        self.model = model
+        self._reader = reader
+        declared = fields or {}
+
+        self._writers: List[Tuple[str, str, Callable[[Any], Any]]] = []
+        self._readers: List[Tuple[str, str, Tuple[str, ...], Optional[Callable[[Any], Any]], Optional[Callable[[], Any]]]] = []
+        for attr in model.model_fields:
+            field = declared.get(attr) or MappedField()
+            source = field.source or attr
+            self._writers.append((attr, source, self._compile_writer(field)))
+            read = self._compile_reader(field)
+            # Los campos que se guardan tal cual los toma model_validate directo del documento
+            if source != attr or read or field.aliases or field.default is not _MISSING:
+                self._readers.append((attr, source, field.aliases, read, self._compile_default(field)))
+
+    def to_domain(self, doc: Dict[str, Any]) -> BaseModel:
+        if self._reader is not None:
+            return self._reader(doc)
+        # Una sola validación para todo el documento, incluidos los modelos anidados;
+        # los campos ausentes toman el valor por defecto del modelo
+        return self.model.model_validate(self.to_values(doc))
+
+    def to_values(self, doc: Dict[str, Any]) -> Dict[str, Any]:
+        # El documento recién leído del driver se ajusta en su lugar, sin copiarlo;
+        # las claves que el modelo no declara (_id, nombres de Mongo) las ignora la validación
+        for attr, source, aliases, read, default in self._readers:
+            raw = doc.get(source, _MISSING)
+            # Documentos antiguos guardan algunos campos con otro nombre
+            for alias in aliases:
+                if raw is not _MISSING:
+                    break
+                raw = doc.get(alias, _MISSING)
+            if raw is not _MISSING:
+                doc[attr] = read(raw) if read else raw
+            elif default is not None:
+                doc[attr] = default()
+        return doc
+
+    def _compile_reader(self, field: MappedField) -> Optional[Callable[[Any], Any]]:
+        if field.kind != MappedField.NESTED:
+            return _READERS[field.kind]
+        mapper = field.mapper
+        if field.many:
+            return lambda raw: [mapper.to_values(item) for item in raw] if raw else []
+        return lambda raw: mapper.to_values(raw) if raw is not None else None
+
+    def _compile_default(self, field: MappedField) -> Optional[Callable[[], Any]]:
+        default = field.default
+        if default is _MISSING:
+            return None
+        if isinstance(default, (list, dict)):
+            return default.copy
+        if callable(default):
+            return default
+        return lambda: default
+
+    def _compile_writer(self, field: MappedField) -> Callable[[Any], Any]:
+        if field.kind == MappedField.OBJECT_ID:
+            return _write_object_id
+        if field.kind == MappedField.DATE:
+            return _write_date
+        if field.kind == MappedField.DECIMAL:
+            return _write_decimal
+        if field.kind == MappedField.NESTED:
+            mapper = field.mapper
+            if field.many:
+                return lambda raw: [mapper.to_document(item) for item in raw] if raw else []
+            return lambda raw: mapper.to_document(raw) if raw is not None else None
+        return _identity
+
+    def to_document(self, model: Any, exclude: Tuple[str, ...] = ()) -> Dict[str, Any]:
+        source_values = model if isinstance(model, dict) else model.__dict__
+        doc: Dict[str, Any] = {}
+        for attr, source, write in self._writers:
+            if attr in exclude or attr not in source_values:
+                continue
+            doc[source] = write(source_values[attr])
+        return doc
@@ -0,0 +1,85 @@
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import IndexModel
+from pymongo.errors import OperationFailure
+
+class QueryShape:
+    def __init__(
+        self,
+        name: str,
+        filter: Dict[str, Any],
+        sort: Optional[List[Tuple[str, int]]] = None
+    ):
+        self.name = name
+        self.filter = filter
+        self.sort = sort
+
+class IndexRegistry:
+    def __init__(self):
+        self._indexes: Dict[str, List[IndexModel]] = {}
+        self._query_shapes: Dict[str, List[QueryShape]] = {}
+
+    def register(
+        self,
+        collection: str,
+        indexes: List[IndexModel] = None,
+        query_shapes: List[QueryShape] = None
+    ) -> None:
+        self._indexes.setdefault(collection, []).extend(indexes or [])
+        self._query_shapes.setdefault(collection, []).extend(query_shapes or [])
+
+    @property
+    def collections(self) -> List[str]:
+        return sorted(set(self._indexes) | set(self._query_shapes))
+
+    async def apply(self, db: AsyncIOMotorDatabase) -> Dict[str, List[str]]:
+        created = {}
+        for collection, indexes in self._indexes.items():
+            if not indexes:
+                continue
+            try:
+                created[collection] = await db[collection].create_indexes(indexes)
+            except OperationFailure as e:
+                timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                print(f"[{timestamp}] [INDEX_REGISTRY] [ERROR] Failed to create indexes on {collection}: {str(e)}")
+        return created
+
+    async def find_collection_scans(self, db: AsyncIOMotorDatabase) -> List[Dict[str, Any]]:
+        violations = []
+        for collection, shapes in self._query_shapes.items():
+            for shape in shapes:
+                command = {"find": collection, "filter": shape.filter}
+                if shape.sort:
+                    command["sort"] = dict(shape.sort)
+                explain = await db.command("explain", command, verbosity="queryPlanner")
+                winning_plan = explain.get("queryPlanner", {}).get("winningPlan", {})
+                stages = _collect_stages(winning_plan)
+                if "COLLSCAN" in stages:
+                    violations.append({
+                        "collection": collection,
+                        "query": shape.name,
+                        "stages": stages
+                    })
+        return violations
+
+    async def verify(self, db: AsyncIOMotorDatabase) -> None:
+        violations = await self.find_collection_scans(db)
+        if violations:
+            details = ", ".join(f"{v['collection']}.{v['query']}" for v in violations)
+            raise RuntimeError(f"Queries served by collection scans: {details}")
+
+def _collect_stages(plan: Dict[str, Any]) -> List[str]:
+    # Los planes de explain anidan etapas en inputStage/inputStages (y queryPlan en SBE)
+    stages = []
+    if "stage" in plan:
+        stages.append(plan["stage"])
+    if "queryPlan" in plan:
+        stages.extend(_collect_stages(plan["queryPlan"]))
+    if "inputStage" in plan:
+        stages.extend(_collect_stages(plan["inputStage"]))
+    for child in plan.get("inputStages", []):
+        stages.extend(_collect_stages(child))
+    return stages
+
+index_registry = IndexRegistry()
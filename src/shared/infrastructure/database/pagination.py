@@ -0,0 +1,107 @@
+import base64
+import binascii
+from datetime import date, datetime, timedelta
+from typing import Any, AsyncIterator, Dict, Generic, List, Optional, Tuple, TypeVar
+from bson import ObjectId, json_util
+from motor.motor_asyncio import AsyncIOMotorCollection, AsyncIOMotorCursor
+from src.shared.infrastructure.database.document_mapper import DocumentMapper
+
+DEFAULT_PAGE_LIMIT = 50
+MAX_PAGE_LIMIT = 200
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+T = TypeVar("T")
+
+class Page(Generic[T]):
+    def __init__(self, items: List[T], next_cursor: Optional[str] = None):
+        self.items = items
+        self.next_cursor = next_cursor
+
+def encode_cursor(sort_field: str, sort_value: Any, document_id: ObjectId) -> str:
+    raw = json_util.dumps({"k": sort_field, "v": sort_value, "id": document_id})
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+def decode_cursor(cursor: str, sort_field: str) -> Tuple[Any, ObjectId]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        data = json_util.loads(base64.urlsafe_b64decode(padded.encode()).decode())
+    except (binascii.Error, UnicodeDecodeError, ValueError, TypeError):
+        raise ValueError("Invalid cursor")
+
+    # Un cursor solo es válido para el orden con el que se generó
+    if not isinstance(data, dict) or data.get("k") != sort_field or not isinstance(data.get("id"), ObjectId):
+        raise ValueError("Invalid cursor")
+    return data.get("v"), data["id"]
+
+def object_id_filter(value: str, name: str) -> ObjectId:
+    if not ObjectId.is_valid(value):
+        raise ValueError(f"Invalid {name}")
+    return ObjectId(value)
+
+def date_range_filter(start_date: Optional[date] = None, end_date: Optional[date] = None) -> Optional[Dict[str, datetime]]:
+    condition = {}
+    if start_date:
+        condition["$gte"] = datetime.combine(start_date, datetime.min.time())
+    if end_date:
+        # El día final es inclusivo aunque el campo guarde hora
+        condition["$lt"] = datetime.combine(end_date + timedelta(days=1), datetime.min.time())
+    return condition or None
+
+def keyset_filter(sort_field: str, direction: int, sort_value: Any, document_id: ObjectId, nullable: bool = False) -> Dict[str, Any]:
+    after = "$lt" if direction < 0 else "$gt"
+    if sort_field == "_id":
+        return {"_id": {after: document_id}}
+
+    if sort_value is None:
+        # En Mongo los nulos van al final de un orden descendente y al inicio de uno ascendente
+        same_null = {sort_field: None, "_id": {after: document_id}}
+        if direction < 0:
+            return same_null
+        return {"$or": [same_null, {sort_field: {"$ne": None}}]}
+
+    branches = [
+        {sort_field: {after: sort_value}},
+        {sort_field: sort_value, "_id": {after: document_id}}
+    ]
+    if nullable and direction < 0:
+        branches.append({sort_field: None})
+    return {"$or": branches}
+
+async def find_page(
+    collection: AsyncIOMotorCollection,
+    query: Dict[str, Any],
+    mapper: DocumentMapper,
+    sort_field: str,
+    direction: int = -1,
+    limit: int = DEFAULT_PAGE_LIMIT,
+    cursor: Optional[str] = None,
+    nullable: bool = False
+) -> Page:
+    limit = max(1, min(limit, MAX_PAGE_LIMIT))
+
+    if cursor:
+        sort_value, document_id = decode_cursor(cursor, sort_field)
+        query = {**query, "$and": query.get("$and", []) + [keyset_filter(sort_field, direction, sort_value, document_id, nullable)]}
+
+    sort = [(sort_field, direction)]
+    if sort_field != "_id":
+        sort.append(("_id", direction))
+
+    # Se pide un documento extra para saber si hay otra página
+    docs = await collection.find(query).sort(sort).limit(limit + 1).to_list(length=limit + 1)
+
+    next_cursor = None
+    if len(docs) > limit:
+        docs = docs[:limit]
+        last = docs[-1]
+        next_cursor = encode_cursor(sort_field, last.get(sort_field), last["_id"])
+
+    return Page([mapper.to_domain(doc) for doc in docs], next_cursor)
+
+async def iter_batches(cursor: AsyncIOMotorCursor, batch_size: int) -> AsyncIterator[List[Dict[str, Any]]]:
+    # Cada lote es una sola ida al servidor; nunca hay más de un lote en memoria
+    while True:
+        docs = await cursor.to_list(length=batch_size)
+        if not docs:
+            break
+        yield docs
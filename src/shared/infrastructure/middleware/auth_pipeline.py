@@ -0,0 +1,52 @@
+from typing import Dict, List, Optional
+from starlette.datastructures import MutableHeaders
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from src.shared.infrastructure.security.principal import Principal, extract_bearer_token, resolve_principal
+from src.shared.infrastructure.request_scope import request_scope
+
+class RequestPolicy:
+    async def check(self, request: Request, principal: Optional[Principal]) -> Optional[Response]:
+        return None
+
+    def response_headers(self) -> Dict[str, str]:
+        return {}
+
+class AuthPipelineMiddleware:
+    def __init__(self, app: ASGIApp, policies: List[RequestPolicy] = None):
+        self.app = app
+        self.policies = policies or []
+
+        self.response_headers: Dict[str, str] = {}
+        for policy in self.policies:
+            self.response_headers.update(policy.response_headers())
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope)
+        token = extract_bearer_token(request.headers.get("Authorization"))
+        principal = resolve_principal(token)
+
+        # El token se decodifica una sola vez; las dependencias leen el principal del state
+        request.state.bearer_token = token
+        request.state.principal = principal
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start" and self.response_headers:
+                headers = MutableHeaders(scope=message)
+                for name, value in self.response_headers.items():
+                    headers[name] = value
+            await send(message)
+
+        with request_scope():
+            for policy in self.policies:
+                response = await policy.check(request, principal)
+                if response is not None:
+                    await response(scope, receive, send_with_headers)
+                    return
+
+            await self.app(scope, receive, send_with_headers)
@@ -1,19 +1,18 @@
-from fastapi import Request
-from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
+from typing import Dict
+from src.shared.infrastructure.middleware.auth_pipeline import RequestPolicy
 from src.shared.config import settings
 
-class SecurityMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        response = await call_next(request)
-        
+class SecurityHeadersPolicy(RequestPolicy):
+    def response_headers(self) -> Dict[str, str]:
+        headers = {}
+
         if settings.environment == "production":
-            response.headers["X-Content-Type-Options"] = "nosniff"
-            response.headers["X-Frame-Options"] = "DENY"
-            response.headers["X-XSS-Protection"] = "1; mode=block"
-            response.headers["Strict-Transport-Security"] = "max-age=31536000; includeSubDomains"
-            response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
-            
-        response.headers["X-API-Version"] = settings.app_version
-        
-        return response
\ No newline at end of file
+            headers["X-Content-Type-Options"] = "nosniff"
+            headers["X-Frame-Options"] = "DENY"
+            headers["X-XSS-Protection"] = "1; mode=block"
+            headers["Strict-Transport-Security"] = "max-age=31536000; includeSubDomains"
+            headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
+
+        headers["X-API-Version"] = settings.app_version
+
+        return headers
@@ -0,0 +1,102 @@
+import uuid
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+from bson import ObjectId
+from pymongo import IndexModel, UpdateOne, ASCENDING
+from src.shared.config import settings
+from src.shared.domain.outbox_email import OutboxEmail, OutboxEmailStatus
+from src.shared.infrastructure.database.mongo_client import get_database
+from src.shared.infrastructure.database.index_registry import index_registry, QueryShape
+from src.shared.infrastructure.database.document_mapper import DocumentMapper, object_id, value
+
+outbox_email_mapper = DocumentMapper(OutboxEmail, {
+    "id": object_id("_id"),
+    "to_email": value("to"),
+    "template_type": value("templateType"),
+    "last_error": value("lastError", default=None),
+    "next_attempt_at": value("nextAttemptAt"),
+    "created_at": value("createdAt"),
+    "finished_at": value("finishedAt", default=None)
+})
+
+class MongoEmailOutboxRepository:
+    def __init__(self):
+        self.db = get_database()
+        self.collection = self.db.emailOutbox
+
+    async def enqueue(self, email: OutboxEmail) -> OutboxEmail:
+        email_dict = outbox_email_mapper.to_document(email, exclude=("id",))
+        result = await self.collection.insert_one(email_dict)
+        email.id = str(result.inserted_id)
+        return email
+
+    async def claim_batch(self, limit: int) -> List[OutboxEmail]:
+        now = datetime.utcnow()
+        docs = await self.collection.find(
+            {"status": OutboxEmailStatus.PENDING, "nextAttemptAt": {"$lte": now}},
+            {"_id": 1}
+        ).sort("nextAttemptAt", 1).limit(limit).to_list(length=limit)
+        if not docs:
+            return []
+
+        # El filtro por estado hace atómico el reclamo: si otro worker tomó un correo, no se repite
+        lock = uuid.uuid4().hex
+        await self.collection.update_many(
+            {"_id": {"$in": [doc["_id"] for doc in docs]}, "status": OutboxEmailStatus.PENDING},
+            {"$set": {"status": OutboxEmailStatus.SENDING, "lockId": lock, "lockedAt": now}, "$inc": {"attempts": 1}}
+        )
+        cursor = self.collection.find({"lockId": lock, "status": OutboxEmailStatus.SENDING})
+        return [outbox_email_mapper.to_domain(doc) async for doc in cursor]
+
+    async def record_results(self, emails: List[OutboxEmail], errors: List[Optional[str]]) -> None:
+        now = datetime.utcnow()
+        operations = []
+        for email, error in zip(emails, errors):
+            if error is None:
+                update = {"status": OutboxEmailStatus.SENT, "finishedAt": now, "lastError": None}
+            elif email.attempts >= settings.email_outbox_max_attempts:
+                update = {"status": OutboxEmailStatus.FAILED, "finishedAt": now, "lastError": error}
+            else:
+                # Backoff exponencial: 30s, 1m, 2m, 4m... con tope
+                delay = min(
+                    settings.email_outbox_retry_base_seconds * 2 ** (email.attempts - 1),
+                    settings.email_outbox_retry_max_seconds
+                )
+                update = {
+                    "status": OutboxEmailStatus.PENDING,
+                    "nextAttemptAt": now + timedelta(seconds=delay),
+                    "lastError": error
+                }
+            operations.append(UpdateOne(
+                {"_id": ObjectId(email.id)},
+                {"$set": update, "$unset": {"lockId": "", "lockedAt": ""}}
+            ))
+        if operations:
+            await self.collection.bulk_write(operations, ordered=False)
+
+    async def release_stale(self, locked_before: datetime) -> int:
+        # Correos reclamados por un proceso que terminó antes de registrar el resultado
+        result = await self.collection.update_many(
+            {"status": OutboxEmailStatus.SENDING, "lockedAt": {"$lt": locked_before}},
+            {"$set": {"status": OutboxEmailStatus.PENDING, "nextAttemptAt": datetime.utcnow()}, "$unset": {"lockId": "", "lockedAt": ""}}
+        )
+        return result.modified_count
+
+    async def count_by_status(self) -> Dict[str, int]:
+        cursor = self.collection.aggregate([{"$group": {"_id": "$status", "count": {"$sum": 1}}}])
+        return {doc["_id"]: doc["count"] async for doc in cursor}
+
+index_registry.register(
+    "emailOutbox",
+    indexes=[
+        IndexModel([("status", ASCENDING), ("nextAttemptAt", ASCENDING)]),
+        IndexModel([("lockId", ASCENDING)], sparse=True),
+        IndexModel([("status", ASCENDING), ("lockedAt", ASCENDING)]),
+        IndexModel([("finishedAt", ASCENDING)], expireAfterSeconds=settings.email_outbox_retention_days * 86400)
+    ],
+    query_shapes=[
+        QueryShape("claim_batch", {"status": OutboxEmailStatus.PENDING, "nextAttemptAt": {"$lte": datetime(2025, 1, 1)}}, [("nextAttemptAt", 1)]),
+        QueryShape("claimed_batch", {"lockId": "lock", "status": OutboxEmailStatus.SENDING}),
+        QueryShape("release_stale", {"status": OutboxEmailStatus.SENDING, "lockedAt": {"$lt": datetime(2025, 1, 1)}})
+    ]
+)
@@ -0,0 +1,20 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, Optional
+
+_request_memo: ContextVar[Optional[Dict[str, Dict[Any, Any]]]] = ContextVar("request_memo", default=None)
+
+@contextmanager
+def request_scope() -> Iterator[None]:
+    token = _request_memo.set({})
+    try:
+        yield
+    finally:
+        _request_memo.reset(token)
+
+def request_memo(namespace: str) -> Dict[Any, Any]:
+    memo = _request_memo.get()
+    if memo is None:
+        # Fuera de una request (scheduler, scripts) no se memoiza nada
+        return {}
+    return memo.setdefault(namespace, {})
\ No newline at end of file
@@ -1,24 +1,62 @@
-from datetime import datetime, timedelta
+import hmac
+import math
+from datetime import datetime, timedelta, timezone
 from typing import Optional, Dict, Any
 from jose import JWTError, jwt
-from fastapi import HTTPException, status, Depends
+from fastapi import HTTPException, Header, Request, status, Depends
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from src.shared.config import settings
 
 security = HTTPBearer()
 
+def build_token_claims(
+    user_id: str,
+    email: str,
+    email_verified: bool,
+    plan: str,
+    claims_version: int,
+    plan_expires_at: Optional[datetime] = None
+) -> Dict[str, Any]:
+    claims = {
+        "sub": user_id,
+        "email": email,
+        "email_verified": email_verified,
+        "plan": plan,
+        "cv": claims_version
+    }
+    if plan_expires_at:
+        claims["plan_exp"] = int(plan_expires_at.replace(tzinfo=timezone.utc).timestamp())
+    return claims
+
+def _issued_at(now: datetime) -> float:
+    # Truncado al milisegundo, la misma precisión con la que Mongo guarda la marca de agua de revocación
+    return math.floor(now.replace(tzinfo=timezone.utc).timestamp() * 1000) / 1000
+
 def create_access_token(data: Dict[str, Any]) -> str:
     to_encode = data.copy()
-    expire = datetime.utcnow() + timedelta(minutes=settings.access_token_expire_minutes)
-    to_encode.update({"exp": expire, "type": "access"})
+    now = datetime.utcnow()
+    expire = now + timedelta(minutes=settings.access_token_expire_minutes)
+    to_encode.update({"exp": expire, "iat": _issued_at(now), "type": "access"})
     return jwt.encode(to_encode, settings.jwt_secret_key, algorithm=settings.jwt_algorithm)
 
 def create_refresh_token(data: Dict[str, Any]) -> str:
-    to_encode = data.copy()
-    expire = datetime.utcnow() + timedelta(days=settings.refresh_token_expire_days)
-    to_encode.update({"exp": expire, "type": "refresh"})
+    to_encode = {"sub": data["sub"], "email": data.get("email")}
+    now = datetime.utcnow()
+    expire = now + timedelta(days=settings.refresh_token_expire_days)
+    to_encode.update({"exp": expire, "iat": _issued_at(now), "type": "refresh"})
     return jwt.encode(to_encode, settings.jwt_refresh_secret, algorithm=settings.jwt_algorithm)
 
+def is_token_revoked(payload: Dict[str, Any], tokens_valid_after: Optional[datetime]) -> bool:
+    if not tokens_valid_after:
+        return False
+    issued_at = payload.get("iat")
+    if issued_at is None:
+        return True
+    # Un token emitido en el mismo milisegundo que la revocación también queda revocado;
+    # los emitidos antes con iat en segundos enteros quedan del lado revocado
+    watermark = tokens_valid_after.replace(tzinfo=timezone.utc).timestamp()
+    return issued_at <= watermark
+
 def verify_token(token: str, secret_key: str) -> Optional[Dict[str, Any]]:
     try:
         payload = jwt.decode(token, secret_key, algorithms=[settings.jwt_algorithm])
@@ -26,7 +64,17 @@ def verify_token(token: str, secret_key: str) -> Optional[Dict[str, Any]]:
     except JWTError:
         return None
 
-def get_current_user_id(credentials: HTTPAuthorizationCredentials = Depends(security)) -> str:
+def get_current_user_id(request: Request, credentials: HTTPAuthorizationCredentials = Depends(security)) -> str:
+    # AuthPipelineMiddleware ya decodificó el token; solo se decodifica aquí si no corrió
+    if hasattr(request.state, "principal"):
+        principal = request.state.principal
+        if not principal or principal.token != credentials.credentials:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid token"
+            )
+        return principal.user_id
+
     payload = verify_token(credentials.credentials, settings.jwt_secret_key)
     if not payload or payload.get("type") != "access":
         raise HTTPException(
@@ -39,4 +87,17 @@ def get_current_user_id(credentials: HTTPAuthorizationCredentials = Depends(secu
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid token"
         )
-    return user_id
\ No newline at end of file
+    return user_id
+
+def require_admin_key(x_admin_key: Optional[str] = Header(None)) -> None:
+    # Sin clave configurada los endpoints administrativos quedan cerrados
+    if not settings.admin_api_key:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin access is not configured"
+        )
+    if not x_admin_key or not hmac.compare_digest(x_admin_key.encode(), settings.admin_api_key.encode()):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid admin key"
+        )
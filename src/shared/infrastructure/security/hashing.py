@@ -1,9 +1,62 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional, Tuple
 from passlib.context import CryptContext
+from src.shared.config import settings
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Con min y max iguales al costo, passlib marca para rehash cualquier hash con otro costo
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__default_rounds=settings.password_hash_rounds,
+    bcrypt__min_rounds=settings.password_hash_rounds,
+    bcrypt__max_rounds=settings.password_hash_rounds
+)
 
-def hash_password(password: str) -> str:
-    return pwd_context.hash(password)
+class PasswordHasherBusy(Exception):
+    pass
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
\ No newline at end of file
+class PasswordHasher:
+    """Ejecuta bcrypt en un pool de hilos propio para no bloquear el event loop.
+
+    bcrypt libera el GIL, así que los hilos trabajan en paralelo. Si ya hay
+    demasiadas operaciones en espera se rechaza la nueva en lugar de encolarla
+    sin límite.
+    """
+
+    def __init__(self, max_workers: int, max_pending: int):
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending = 0
+
+    async def hash(self, password: str) -> str:
+        return await self._run(pwd_context.hash, password)
+
+    async def verify(self, password: str, hashed_password: str) -> bool:
+        return await self._run(pwd_context.verify, password, hashed_password)
+
+    async def verify_and_update(self, password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+        # Devuelve un hash nuevo solo si el guardado usa otro costo o un esquema obsoleto
+        return await self._run(pwd_context.verify_and_update, password, hashed_password)
+
+    async def _run(self, func: Callable[..., Any], *args: Any) -> Any:
+        if self._pending >= self.max_pending:
+            raise PasswordHasherBusy("Too many authentication requests, try again shortly")
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="password-hasher")
+
+        self._pending += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, func, *args)
+        finally:
+            self._pending -= 1
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+password_hasher = PasswordHasher(settings.password_hash_workers, settings.password_hash_max_pending)
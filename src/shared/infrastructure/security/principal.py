@@ -0,0 +1,61 @@
+import time
+from typing import Optional, Dict, Any
+from src.shared.infrastructure.security.authentication import verify_token
+from src.shared.config import settings
+
+class Principal:
+    def __init__(self, user_id: str, email: Optional[str], token: str, claims: Dict[str, Any]):
+        self.user_id = user_id
+        self.email = email
+        self.token = token
+        self.claims = claims
+
+    @property
+    def email_verified(self) -> bool:
+        return self.claims.get("email_verified") is True
+
+    @property
+    def plan(self) -> Optional[str]:
+        return self.claims.get("plan")
+
+    @property
+    def claims_version(self) -> Optional[int]:
+        return self.claims.get("cv")
+
+    def has_current_claims(self, claims_version: int) -> bool:
+        return self.claims_version is not None and self.claims_version >= claims_version
+
+    def has_active_plan(self, plan: str) -> bool:
+        if self.plan != plan:
+            return False
+        plan_expires_at = self.claims.get("plan_exp")
+        return plan_expires_at is None or plan_expires_at > time.time()
+
+def extract_bearer_token(authorization: Optional[str]) -> Optional[str]:
+    if not authorization:
+        return None
+    # El esquema no distingue mayúsculas (RFC 7235), igual que HTTPBearer
+    parts = authorization.strip().split(None, 1)
+    if len(parts) != 2 or parts[0].lower() != "bearer":
+        return None
+    token = parts[1].strip()
+    return token or None
+
+def resolve_principal(token: Optional[str]) -> Optional[Principal]:
+    if not token:
+        return None
+
+    payload = verify_token(token, settings.jwt_secret_key)
+    if not payload or payload.get("type") != "access":
+        return None
+
+    user_id = payload.get("sub")
+    if not user_id:
+        return None
+
+    return Principal(
+        user_id=user_id,
+        email=payload.get("email"),
+        token=token,
+        claims=payload
+    )
@@ -0,0 +1,36 @@
+from datetime import datetime
+from fastapi import Request, status
+from fastapi.responses import JSONResponse
+from typing import Optional
+from src.auth.infrastructure.persistence.user_auth_facts_cache import user_auth_facts_cache
+from src.shared.infrastructure.middleware.auth_pipeline import RequestPolicy
+from src.shared.infrastructure.security.authentication import is_token_revoked
+from src.shared.infrastructure.security.principal import Principal
+
+class TokenRevocationPolicy(RequestPolicy):
+    async def check(self, request: Request, principal: Optional[Principal]) -> Optional[JSONResponse]:
+        request.state.auth_facts = None
+        if principal is None:
+            return None
+
+        try:
+            facts = await user_auth_facts_cache.get(principal.user_id)
+        except Exception as e:
+            # Sin poder consultar al usuario no se sabe si el token sigue vigente: no es culpa del cliente
+            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            print(f"[{timestamp}] [TOKEN_REVOCATION] [ERROR] Auth facts lookup failed for user {principal.user_id}: {str(e)}")
+            return JSONResponse(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                content={"detail": "Servicio no disponible temporalmente"},
+                headers={"Retry-After": "1"}
+            )
+
+        if not facts.exists or facts.is_deleted or is_token_revoked(principal.claims, facts.tokens_valid_after):
+            return JSONResponse(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                content={"detail": "Token revocado"}
+            )
+
+        # Las políticas siguientes reutilizan estos hechos sin volver a consultar
+        request.state.auth_facts = facts
+        return None
\ No newline at end of file
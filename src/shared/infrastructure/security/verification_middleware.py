@@ -1,16 +1,12 @@
-from fastapi import Request, HTTPException, status
+from fastapi import Request, status
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
 from typing import Set, Optional
-from src.auth.infrastructure.persistence.mongo_user_repository import MongoUserRepository
-from src.shared.infrastructure.security.authentication import verify_token
-from src.shared.config import settings
+from src.auth.infrastructure.persistence.user_auth_facts_cache import user_auth_facts_cache
+from src.shared.infrastructure.middleware.auth_pipeline import RequestPolicy
+from src.shared.infrastructure.security.principal import Principal
 
-class EmailVerificationMiddleware(BaseHTTPMiddleware):
-    def __init__(self, app):
-        super().__init__(app)
-        self._user_repository: Optional[MongoUserRepository] = None
-        
+class EmailVerificationPolicy(RequestPolicy):
+    def __init__(self):
         self.public_endpoints: Set[str] = {
             "/",
             "/health",
@@ -18,94 +14,80 @@ class EmailVerificationMiddleware(BaseHTTPMiddleware):
             "/openapi.json",
             "/redoc"
         }
-        
+
         self.auth_no_verification: Set[str] = {
             "/auth/register",
-            "/auth/login", 
+            "/auth/login",
+            "/auth/refresh",
             "/auth/send-verification",
             "/auth/verify-email",
             "/auth/send-password-reset",
             "/auth/reset-password",
             "/auth/profile"
         }
-        
-        self.protected_prefixes = [
+
+        self.protected_prefixes = (
             "/trips",
-            "/friendships", 
+            "/friendships",
             "/auth/upload-profile-photo",
             "/auth/search"
-        ]
-
-    @property
-    def user_repository(self) -> MongoUserRepository:
-        if self._user_repository is None:
-            self._user_repository = MongoUserRepository()
-        return self._user_repository
+        )
 
-    async def dispatch(self, request: Request, call_next):
+    async def check(self, request: Request, principal: Optional[Principal]) -> Optional[JSONResponse]:
         path = request.url.path
-        method = request.method
-        
+
         # Permitir rutas públicas
         if path in self.public_endpoints:
-            return await call_next(request)
-            
+            return None
+
         # Permitir rutas auth sin verificación
         if path in self.auth_no_verification:
-            return await call_next(request)
-            
+            return None
+
         # Verificar si requiere email verificado
-        needs_verification = any(
-            path.startswith(prefix) for prefix in self.protected_prefixes
-        )
-        
-        if needs_verification:
-            # Extraer token del header Authorization
-            auth_header = request.headers.get("Authorization")
-            if not auth_header or not auth_header.startswith("Bearer "):
-                return JSONResponse(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    content={"detail": "Requiere Autorización"}
-                )
-                
-            token = auth_header.split(" ")[1]
-            payload = verify_token(token, settings.jwt_secret_key)
-            
-            if not payload or payload.get("type") != "access":
-                return JSONResponse(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    content={"detail": "Token Invalido"}
-                )
-                
-            user_id = payload.get("sub")
-            if not user_id:
+        if not path.startswith(self.protected_prefixes):
+            return None
+
+        if not request.state.bearer_token:
+            return JSONResponse(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                content={"detail": "Requiere Autorización"}
+            )
+
+        if principal is None:
+            return JSONResponse(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                content={"detail": "Token Invalido"}
+            )
+
+        # El claim firmado evita la consulta; sin él se usan los hechos del usuario
+        if principal.email_verified:
+            return None
+
+        # Verificar email verificado
+        try:
+            facts = getattr(request.state, "auth_facts", None)
+            if facts is None:
+                facts = await user_auth_facts_cache.get(principal.user_id)
+            if not facts.exists or facts.is_deleted:
                 return JSONResponse(
                     status_code=status.HTTP_401_UNAUTHORIZED,
-                    content={"detail": "Token Invalido"}
+                    content={"detail": "User not found"}
                 )
-                
-            # Verificar email verificado
-            try:
-                user = await self.user_repository.find_by_id(user_id)
-                if not user:
-                    return JSONResponse(
-                        status_code=status.HTTP_401_UNAUTHORIZED,
-                        content={"detail": "User not found"}
-                    )
-                    
-                if not user.email_verified:
-                    return JSONResponse(
-                        status_code=status.HTTP_403_FORBIDDEN,
-                        content={
-                            "detail": "Requiere Verificación de Email",
-                            "message": "Porfavor verifique su Email para poder seguir disfrutando",
-                            "verification_required": True
-                        }
-                    )
-            except Exception as e:
+
+            if not facts.email_verified:
                 return JSONResponse(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    content={"detail": "El checkout de la verificación a fallado"}
+                    status_code=status.HTTP_403_FORBIDDEN,
+                    content={
+                        "detail": "Requiere Verificación de Email",
+                        "message": "Porfavor verifique su Email para poder seguir disfrutando",
+                        "verification_required": True
+                    }
                 )
-        
-        return await call_next(request)
\ No newline at end of file
+        except Exception as e:
+            return JSONResponse(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                content={"detail": "El checkout de la verificación a fallado"}
+            )
+
+        return None
@@ -0,0 +1,89 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import List, Optional, Set
+from src.shared.config import settings
+from src.shared.infrastructure.container import container
+from src.shared.infrastructure.persistence.mongo_email_outbox_repository import MongoEmailOutboxRepository
+from src.shared.infrastructure.services.smtp_sender import SmtpSender
+
+class EmailOutboxWorker:
+    """Envía en segundo plano los correos encolados en emailOutbox.
+
+    Cada worker reclama un lote, lo envía por su propia conexión SMTP en un
+    hilo y registra el resultado. Los handlers solo encolan y avisan.
+    """
+
+    def __init__(self):
+        self.repository = container.get(MongoEmailOutboxRepository)
+        self._wakeup = asyncio.Event()
+        self._tasks: Set[asyncio.Task] = set()
+        self._senders: List[SmtpSender] = []
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._last_stale_check: Optional[float] = None
+
+    async def start(self) -> None:
+        if self._tasks:
+            return
+        await self._release_stale()
+        self._executor = ThreadPoolExecutor(max_workers=settings.email_outbox_workers, thread_name_prefix="email-outbox")
+        for _ in range(settings.email_outbox_workers):
+            sender = SmtpSender()
+            self._senders.append(sender)
+            task = asyncio.ensure_future(self._work(sender))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    def notify(self) -> None:
+        self._wakeup.set()
+
+    async def stop(self) -> None:
+        for task in list(self._tasks):
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        if self._executor is not None:
+            loop = asyncio.get_running_loop()
+            for sender in self._senders:
+                await loop.run_in_executor(self._executor, sender.close)
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        self._senders = []
+
+    async def _work(self, sender: SmtpSender) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            try:
+                self._wakeup.clear()
+                batch = await self.repository.claim_batch(settings.email_outbox_batch_size)
+                if batch:
+                    errors = await loop.run_in_executor(self._executor, sender.send_batch, batch)
+                    await self.repository.record_results(batch, errors)
+                    for email, error in zip(batch, errors):
+                        if error:
+                            self._log_error(f"Failed to send email to {email.to_email} (attempt {email.attempts}): {error}")
+                    continue
+
+                await loop.run_in_executor(self._executor, sender.close_if_idle)
+                await self._release_stale()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=settings.email_outbox_poll_seconds)
+                except asyncio.TimeoutError:
+                    pass
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self._log_error(f"Outbox worker error: {str(e)}")
+                await asyncio.sleep(settings.email_outbox_poll_seconds)
+
+    async def _release_stale(self) -> None:
+        # Como mucho una vez por minuto entre todos los workers del proceso
+        if self._last_stale_check is not None and time.monotonic() - self._last_stale_check < 60:
+            return
+        self._last_stale_check = time.monotonic()
+        cutoff = datetime.utcnow() - timedelta(minutes=settings.email_outbox_stale_minutes)
+        await self.repository.release_stale(cutoff)
+
+    def _log_error(self, message: str) -> None:
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        print(f"[{timestamp}] [EMAIL_OUTBOX] [ERROR] {message}")
@@ -1,21 +1,16 @@
-import smtplib
 import random
 from datetime import datetime, timedelta
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
 from typing import Dict, Any
-from src.shared.config import settings
+from src.shared.domain.outbox_email import OutboxEmail
+from src.shared.infrastructure.container import container
+from src.shared.infrastructure.persistence.mongo_email_outbox_repository import MongoEmailOutboxRepository
+from src.shared.infrastructure.services.email_outbox_worker import EmailOutboxWorker
 from src.shared.infrastructure.templates.email_templates import EmailTemplates
 from src.shared.infrastructure.templates.email_subjects import EmailSubjects
 
 class EmailService:
     def __init__(self):
-        self.smtp_host = settings.smtp_host
-        self.smtp_port = settings.smtp_port
-        self.smtp_user = settings.smtp_user
-        self.smtp_pass = settings.smtp_pass
-        self.from_email = settings.from_email
-        self.from_name = settings.from_name
+        self.outbox_repository = container.get(MongoEmailOutboxRepository)
         self.templates = EmailTemplates()
         self.subjects = EmailSubjects()
 
@@ -36,27 +31,21 @@ class EmailService:
         template_data: Dict[str, Any]
     ) -> bool:
         try:
-            subject = self.subjects.get_subject(template_type)
-            html_content = self.templates.get_template(template_type, template_data)
-
-            msg = MIMEMultipart('alternative')
-            msg['Subject'] = subject
-            msg['From'] = f"{self.from_name} <{self.from_email}>"
-            msg['To'] = to_email
-
-            html_part = MIMEText(html_content, 'html')
-            msg.attach(html_part)
-
-            with smtplib.SMTP(self.smtp_host, self.smtp_port) as server:
-                server.starttls()
-                server.login(self.smtp_user, self.smtp_pass)
-                server.send_message(msg)
-
+            # Se renderiza al encolar; el envío lo hace el worker del outbox con reintentos
+            await self.outbox_repository.enqueue(OutboxEmail(
+                to_email=to_email,
+                template_type=template_type,
+                subject=self.subjects.get_subject(template_type),
+                html=self.templates.get_template(template_type, template_data),
+                next_attempt_at=datetime.utcnow(),
+                created_at=datetime.utcnow()
+            ))
+            container.get(EmailOutboxWorker).notify()
             return True
 
         except Exception as e:
             timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            print(f"[{timestamp}] [EMAIL_SERVICE] [ERROR] Failed to send email to {to_email}: {str(e)}")
+            print(f"[{timestamp}] [EMAIL_SERVICE] [ERROR] Failed to queue email to {to_email}: {str(e)}")
             return False
 
     async def send_verification_email(self, to_email: str, user_name: str, token: str) -> bool:
@@ -0,0 +1,38 @@
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Optional
+from src.shared.config import settings
+
+class RenderPool:
+    """Ejecuta trabajos de CPU (PDFs, reportes) fuera del event loop.
+
+    El número de procesos y de trabajos en curso está acotado: las peticiones
+    que exceden el límite esperan sin bloquear a las demás.
+    """
+
+    def __init__(self, max_workers: int):
+        self.max_workers = max_workers
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    async def run(self, func: Callable[..., Any], *args: Any) -> Any:
+        if self._executor is None:
+            # spawn evita heredar los hilos del driver de Mongo en el proceso hijo
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+            self._semaphore = asyncio.Semaphore(self.max_workers)
+
+        async with self._semaphore:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, func, *args)
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+            self._semaphore = None
+
+render_pool = RenderPool(settings.render_pool_workers)
@@ -0,0 +1,76 @@
+import smtplib
+import time
+from email.mime.text import MIMEText
+from email.mime.multipart import MIMEMultipart
+from typing import List, Optional
+from src.shared.config import settings
+from src.shared.domain.outbox_email import OutboxEmail
+
+class SmtpSender:
+    """Conexión SMTP autenticada que se reutiliza entre lotes.
+
+    Es bloqueante: cada worker del outbox tiene la suya y la usa desde un hilo
+    del pool, nunca desde el event loop.
+    """
+
+    def __init__(self):
+        self._server: Optional[smtplib.SMTP] = None
+        self._last_used = 0.0
+
+    def send_batch(self, emails: List[OutboxEmail]) -> List[Optional[str]]:
+        errors: List[Optional[str]] = []
+        for email in emails:
+            errors.append(self._send(email))
+        self._last_used = time.monotonic()
+        return errors
+
+    def close_if_idle(self) -> None:
+        if self._server is not None and time.monotonic() - self._last_used > settings.smtp_idle_timeout_seconds:
+            self.close()
+
+    def close(self) -> None:
+        if self._server is None:
+            return
+        try:
+            self._server.quit()
+        except (smtplib.SMTPException, OSError):
+            pass
+        self._server = None
+
+    def _send(self, email: OutboxEmail) -> Optional[str]:
+        message = self._build_message(email)
+        # Un segundo intento con conexión nueva cubre el cierre del servidor por inactividad
+        for attempt in range(2):
+            try:
+                self._connect()
+                self._server.send_message(message)
+                return None
+            except (smtplib.SMTPServerDisconnected, ConnectionError) as e:
+                self._server = None
+                if attempt:
+                    return str(e)
+            except (smtplib.SMTPException, OSError) as e:
+                if isinstance(e, (smtplib.SMTPAuthenticationError, smtplib.SMTPConnectError)):
+                    self._server = None
+                return str(e)
+        return None
+
+    def _connect(self) -> None:
+        if self._server is not None:
+            return
+        server = smtplib.SMTP(settings.smtp_host, settings.smtp_port, timeout=30)
+        try:
+            server.starttls()
+            server.login(settings.smtp_user, settings.smtp_pass)
+        except Exception:
+            server.close()
+            raise
+        self._server = server
+
+    def _build_message(self, email: OutboxEmail) -> MIMEMultipart:
+        msg = MIMEMultipart('alternative')
+        msg['Subject'] = email.subject
+        msg['From'] = f"{settings.from_name} <{settings.from_email}>"
+        msg['To'] = email.to_email
+        msg.attach(MIMEText(email.html, 'html'))
+        return msg
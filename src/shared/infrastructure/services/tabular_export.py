@@ -0,0 +1,82 @@
+import asyncio
+import os
+import tempfile
+from typing import AsyncIterator, Callable, Dict, List
+import pandas as pd
+
+EXPORT_BATCH_SIZE = 2000
+XLSX_READ_CHUNK = 64 * 1024
+
+EXPORT_FORMATS: Dict[str, str] = {
+    "csv": "text/csv; charset=utf-8",
+    "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    "ndjson": "application/x-ndjson"
+}
+
+class TabularExport:
+    def __init__(self, filename: str, media_type: str, chunks: AsyncIterator[bytes]):
+        self.filename = filename
+        self.media_type = media_type
+        self.chunks = chunks
+
+def tabular_export(
+    batches: AsyncIterator[List[dict]],
+    to_frame: Callable[[List[dict]], pd.DataFrame],
+    export_format: str,
+    filename: str
+) -> TabularExport:
+    if export_format not in EXPORT_FORMATS:
+        raise ValueError("Invalid export format")
+
+    writers = {"csv": _stream_csv, "ndjson": _stream_ndjson, "xlsx": _stream_xlsx}
+    chunks = writers[export_format](batches, to_frame)
+    return TabularExport(f"{filename}.{export_format}", EXPORT_FORMATS[export_format], chunks)
+
+async def _frames(batches: AsyncIterator[List[dict]], to_frame: Callable[[List[dict]], pd.DataFrame]) -> AsyncIterator[pd.DataFrame]:
+    # Un lote vacío conserva las columnas para que el archivo tenga encabezado
+    empty = True
+    async for batch in batches:
+        empty = False
+        yield to_frame(batch)
+    if empty:
+        yield to_frame([])
+
+async def _stream_csv(batches, to_frame) -> AsyncIterator[bytes]:
+    header = True
+    async for frame in _frames(batches, to_frame):
+        yield frame.to_csv(index=False, header=header).encode("utf-8")
+        header = False
+
+async def _stream_ndjson(batches, to_frame) -> AsyncIterator[bytes]:
+    async for frame in _frames(batches, to_frame):
+        if frame.empty:
+            continue
+        yield (frame.to_json(orient="records", lines=True, force_ascii=False).rstrip("\n") + "\n").encode("utf-8")
+
+async def _stream_xlsx(batches, to_frame) -> AsyncIterator[bytes]:
+    import xlsxwriter
+
+    # Un xlsx es un zip: se escribe fila por fila a disco y se envía al cerrar
+    handle, path = tempfile.mkstemp(suffix=".xlsx")
+    os.close(handle)
+    try:
+        workbook = xlsxwriter.Workbook(path, {"constant_memory": True, "strings_to_urls": False})
+        worksheet = workbook.add_worksheet()
+        row_index = 0
+        async for frame in _frames(batches, to_frame):
+            if row_index == 0:
+                worksheet.write_row(0, 0, list(frame.columns))
+                row_index = 1
+            for values in frame.itertuples(index=False, name=None):
+                worksheet.write_row(row_index, 0, values)
+                row_index += 1
+        await asyncio.to_thread(workbook.close)
+
+        with open(path, "rb") as stream:
+            while True:
+                data = stream.read(XLSX_READ_CHUNK)
+                if not data:
+                    break
+                yield data
+    finally:
+        os.unlink(path)
@@ -3,12 +3,13 @@ from typing import List
 from src.subscriptions.infrastructure.persistence.mongo_subscription_repository import MongoSubscriptionRepository
 from src.auth.infrastructure.persistence.mongo_user_repository import MongoUserRepository
 from src.shared.infrastructure.services.email_service import EmailService
+from src.shared.infrastructure.container import container
 
 class ExpirationNotificationService:
     def __init__(self):
-        self.subscription_repository = MongoSubscriptionRepository()
-        self.user_repository = MongoUserRepository()
-        self.email_service = EmailService()
+        self.subscription_repository = container.get(MongoSubscriptionRepository)
+        self.user_repository = container.get(MongoUserRepository)
+        self.email_service = container.get(EmailService)
 
     async def check_and_notify_expiring_subscriptions(self) -> int:
         expiring_soon = await self._get_subscriptions_expiring_in_days(7)
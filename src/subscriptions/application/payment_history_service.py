@@ -2,11 +2,12 @@ from typing import List, Dict, Any
 from datetime import datetime
 from src.subscriptions.infrastructure.persistence.mongo_subscription_repository import MongoSubscriptionRepository
 from src.subscriptions.application.mercadopago_service import MercadoPagoService
+from src.shared.infrastructure.container import container
 
 class PaymentHistoryService:
     def __init__(self):
-        self.subscription_repository = MongoSubscriptionRepository()
-        self.mercadopago_service = MercadoPagoService()
+        self.subscription_repository = container.get(MongoSubscriptionRepository)
+        self.mercadopago_service = container.get(MercadoPagoService)
 
     async def get_user_payment_history(self, user_id: str) -> List[Dict[str, Any]]:
         subscription = await self.subscription_repository.find_by_user_id(user_id)
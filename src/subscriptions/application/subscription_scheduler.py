@@ -2,11 +2,12 @@ import asyncio
 from datetime import datetime
 from src.subscriptions.application.subscription_service import SubscriptionService
 from src.subscriptions.application.expiration_notification_service import ExpirationNotificationService
+from src.shared.infrastructure.container import container
 
 class SubscriptionScheduler:
     def __init__(self):
-        self.subscription_service = SubscriptionService()
-        self.expiration_service = ExpirationNotificationService()
+        self.subscription_service = container.get(SubscriptionService)
+        self.expiration_service = container.get(ExpirationNotificationService)
 
     async def run_daily_tasks(self) -> dict:
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
@@ -59,9 +60,9 @@ class SubscriptionScheduler:
 
 # Función para ejecutar manualmente (desde FastAPI)
 async def execute_daily_tasks():
-    scheduler = SubscriptionScheduler()
+    scheduler = container.get(SubscriptionScheduler)
     return await scheduler.run_daily_tasks()
 
 async def execute_weekly_tasks():
-    scheduler = SubscriptionScheduler()
+    scheduler = container.get(SubscriptionScheduler)
     return await scheduler.run_weekly_tasks()
\ No newline at end of file
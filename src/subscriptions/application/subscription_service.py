@@ -2,16 +2,21 @@ from datetime import datetime
 from typing import Dict, Any
 from src.subscriptions.domain.subscription import Subscription
 from src.subscriptions.infrastructure.persistence.mongo_subscription_repository import MongoSubscriptionRepository
+from src.subscriptions.infrastructure.persistence.subscription_status_cache import subscription_status_cache
 from src.auth.infrastructure.persistence.mongo_user_repository import MongoUserRepository
+from src.auth.infrastructure.persistence.user_auth_facts_cache import user_auth_facts_cache
+from src.shared.infrastructure.container import container
 
 class SubscriptionService:
     def __init__(self):
-        self.subscription_repository = MongoSubscriptionRepository()
-        self.user_repository = MongoUserRepository()
+        self.subscription_repository = container.get(MongoSubscriptionRepository)
+        self.user_repository = container.get(MongoUserRepository)
 
     async def create_free_subscription(self, user_id: str) -> Subscription:
         subscription = Subscription(user_id=user_id)
-        return await self.subscription_repository.create(subscription)
+        subscription = await self.subscription_repository.create(subscription)
+        subscription_status_cache.store(subscription)
+        return subscription
 
     async def activate_pro_subscription(self, user_id: str, payment_id: str) -> Subscription:
         subscription = await self.subscription_repository.find_by_user_id(user_id)
@@ -20,19 +25,27 @@ class SubscriptionService:
 
         subscription.activate_pro(payment_id)
         await self.subscription_repository.update(subscription.id, subscription)
+        subscription_status_cache.store(subscription)
+        await self._invalidate_plan_claims(user_id)
         
         await self._send_activation_email(user_id)
         return subscription
 
     async def get_user_subscription(self, user_id: str) -> Subscription:
+        subscription = subscription_status_cache.get(user_id)
+        if subscription:
+            return subscription
+
         subscription = await self.subscription_repository.find_by_user_id(user_id)
         if not subscription:
-            subscription = await self.create_free_subscription(user_id)
+            return await self.create_free_subscription(user_id)
         
         if subscription.plan_type == "pro" and subscription.expires_at:
             if subscription.expires_at <= datetime.utcnow():
                 await self._expire_subscription(subscription)
-        
+                return subscription
+
+        subscription_status_cache.store(subscription)
         return subscription
 
     async def cancel_subscription(self, user_id: str) -> bool:
@@ -42,6 +55,8 @@ class SubscriptionService:
 
         subscription.cancel_to_free()
         await self.subscription_repository.update(subscription.id, subscription)
+        subscription_status_cache.store(subscription)
+        await self._invalidate_plan_claims(user_id)
         await self._send_cancellation_email(user_id)
         return True
 
@@ -69,8 +84,15 @@ class SubscriptionService:
     async def _expire_subscription(self, subscription: Subscription) -> None:
         subscription.expire_to_free()
         await self.subscription_repository.update(subscription.id, subscription)
+        subscription_status_cache.store(subscription)
+        await self._invalidate_plan_claims(subscription.user_id)
         await self._send_expiration_email(subscription.user_id)
 
+    async def _invalidate_plan_claims(self, user_id: str) -> None:
+        # Los tokens con el plan anterior dejan de servir como atajo
+        await self.user_repository.bump_claims_version(user_id)
+        user_auth_facts_cache.invalidate(user_id)
+
     def _get_days_remaining(self, subscription: Subscription) -> int:
         if subscription.expires_at and subscription.plan_type == "pro":
             remaining = subscription.expires_at - datetime.utcnow()
@@ -82,7 +104,7 @@ class SubscriptionService:
             user = await self.user_repository.find_by_id(user_id)
             if user:
                 from src.shared.infrastructure.services.email_service import EmailService
-                email_service = EmailService()
+                email_service = container.get(EmailService)
                 await email_service.send_email(
                     to_email=user.email,
                     template_type="subscription_activated",
@@ -101,7 +123,7 @@ class SubscriptionService:
             user = await self.user_repository.find_by_id(user_id)
             if user:
                 from src.shared.infrastructure.services.email_service import EmailService
-                email_service = EmailService()
+                email_service = container.get(EmailService)
                 await email_service.send_email(
                     to_email=user.email,
                     template_type="subscription_expired",
@@ -119,7 +141,7 @@ class SubscriptionService:
             user = await self.user_repository.find_by_id(user_id)
             if user:
                 from src.shared.infrastructure.services.email_service import EmailService
-                email_service = EmailService()
+                email_service = container.get(EmailService)
                 await email_service.send_email(
                     to_email=user.email,
                     template_type="subscription_cancelled",
@@ -0,0 +1,39 @@
+from datetime import datetime
+from src.subscriptions.infrastructure.persistence.mongo_trip_quota_repository import MongoTripQuotaRepository
+from src.trips.infrastructure.persistence.mongo_trip_repository import MongoTripRepository
+from src.shared.infrastructure.container import container
+
+FREE_PLAN_MAX_TRIPS = 1
+
+class TripQuotaService:
+    def __init__(self):
+        self.quota_repository = container.get(MongoTripQuotaRepository)
+        self.trip_repository = container.get(MongoTripRepository)
+
+    async def count_owned_active_trips(self, user_id: str, limit: int = FREE_PLAN_MAX_TRIPS) -> int:
+        try:
+            count = await self.quota_repository.get_owned_active_trips(user_id)
+            if count is not None:
+                return count
+        except Exception as e:
+            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            print(f"[{timestamp}] [TRIP_QUOTA] [ERROR] Quota lookup failed: {str(e)}")
+
+        # Sin contador basta saber si se alcanzó el límite
+        return await self.trip_repository.count_owned_active(user_id, limit=limit)
+
+    async def trip_created(self, user_id: str) -> None:
+        try:
+            if not await self.quota_repository.increment(user_id, 1):
+                count = await self.trip_repository.count_owned_active(user_id)
+                await self.quota_repository.seed(user_id, count)
+        except Exception as e:
+            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            print(f"[{timestamp}] [TRIP_QUOTA] [ERROR] Quota increment failed: {str(e)}")
+
+    async def trip_deleted(self, user_id: str) -> None:
+        try:
+            await self.quota_repository.increment(user_id, -1)
+        except Exception as e:
+            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            print(f"[{timestamp}] [TRIP_QUOTA] [ERROR] Quota decrement failed: {str(e)}")
\ No newline at end of file
@@ -6,13 +6,16 @@ from src.subscriptions.application.payment_history_service import PaymentHistory
 from src.subscriptions.application.expiration_notification_service import ExpirationNotificationService
 from src.shared.infrastructure.security.authentication import get_current_user_id
 from src.auth.infrastructure.persistence.mongo_user_repository import MongoUserRepository
+from src.shared.infrastructure.container import container, provide
 
 router = APIRouter(prefix="/subscriptions", tags=["subscriptions"])
 
 @router.get("/status")
-async def get_subscription_status(user_id: str = Depends(get_current_user_id)) -> Dict[str, Any]:
+async def get_subscription_status(
+    user_id: str = Depends(get_current_user_id),
+    subscription_service: SubscriptionService = Depends(provide(SubscriptionService))
+) -> Dict[str, Any]:
     try:
-        subscription_service = SubscriptionService()
         return await subscription_service.get_subscription_status(user_id)
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
@@ -20,7 +23,7 @@ async def get_subscription_status(user_id: str = Depends(get_current_user_id)) -
 @router.get("/payment-history")
 async def get_payment_history(user_id: str = Depends(get_current_user_id)) -> List[Dict[str, Any]]:
     try:
-        payment_history_service = PaymentHistoryService()
+        payment_history_service = container.get(PaymentHistoryService)
         return await payment_history_service.get_user_payment_history(user_id)
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
@@ -28,22 +31,22 @@ async def get_payment_history(user_id: str = Depends(get_current_user_id)) -> Li
 @router.get("/payment-statistics")
 async def get_payment_statistics(user_id: str = Depends(get_current_user_id)) -> Dict[str, Any]:
     try:
-        payment_history_service = PaymentHistoryService()
+        payment_history_service = container.get(PaymentHistoryService)
         return await payment_history_service.get_payment_statistics(user_id)
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
 
 @router.post("/create-payment")
 async def create_payment_preference(
-    user_id: str = Depends(get_current_user_id)
+    user_id: str = Depends(get_current_user_id),
+    user_repository: MongoUserRepository = Depends(provide(MongoUserRepository))
 ) -> Dict[str, Any]:
     try:
-        user_repository = MongoUserRepository()
         user = await user_repository.find_by_id(user_id)
         if not user:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
 
-        mercadopago_service = MercadoPagoService()
+        mercadopago_service = container.get(MercadoPagoService)
         preference = await mercadopago_service.create_payment_preference(
             user_id=user_id,
             user_email=user.email,
@@ -63,9 +66,11 @@ async def create_payment_preference(
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
 
 @router.post("/cancel")
-async def cancel_subscription(user_id: str = Depends(get_current_user_id)) -> Dict[str, str]:
+async def cancel_subscription(
+    user_id: str = Depends(get_current_user_id),
+    subscription_service: SubscriptionService = Depends(provide(SubscriptionService))
+) -> Dict[str, str]:
     try:
-        subscription_service = SubscriptionService()
         success = await subscription_service.cancel_subscription(user_id)
         
         if not success:
@@ -96,7 +101,7 @@ async def mercadopago_webhook(request: Request) -> Dict[str, str]:
 
 async def _process_payment_notification(payment_id: str) -> None:
     try:
-        mercadopago_service = MercadoPagoService()
+        mercadopago_service = container.get(MercadoPagoService)
         payment_info = await mercadopago_service.get_payment_info(payment_id)
         
         if not payment_info or payment_info.get("status") != "approved":
@@ -112,7 +117,7 @@ async def _process_payment_notification(payment_id: str) -> None:
         
         user_id = parts[2]
         
-        subscription_service = SubscriptionService()
+        subscription_service = container.get(SubscriptionService)
         await subscription_service.activate_pro_subscription(user_id, payment_id)
         
     except Exception as e:
@@ -122,17 +127,19 @@ async def _process_payment_notification(payment_id: str) -> None:
 
 # Endpoint administrativo para verificar expiraciones
 @router.get("/admin/expiration-summary")
-async def get_expiration_summary() -> Dict[str, Any]:
+async def get_expiration_summary(
+    expiration_service: ExpirationNotificationService = Depends(provide(ExpirationNotificationService))
+) -> Dict[str, Any]:
     try:
-        expiration_service = ExpirationNotificationService()
         return await expiration_service.get_expiration_summary()
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
 
 @router.post("/admin/send-expiration-notifications")
-async def send_expiration_notifications() -> Dict[str, Any]:
+async def send_expiration_notifications(
+    expiration_service: ExpirationNotificationService = Depends(provide(ExpirationNotificationService))
+) -> Dict[str, Any]:
     try:
-        expiration_service = ExpirationNotificationService()
         notifications_sent = await expiration_service.check_and_notify_expiring_subscriptions()
         return {
             "notifications_sent": notifications_sent,
@@ -1,7 +1,9 @@
 from typing import Optional, List
 from bson import ObjectId
 from datetime import datetime
+from pymongo import IndexModel, ASCENDING
 from src.shared.infrastructure.database.mongo_client import get_database
+from src.shared.infrastructure.database.index_registry import index_registry, QueryShape
 from src.subscriptions.domain.subscription import Subscription, PlanType
 
 class MongoSubscriptionRepository:
@@ -74,4 +76,25 @@ class MongoSubscriptionRepository:
             expires_at=doc.get("expiresAt"),
             created_at=doc.get("createdAt", datetime.utcnow()),
             updated_at=doc.get("updatedAt", datetime.utcnow())
-        )
\ No newline at end of file
+        )
+
+index_registry.register(
+    "subscriptions",
+    indexes=[
+        IndexModel([("userId", ASCENDING)]),
+        IndexModel([("planType", ASCENDING), ("status", ASCENDING), ("expiresAt", ASCENDING)])
+    ],
+    query_shapes=[
+        QueryShape("find_by_user_id", {"userId": ObjectId()}),
+        QueryShape("find_expired_subscriptions", {
+            "planType": PlanType.PRO,
+            "status": "active",
+            "expiresAt": {"$lt": datetime.utcnow()}
+        }),
+        QueryShape("find_expiring_in_days", {
+            "planType": PlanType.PRO,
+            "status": "active",
+            "expiresAt": {"$gte": datetime.utcnow(), "$lte": datetime.utcnow()}
+        })
+    ]
+)
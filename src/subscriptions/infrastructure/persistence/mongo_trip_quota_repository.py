@@ -0,0 +1,30 @@
+from typing import Optional
+from bson import ObjectId
+from datetime import datetime
+from src.shared.infrastructure.database.mongo_client import get_database
+
+class MongoTripQuotaRepository:
+    def __init__(self):
+        self.db = get_database()
+        self.collection = self.db.tripQuotas
+
+    async def get_owned_active_trips(self, user_id: str) -> Optional[int]:
+        doc = await self.collection.find_one({"_id": ObjectId(user_id)}, {"ownedActiveTrips": 1})
+        if doc:
+            return max(0, doc.get("ownedActiveTrips", 0))
+        return None
+
+    async def increment(self, user_id: str, amount: int = 1) -> bool:
+        # Sin upsert: un contador inexistente se siembra con un conteo completo
+        result = await self.collection.update_one(
+            {"_id": ObjectId(user_id)},
+            {"$inc": {"ownedActiveTrips": amount}, "$set": {"updatedAt": datetime.utcnow()}}
+        )
+        return result.matched_count > 0
+
+    async def seed(self, user_id: str, owned_active_trips: int) -> None:
+        await self.collection.update_one(
+            {"_id": ObjectId(user_id)},
+            {"$setOnInsert": {"ownedActiveTrips": owned_active_trips, "updatedAt": datetime.utcnow()}},
+            upsert=True
+        )
\ No newline at end of file
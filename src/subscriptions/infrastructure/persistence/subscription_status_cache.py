@@ -0,0 +1,33 @@
+from datetime import datetime
+from typing import Optional, Dict, Any
+from src.subscriptions.domain.subscription import Subscription
+from src.shared.infrastructure.cache.ttl_cache import TTLCache
+from src.shared.config import settings
+
+class SubscriptionStatusCache:
+    def __init__(self):
+        self.cache = TTLCache(
+            max_entries=settings.subscription_cache_max_entries,
+            ttl_seconds=settings.subscription_cache_ttl_seconds
+        )
+
+    def get(self, user_id: str) -> Optional[Subscription]:
+        # Cada lector recibe su copia: un cambio hecho en una petición no se filtra a las demás
+        subscription = self.cache.get(user_id)
+        return subscription.model_copy(deep=True) if subscription else None
+
+    def store(self, subscription: Subscription) -> None:
+        # Una suscripción PRO sale de la caché justo al vencer para que la
+        # siguiente lectura aplique la expiración
+        ttl_seconds = None
+        if subscription.is_pro() and subscription.expires_at:
+            ttl_seconds = (subscription.expires_at - datetime.utcnow()).total_seconds()
+        self.cache.set(subscription.user_id, subscription.model_copy(deep=True), ttl_seconds)
+
+    def invalidate(self, user_id: str) -> None:
+        self.cache.invalidate(user_id)
+
+    def stats(self) -> Dict[str, Any]:
+        return self.cache.stats()
+
+subscription_status_cache = SubscriptionStatusCache()
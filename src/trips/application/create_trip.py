@@ -2,10 +2,14 @@ from datetime import date, timedelta
 from decimal import Decimal
 from src.trips.domain.trip import Trip, Member, Day
 from src.trips.infrastructure.persistence.mongo_trip_repository import MongoTripRepository
+from src.subscriptions.application.trip_quota_service import TripQuotaService
+from src.shared.domain.money import quantize_money
+from src.shared.infrastructure.container import container
 
 class CreateTrip:
     def __init__(self):
-        self.trip_repository = MongoTripRepository()
+        self.trip_repository = container.get(MongoTripRepository)
+        self.trip_quota_service = container.get(TripQuotaService)
 
     async def execute(
         self,
@@ -20,6 +24,9 @@ class CreateTrip:
         if start_date >= end_date:
             raise ValueError("Start date must be before end date")
 
+        if estimated_total_budget is not None:
+            estimated_total_budget = quantize_money(estimated_total_budget, base_currency)
+
         owner_member = Member(
             user_id=created_by,
             role="owner"
@@ -44,4 +51,6 @@ class CreateTrip:
             days=days
         )
 
-        return await self.trip_repository.create(trip)
\ No newline at end of file
+        trip = await self.trip_repository.create(trip)
+        await self.trip_quota_service.trip_created(created_by)
+        return trip
\ No newline at end of file
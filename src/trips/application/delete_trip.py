@@ -1,19 +1,25 @@
 from src.trips.infrastructure.persistence.mongo_trip_repository import MongoTripRepository
+from src.trips.application.trip_access import TripAccess
+from src.subscriptions.application.trip_quota_service import TripQuotaService
+from src.shared.infrastructure.container import container
 
 class DeleteTrip:
     def __init__(self):
-        self.trip_repository = MongoTripRepository()
+        self.trip_repository = container.get(MongoTripRepository)
+        self.trip_access = container.get(TripAccess)
+        self.trip_quota_service = container.get(TripQuotaService)
 
     async def execute(self, trip_id: str, user_id: str) -> bool:
-        trip = await self.trip_repository.find_by_id(trip_id)
+        trip = await self.trip_access.find(trip_id)
         if not trip:
             raise ValueError("Trip not found")
 
-        is_owner = any(
-            member.user_id == user_id and member.role == "owner"
-            for member in trip.members
-        )
+        is_owner = trip.role_of(user_id) == "owner"
         if not is_owner:
             raise ValueError("Only trip owner can delete the trip")
 
-        return await self.trip_repository.delete(trip_id)
\ No newline at end of file
+        deleted = await self.trip_repository.delete(trip_id)
+        self.trip_access.invalidate(trip_id)
+        if deleted:
+            await self.trip_quota_service.trip_deleted(trip.created_by)
+        return deleted
\ No newline at end of file
@@ -0,0 +1,171 @@
+import asyncio
+import os
+import shutil
+import time
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import List, Set, Tuple
+from src.shared.config import settings
+from src.shared.infrastructure.container import container
+from src.shared.infrastructure.services.render_pool import render_pool
+from src.trips.domain.export_job import ExportJob, ExportJobStatus
+from src.trips.infrastructure.persistence.mongo_trip_repository import MongoTripRepository
+from src.trips.infrastructure.persistence.mongo_export_job_repository import MongoExportJobRepository
+from src.trips.infrastructure.export.trip_export_cache import TripExportCache
+from src.trips.infrastructure.export.full_trip_report import ReportSpool, render_full_trip_report
+from src.trips.infrastructure.export.thumbnails import prefetch_thumbnails, thumbnail_url
+from src.expenses.application.expense_totals_service import ExpenseTotalsService
+from src.expenses.infrastructure.persistence.mongo_expense_repository import MongoExpenseRepository
+from src.photos.infrastructure.persistence.mongo_photo_repository import MongoPhotoRepository
+from src.journal_entries.infrastructure.persistence.mongo_journal_entry_repository import MongoJournalEntryRepository
+
+# Cada cuántos registros se publica el progreso del trabajo
+PROGRESS_INTERVAL = 200
+
+class ExportJobRunner:
+    def __init__(self):
+        self.job_repository = container.get(MongoExportJobRepository)
+        self.trip_repository = container.get(MongoTripRepository)
+        self.totals_service = container.get(ExpenseTotalsService)
+        self.expense_repository = container.get(MongoExpenseRepository)
+        self.photo_repository = container.get(MongoPhotoRepository)
+        self.journal_repository = container.get(MongoJournalEntryRepository)
+        self.directory = Path(container.get(TripExportCache).directory) / "jobs"
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._semaphore = asyncio.Semaphore(settings.export_job_concurrency)
+        self._tasks: Set[asyncio.Task] = set()
+
+    def start(self, job: ExportJob) -> None:
+        task = asyncio.ensure_future(self._run(job))
+        # Se guarda la referencia para que el recolector no cancele la tarea
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def recover(self) -> int:
+        cutoff = datetime.utcnow() - timedelta(minutes=settings.export_job_stale_minutes)
+        return await self.job_repository.fail_stale(cutoff)
+
+    async def _run(self, job: ExportJob) -> None:
+        spool_path = self.directory / f"{job.id}.{uuid.uuid4().hex}.ndjson"
+        output_path = self.directory / f"{job.id}.pdf"
+        temp_path = self.directory / f"{job.id}.{uuid.uuid4().hex}.tmp"
+        thumbnails_dir = self.directory / f"{job.id}.{uuid.uuid4().hex}.thumbs"
+
+        try:
+            async with self._semaphore:
+                self._prune_artifacts()
+                await self.job_repository.update(job.id, {"status": ExportJobStatus.RUNNING, "stage": "collecting"})
+
+                thumbnails_dir.mkdir()
+                thumbnails = await self._write_spool(job, spool_path, thumbnails_dir)
+
+                # Las descargas se hacen aquí, acotadas, para no ocupar un proceso de render esperando la red
+                await self.job_repository.update(job.id, {"stage": "thumbnails"})
+                await prefetch_thumbnails(thumbnails)
+
+                await self.job_repository.update(job.id, {"stage": "rendering"})
+                await render_pool.run(render_full_trip_report, str(spool_path), str(temp_path))
+                os.replace(temp_path, output_path)
+
+                await self.job_repository.update(job.id, {
+                    "status": ExportJobStatus.COMPLETED,
+                    "stage": None,
+                    "artifactPath": str(output_path),
+                    "completedAt": datetime.utcnow()
+                })
+        except Exception as e:
+            self._log_error(f"Export job {job.id} failed: {str(e)}")
+            await self.job_repository.update(job.id, {"status": ExportJobStatus.FAILED, "error": str(e)})
+        finally:
+            for path in (spool_path, temp_path):
+                if path.exists():
+                    path.unlink()
+            shutil.rmtree(thumbnails_dir, ignore_errors=True)
+
+    async def _write_spool(self, job: ExportJob, spool_path: Path, thumbnails_dir: Path) -> List[Tuple[str, Path]]:
+        trip = await self.trip_repository.find_by_id(job.trip_id)
+        if not trip:
+            raise ValueError("Trip not found")
+
+        expense_totals, photo_count, journal_count = await asyncio.gather(
+            self.totals_service.get_totals(job.trip_id, trip.base_currency),
+            self.photo_repository.count_by_trip_id(job.trip_id),
+            self.journal_repository.count_by_trip_id(job.trip_id)
+        )
+
+        total = expense_totals["count"] + journal_count + photo_count
+        processed = 0
+        await self.job_repository.update(job.id, {"processed": processed, "total": total})
+
+        async def advance() -> None:
+            nonlocal processed
+            processed += 1
+            if processed % PROGRESS_INTERVAL == 0:
+                await self.job_repository.update(job.id, {"processed": processed})
+
+        with open(spool_path, "w", encoding="utf-8") as stream:
+            spool = ReportSpool(stream)
+            spool.title(f"Trip Report: {trip.title}")
+
+            trip_info = [
+                f"Dates: {trip.start_date.strftime('%Y-%m-%d')} to {trip.end_date.strftime('%Y-%m-%d')} "
+                f"({(trip.end_date - trip.start_date).days + 1} days)",
+                f"Base Currency: {trip.base_currency}",
+                f"Is Public: {'Yes' if trip.is_public else 'No'}",
+                f"Total Members: {len(trip.members)}",
+                f"Total Days: {len(trip.days)}"
+            ]
+            if trip.estimated_total_budget:
+                trip_info.append(f"Estimated Budget: {trip.base_currency} {trip.estimated_total_budget}")
+            spool.section("Trip Information", trip_info)
+
+            if expense_totals["count"]:
+                spool.section("Expenses", [
+                    f"Total Expenses: {trip.base_currency} {expense_totals['total']}",
+                    f"Number of Expense Records: {expense_totals['count']}"
+                ])
+                spool.table(["Date", "Description", "Amount", "Category", "User"], [1, 3, 1.2, 1.2, 1.6])
+                async for expense in self.expense_repository.iter_by_trip_id(job.trip_id):
+                    spool.row([
+                        expense.date.strftime("%Y-%m-%d"),
+                        expense.description,
+                        f"{expense.currency} {expense.amount}",
+                        expense.category or "N/A",
+                        expense.user_id
+                    ])
+                    await advance()
+
+            if journal_count:
+                spool.section("Journal Entries", [f"Total Journal Entries: {journal_count}"])
+                async for entry in self.journal_repository.iter_by_trip_id(job.trip_id):
+                    spool.entry(f"Entry - {entry.created_at.strftime('%Y-%m-%d %H:%M')}", entry.content)
+                    await advance()
+
+            thumbnails: List[Tuple[str, Path]] = []
+            if photo_count:
+                spool.section("Photos", [f"Total Photos: {photo_count}"])
+                async for photo in self.photo_repository.iter_by_trip_id(job.trip_id):
+                    caption = photo.taken_at.strftime("%Y-%m-%d") if photo.taken_at else ""
+                    if photo.location:
+                        caption = f"{caption} {photo.location}".strip()
+                    thumbnail_path = thumbnails_dir / f"{len(thumbnails)}.img"
+                    thumbnails.append((thumbnail_url(photo.file_url), thumbnail_path))
+                    spool.photo(str(thumbnail_path), caption)
+                    await advance()
+
+        await self.job_repository.update(job.id, {"processed": processed})
+        return thumbnails
+
+    def _prune_artifacts(self) -> None:
+        cutoff = time.time() - settings.export_job_retention_hours * 3600
+        for path in self.directory.iterdir():
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+            except OSError:
+                continue
+
+    def _log_error(self, message: str) -> None:
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        print(f"[{timestamp}] [EXPORT_JOBS] [ERROR] {message}")
@@ -1,52 +1,51 @@
-from typing import Dict, Any, List
+import asyncio
+from copy import deepcopy
+from typing import Dict, Any
 from decimal import Decimal
 from src.trips.infrastructure.persistence.mongo_trip_repository import MongoTripRepository
-from src.expenses.infrastructure.persistence.mongo_expense_repository import MongoExpenseRepository
+from src.trips.infrastructure.persistence.trip_analytics_cache import trip_analytics_cache
+from src.trips.application.trip_access import TripAccess
+from src.expenses.application.expense_totals_service import ExpenseTotalsService
 from src.photos.infrastructure.persistence.mongo_photo_repository import MongoPhotoRepository
 from src.journal_entries.infrastructure.persistence.mongo_journal_entry_repository import MongoJournalEntryRepository
+from src.shared.infrastructure.container import container
 
 class GetTripAnalytics:
     def __init__(self):
-        self.trip_repository = MongoTripRepository()
-        self.expense_repository = MongoExpenseRepository()
-        self.photo_repository = MongoPhotoRepository()
-        self.journal_repository = MongoJournalEntryRepository()
+        self.trip_repository = container.get(MongoTripRepository)
+        self.trip_access = container.get(TripAccess)
+        self.totals_service = container.get(ExpenseTotalsService)
+        self.photo_repository = container.get(MongoPhotoRepository)
+        self.journal_repository = container.get(MongoJournalEntryRepository)
 
     async def execute(self, trip_id: str, user_id: str) -> Dict[str, Any]:
-        trip = await self.trip_repository.find_by_id(trip_id)
-        if not trip:
+        access = await self.trip_access.find(trip_id)
+        if not access:
             raise ValueError("Trip not found")
 
-        is_member = any(
-            member.user_id == user_id
-            for member in trip.members
-        )
-        if not is_member:
+        if not access.is_member(user_id):
             raise ValueError("User not authorized to view trip analytics")
 
-        expenses = await self.expense_repository.find_by_trip_id(trip_id)
-        photos = await self.photo_repository.find_by_trip_id(trip_id)
-        journal_entries = await self.journal_repository.find_by_trip_id(trip_id)
+        cached = trip_analytics_cache.get(trip_id, access.data_version)
+        if cached is not None:
+            return deepcopy(cached)
 
-        total_expenses = sum(expense.amount for expense in expenses)
-        
-        expenses_by_category = {}
-        expenses_by_user = {}
-        
-        for expense in expenses:
-            category = expense.category or "Uncategorized"
-            if category not in expenses_by_category:
-                expenses_by_category[category] = Decimal(0)
-            expenses_by_category[category] += expense.amount
+        # Consultas independientes: la latencia es la de la más lenta
+        trip, expense_totals, total_photos, total_journal_entries = await asyncio.gather(
+            self.trip_repository.find_by_id(trip_id),
+            self.totals_service.get_totals(trip_id, access.base_currency),
+            self.photo_repository.count_by_trip_id(trip_id),
+            self.journal_repository.count_by_trip_id(trip_id)
+        )
+        if not trip:
+            raise ValueError("Trip not found")
 
-            if expense.user_id not in expenses_by_user:
-                expenses_by_user[expense.user_id] = Decimal(0)
-            expenses_by_user[expense.user_id] += expense.amount
+        total_expenses = expense_totals["total"]
 
         days_with_activities = len([day for day in trip.days if day.activities])
         total_activities = sum(len(day.activities) for day in trip.days)
 
-        return {
+        analytics = {
             "trip_summary": {
                 "total_days": len(trip.days),
                 "days_with_activities": days_with_activities,
@@ -54,10 +53,11 @@ class GetTripAnalytics:
                 "total_members": len(trip.members)
             },
             "expense_summary": {
+                "base_currency": access.base_currency,
                 "total_expenses": float(total_expenses),
-                "total_expense_records": len(expenses),
-                "expenses_by_category": {k: float(v) for k, v in expenses_by_category.items()},
-                "expenses_by_user": {k: float(v) for k, v in expenses_by_user.items()},
+                "total_expense_records": expense_totals["count"],
+                "expenses_by_category": {k: float(v["total"]) for k, v in expense_totals["by_category"].items()},
+                "expenses_by_user": {k: float(v["total"]) for k, v in expense_totals["by_user"].items()},
                 "budget_vs_actual": {
                     "estimated_budget": float(trip.estimated_total_budget) if trip.estimated_total_budget else 0,
                     "actual_expenses": float(total_expenses),
@@ -65,7 +65,10 @@ class GetTripAnalytics:
                 }
             },
             "content_summary": {
-                "total_photos": len(photos),
-                "total_journal_entries": len(journal_entries)
+                "total_photos": total_photos,
+                "total_journal_entries": total_journal_entries
             }
-        }
\ No newline at end of file
+        }
+
+        trip_analytics_cache.store(trip_id, access.data_version, analytics)
+        return deepcopy(analytics)
@@ -1,9 +1,10 @@
 from src.trips.domain.trip import Trip
 from src.trips.infrastructure.persistence.mongo_trip_repository import MongoTripRepository
+from src.shared.infrastructure.container import container
 
 class GetTripDetails:
     def __init__(self):
-        self.trip_repository = MongoTripRepository()
+        self.trip_repository = container.get(MongoTripRepository)
 
     async def execute(self, trip_id: str, user_id: str) -> Trip:
         trip = await self.trip_repository.find_by_id(trip_id)
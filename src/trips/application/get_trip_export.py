@@ -0,0 +1,14 @@
+from src.trips.domain.export_job import ExportJob
+from src.trips.infrastructure.persistence.mongo_export_job_repository import MongoExportJobRepository
+from src.shared.infrastructure.container import container
+
+class GetTripExport:
+    def __init__(self):
+        self.job_repository = container.get(MongoExportJobRepository)
+
+    async def execute(self, trip_id: str, job_id: str, user_id: str) -> ExportJob:
+        job = await self.job_repository.find_by_id(job_id)
+        # Un trabajo solo es visible para quien lo pidió y dentro de su viaje
+        if not job or job.trip_id != trip_id or job.user_id != user_id:
+            raise ValueError("Export job not found")
+        return job
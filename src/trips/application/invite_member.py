@@ -1,11 +1,14 @@
 from bson import ObjectId
 from src.trips.infrastructure.persistence.mongo_trip_repository import MongoTripRepository
+from src.trips.application.trip_access import TripAccess
 from src.auth.infrastructure.persistence.mongo_user_repository import MongoUserRepository
+from src.shared.infrastructure.container import container
 
 class InviteMember:
     def __init__(self):
-        self.trip_repository = MongoTripRepository()
-        self.user_repository = MongoUserRepository()
+        self.trip_repository = container.get(MongoTripRepository)
+        self.trip_access = container.get(TripAccess)
+        self.user_repository = container.get(MongoUserRepository)
 
     async def execute(
         self,
@@ -14,14 +17,11 @@ class InviteMember:
         inviter_user_id: str,
         role: str = "viewer"
     ) -> bool:
-        trip = await self.trip_repository.find_by_id(trip_id)
+        trip = await self.trip_access.find(trip_id)
         if not trip:
             raise ValueError("Trip not found")
 
-        inviter_is_owner = any(
-            member.user_id == inviter_user_id and member.role == "owner"
-            for member in trip.members
-        )
+        inviter_is_owner = trip.role_of(inviter_user_id) == "owner"
         if not inviter_is_owner:
             raise ValueError("Only trip owner can invite members")
 
@@ -29,10 +29,7 @@ class InviteMember:
         if not invited_user:
             raise ValueError("User not found")
 
-        already_member = any(
-            member.user_id == invited_user_id
-            for member in trip.members
-        )
+        already_member = trip.is_member(invited_user_id)
         if already_member:
             raise ValueError("User is already a member")
 
@@ -43,7 +40,8 @@ class InviteMember:
                 "userId": ObjectId(invited_user_id),
                 "role": role,
                 "private_notes": None
-            }}}
+            }}, "$inc": {"dataVersion": 1}}
         )
+        self.trip_access.invalidate(trip_id)
 
         return result.modified_count > 0
\ No newline at end of file
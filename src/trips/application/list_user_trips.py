@@ -1,10 +1,23 @@
-from typing import List
-from src.trips.domain.trip import Trip
+from datetime import date
+from typing import Optional
+from src.shared.infrastructure.database.pagination import Page, DEFAULT_PAGE_LIMIT
 from src.trips.infrastructure.persistence.mongo_trip_repository import MongoTripRepository
+from src.shared.infrastructure.container import container
 
 class ListUserTrips:
     def __init__(self):
-        self.trip_repository = MongoTripRepository()
+        self.trip_repository = container.get(MongoTripRepository)
 
-    async def execute(self, user_id: str) -> List[Trip]:
-        return await self.trip_repository.find_by_user_id(user_id)
\ No newline at end of file
+    async def execute(
+        self,
+        user_id: str,
+        limit: int = DEFAULT_PAGE_LIMIT,
+        cursor: Optional[str] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None
+    ) -> Page:
+        return await self.trip_repository.find_page_by_user_id(
+            user_id, limit, cursor,
+            start_date=start_date,
+            end_date=end_date
+        )
\ No newline at end of file
@@ -3,10 +3,15 @@ from decimal import Decimal
 from bson import ObjectId
 from src.trips.domain.trip import Activity
 from src.trips.infrastructure.persistence.mongo_trip_repository import MongoTripRepository
+from src.trips.application.trip_access import TripAccess
+from src.shared.domain.money import quantize_money
+from src.shared.infrastructure.database.decimal_fields import to_decimal128
+from src.shared.infrastructure.container import container
 
 class ManageTripActivities:
     def __init__(self):
-        self.trip_repository = MongoTripRepository()
+        self.trip_repository = container.get(MongoTripRepository)
+        self.trip_access = container.get(TripAccess)
 
     async def create_activity(
         self,
@@ -21,28 +26,15 @@ class ManageTripActivities:
         estimated_cost: Optional[Decimal] = None,
         order: int = 0
     ) -> bool:
-        trip = await self.trip_repository.find_by_id(trip_id)
+        trip = await self.trip_access.find(trip_id)
         if not trip:
             raise ValueError("Trip not found")
 
-        user_role = None
-        for member in trip.members:
-            if member.user_id == user_id:
-                user_role = member.role
-                break
+        user_role = trip.role_of(user_id)
 
         if user_role not in ["owner", "editor"]:
             raise ValueError("User not authorized to manage activities")
 
-        day_index = None
-        for i, day in enumerate(trip.days):
-            if day.id == day_id:
-                day_index = i
-                break
-
-        if day_index is None:
-            raise ValueError("Day not found in trip")
-
         activity = Activity(
             title=title,
             description=description,
@@ -54,14 +46,19 @@ class ManageTripActivities:
         )
 
         activity_dict = activity.dict()
-        if activity_dict.get("estimated_cost"):
-            activity_dict["estimated_cost"] = float(activity_dict["estimated_cost"])
+        if activity_dict.get("estimated_cost") is not None:
+            activity_dict["estimated_cost"] = to_decimal128(quantize_money(activity_dict["estimated_cost"], trip.base_currency))
 
-        # Usar directamente el método update con $push
+        if not ObjectId.is_valid(day_id):
+            raise ValueError("Day not found in trip")
+
+        # El operador posicional resuelve el día en el servidor
         result = await self.trip_repository.collection.update_one(
-            {"_id": ObjectId(trip_id)},
-            {"$push": {f"days.{day_index}.activities": activity_dict}}
+            {"_id": ObjectId(trip_id), "days._id": ObjectId(day_id)},
+            {"$push": {"days.$.activities": activity_dict}, "$inc": {"dataVersion": 1}}
         )
+        if result.matched_count == 0:
+            raise ValueError("Day not found in trip")
         
         return result.modified_count > 0
 
@@ -79,54 +76,48 @@ class ManageTripActivities:
         estimated_cost: Optional[Decimal] = None,
         order: Optional[int] = None
     ) -> bool:
-        trip = await self.trip_repository.find_by_id(trip_id)
+        trip = await self.trip_access.find(trip_id)
         if not trip:
             raise ValueError("Trip not found")
 
-        user_role = None
-        for member in trip.members:
-            if member.user_id == user_id:
-                user_role = member.role
-                break
+        user_role = trip.role_of(user_id)
 
         if user_role not in ["owner", "editor"]:
             raise ValueError("User not authorized to manage activities")
 
-        day_index = None
+        day = await self.trip_repository.find_day(trip_id, day_id)
         activity_index = None
-        
-        for i, day in enumerate(trip.days):
-            if day.id == day_id:
-                day_index = i
-                for j, activity in enumerate(day.activities):
-                    if activity.id == activity_id:
-                        activity_index = j
-                        break
-                break
-
-        if day_index is None or activity_index is None:
+        if day:
+            for j, activity in enumerate(day.get("activities", [])):
+                if activity.get("id") == activity_id:
+                    activity_index = j
+                    break
+
+        if day is None or activity_index is None:
             raise ValueError("Day or activity not found")
 
         update_fields = {}
         if title is not None:
-            update_fields[f"days.{day_index}.activities.{activity_index}.title"] = title
+            update_fields[f"days.$.activities.{activity_index}.title"] = title
         if description is not None:
-            update_fields[f"days.{day_index}.activities.{activity_index}.description"] = description
+            update_fields[f"days.$.activities.{activity_index}.description"] = description
         if location is not None:
-            update_fields[f"days.{day_index}.activities.{activity_index}.location"] = location
+            update_fields[f"days.$.activities.{activity_index}.location"] = location
         if start_time is not None:
-            update_fields[f"days.{day_index}.activities.{activity_index}.start_time"] = start_time
+            update_fields[f"days.$.activities.{activity_index}.start_time"] = start_time
         if end_time is not None:
-            update_fields[f"days.{day_index}.activities.{activity_index}.end_time"] = end_time
+            update_fields[f"days.$.activities.{activity_index}.end_time"] = end_time
         if estimated_cost is not None:
-            update_fields[f"days.{day_index}.activities.{activity_index}.estimated_cost"] = float(estimated_cost)
+            update_fields[f"days.$.activities.{activity_index}.estimated_cost"] = to_decimal128(
+                quantize_money(estimated_cost, trip.base_currency)
+            )
         if order is not None:
-            update_fields[f"days.{day_index}.activities.{activity_index}.order"] = order
+            update_fields[f"days.$.activities.{activity_index}.order"] = order
 
         if update_fields:
             result = await self.trip_repository.collection.update_one(
-                {"_id": ObjectId(trip_id)},
-                {"$set": update_fields}
+                {"_id": ObjectId(trip_id), "days._id": ObjectId(day_id)},
+                {"$set": update_fields, "$inc": {"dataVersion": 1}}
             )
             return result.modified_count > 0
         
@@ -139,32 +130,24 @@ class ManageTripActivities:
         activity_id: str,
         user_id: str
     ) -> bool:
-        trip = await self.trip_repository.find_by_id(trip_id)
+        trip = await self.trip_access.find(trip_id)
         if not trip:
             raise ValueError("Trip not found")
 
-        user_role = None
-        for member in trip.members:
-            if member.user_id == user_id:
-                user_role = member.role
-                break
+        user_role = trip.role_of(user_id)
 
         if user_role not in ["owner", "editor"]:
             raise ValueError("User not authorized to manage activities")
 
-        day_index = None
-        for i, day in enumerate(trip.days):
-            if day.id == day_id:
-                day_index = i
-                break
-
-        if day_index is None:
+        if not ObjectId.is_valid(day_id):
             raise ValueError("Day not found in trip")
 
         # Usar directamente el método collection con $pull
         result = await self.trip_repository.collection.update_one(
-            {"_id": ObjectId(trip_id)},
-            {"$pull": {f"days.{day_index}.activities": {"id": activity_id}}}
+            {"_id": ObjectId(trip_id), "days._id": ObjectId(day_id)},
+            {"$pull": {"days.$.activities": {"id": activity_id}}, "$inc": {"dataVersion": 1}}
         )
+        if result.matched_count == 0:
+            raise ValueError("Day not found in trip")
 
         return result.modified_count > 0
\ No newline at end of file
@@ -1,9 +1,12 @@
 from bson import ObjectId
 from src.trips.infrastructure.persistence.mongo_trip_repository import MongoTripRepository
+from src.trips.application.trip_access import TripAccess
+from src.shared.infrastructure.container import container
 
 class RespondToInvitation:
     def __init__(self):
-        self.trip_repository = MongoTripRepository()
+        self.trip_repository = container.get(MongoTripRepository)
+        self.trip_access = container.get(TripAccess)
 
     async def execute(
         self,
@@ -11,14 +14,11 @@ class RespondToInvitation:
         user_id: str,
         accept: bool
     ) -> bool:
-        trip = await self.trip_repository.find_by_id(trip_id)
+        trip = await self.trip_access.find(trip_id)
         if not trip:
             raise ValueError("Trip not found")
 
-        is_member = any(
-            member.user_id == user_id
-            for member in trip.members
-        )
+        is_member = trip.is_member(user_id)
 
         if accept and not is_member:
             # Usar directamente la colección para insertar con ObjectId correcto
@@ -28,15 +28,17 @@ class RespondToInvitation:
                     "userId": ObjectId(user_id),
                     "role": "viewer",
                     "private_notes": None
-                }}}
+                }}, "$inc": {"dataVersion": 1}}
             )
+            self.trip_access.invalidate(trip_id)
             return result.modified_count > 0
         elif not accept and is_member:
             # Remover miembro usando ObjectId
             result = await self.trip_repository.collection.update_one(
                 {"_id": ObjectId(trip_id)},
-                {"$pull": {"members": {"userId": ObjectId(user_id)}}}
+                {"$pull": {"members": {"userId": ObjectId(user_id)}}, "$inc": {"dataVersion": 1}}
             )
+            self.trip_access.invalidate(trip_id)
             return result.modified_count > 0
         
         return True
\ No newline at end of file
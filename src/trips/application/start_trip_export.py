@@ -0,0 +1,27 @@
+from datetime import datetime
+from src.trips.domain.export_job import ExportJob
+from src.trips.infrastructure.persistence.mongo_export_job_repository import MongoExportJobRepository
+from src.trips.application.export_job_runner import ExportJobRunner
+from src.trips.application.trip_access import TripAccess
+from src.shared.infrastructure.container import container
+
+class StartTripExport:
+    def __init__(self):
+        self.job_repository = container.get(MongoExportJobRepository)
+        self.trip_access = container.get(TripAccess)
+        self.runner = container.get(ExportJobRunner)
+
+    async def execute(self, trip_id: str, user_id: str) -> ExportJob:
+        trip = await self.trip_access.find(trip_id)
+        if not trip:
+            raise ValueError("Trip not found")
+
+        if not trip.is_member(user_id):
+            raise ValueError("User not authorized to export trip data")
+
+        now = datetime.utcnow()
+        job = await self.job_repository.create(
+            ExportJob(trip_id=trip_id, user_id=user_id, created_at=now, updated_at=now)
+        )
+        self.runner.start(job)
+        return job
@@ -0,0 +1,29 @@
+from typing import Optional
+from src.trips.domain.trip import TripAccessView
+from src.trips.infrastructure.persistence.mongo_trip_repository import MongoTripRepository
+from src.shared.infrastructure.container import container
+from src.shared.infrastructure.request_scope import request_memo
+
+class TripAccess:
+    def __init__(self):
+        self.trip_repository = container.get(MongoTripRepository)
+
+    async def find(self, trip_id: str) -> Optional[TripAccessView]:
+        memo = request_memo("trip_access")
+        if trip_id in memo:
+            return memo[trip_id]
+
+        access = await self.trip_repository.find_access_by_id(trip_id)
+        memo[trip_id] = access
+        return access
+
+    async def has_day(self, trip_id: str, day_id: str) -> bool:
+        return await self.trip_repository.has_day(trip_id, day_id)
+
+    async def touch(self, trip_id: str) -> None:
+        # Gastos, fotos y diario viven en otras colecciones pero cuentan como datos del viaje
+        await self.trip_repository.touch_data_version(trip_id)
+        self.invalidate(trip_id)
+
+    def invalidate(self, trip_id: str) -> None:
+        request_memo("trip_access").pop(trip_id, None)
\ No newline at end of file
@@ -3,10 +3,13 @@ from decimal import Decimal
 from typing import Optional
 from src.trips.domain.trip import Trip
 from src.trips.infrastructure.persistence.mongo_trip_repository import MongoTripRepository
+from src.shared.domain.money import quantize_money
+from src.shared.infrastructure.database.decimal_fields import to_decimal128
+from src.shared.infrastructure.container import container
 
 class UpdateTrip:
     def __init__(self):
-        self.trip_repository = MongoTripRepository()
+        self.trip_repository = container.get(MongoTripRepository)
 
     async def execute(
         self,
@@ -43,7 +46,9 @@ class UpdateTrip:
         if base_currency is not None:
             update_data["baseCurrency"] = base_currency
         if estimated_total_budget is not None:
-            update_data["estimatedTotalBudget"] = float(estimated_total_budget)
+            update_data["estimatedTotalBudget"] = to_decimal128(
+                quantize_money(estimated_total_budget, base_currency or trip.base_currency)
+            )
         if is_public is not None:
             update_data["isPublic"] = is_public
         if cover_image_url is not None:
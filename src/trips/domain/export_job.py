@@ -0,0 +1,32 @@
+from datetime import datetime
+from typing import Optional
+from pydantic import BaseModel
+from bson import ObjectId
+
+class ExportJobStatus:
+    PENDING = "pending"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+class ExportJob(BaseModel):
+    id: Optional[str] = None
+    trip_id: str
+    user_id: str
+    status: str = ExportJobStatus.PENDING
+    stage: Optional[str] = None
+    processed: int = 0
+    total: int = 0
+    artifact_path: Optional[str] = None
+    error: Optional[str] = None
+    created_at: datetime = datetime.utcnow()
+    updated_at: datetime = datetime.utcnow()
+    completed_at: Optional[datetime] = None
+
+    class Config:
+        json_encoders = {
+            ObjectId: str
+        }
+
+    def is_finished(self) -> bool:
+        return self.status in (ExportJobStatus.COMPLETED, ExportJobStatus.FAILED)
@@ -25,6 +25,23 @@ class Member(BaseModel):
     role: str
     private_notes: Optional[str] = None
 
+class TripAccessView(BaseModel):
+    id: str
+    created_by: Optional[str] = None
+    is_public: bool = False
+    members: List[Member] = []
+    base_currency: str = "USD"
+    data_version: int = 0
+
+    def role_of(self, user_id: str) -> Optional[str]:
+        for member in self.members:
+            if member.user_id == user_id:
+                return member.role
+        return None
+
+    def is_member(self, user_id: str) -> bool:
+        return self.role_of(user_id) is not None
+
 class Trip(BaseModel):
     id: Optional[str] = None
     title: str
@@ -0,0 +1,203 @@
+import json
+import os
+from datetime import datetime
+from typing import Any, Dict, List, Optional, TextIO
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.utils import ImageReader, simpleSplit
+from reportlab.pdfgen import canvas
+
+class ReportSpool:
+    """Archivo NDJSON intermedio entre la lectura de Mongo y el render.
+
+    El proceso web escribe los registros por lotes y el proceso de render los
+    lee línea por línea, así ninguno de los dos tiene el viaje completo en memoria.
+    """
+
+    def __init__(self, stream: TextIO):
+        self.stream = stream
+
+    def write(self, kind: str, **data: Any) -> None:
+        data["kind"] = kind
+        self.stream.write(json.dumps(data, default=str))
+        self.stream.write("\n")
+
+    def title(self, text: str) -> None:
+        self.write("title", text=text)
+
+    def section(self, title: str, lines: Optional[List[str]] = None) -> None:
+        self.write("section", title=title, lines=lines or [])
+
+    def table(self, columns: List[str], widths: List[float]) -> None:
+        self.write("table", columns=columns, widths=widths)
+
+    def row(self, cells: List[str]) -> None:
+        self.write("row", cells=cells)
+
+    def entry(self, heading: str, text: str) -> None:
+        self.write("entry", heading=heading, text=text)
+
+    def photo(self, thumbnail_path: str, caption: str) -> None:
+        # La miniatura ya se descargó (o no) antes del render; aquí solo viaja la ruta local
+        self.write("photo", path=thumbnail_path, caption=caption)
+
+class _PageWriter:
+    MARGIN = 50
+    THUMBNAIL = 110
+    THUMBNAIL_GAP = 12
+
+    def __init__(self, path: str):
+        self.canvas = canvas.Canvas(path, pagesize=A4, pageCompression=1)
+        self.width, self.height = A4
+        self.content_width = self.width - 2 * self.MARGIN
+        self.page = 1
+        self.y = self.height - self.MARGIN
+        self.table_columns: Optional[List[str]] = None
+        self.table_widths: List[float] = []
+        self.photo_column = 0
+
+    def ensure(self, needed: float) -> None:
+        if self.y - needed < self.MARGIN:
+            self.new_page()
+
+    def new_page(self) -> None:
+        self._page_number()
+        self.canvas.showPage()
+        self.page += 1
+        self.y = self.height - self.MARGIN
+        # Una tabla que continúa en otra página repite su encabezado
+        if self.table_columns:
+            self._draw_row(self.table_columns, header=True)
+
+    def text(self, text: str, font: str = "Helvetica", size: float = 10, space_after: float = 4) -> None:
+        leading = size * 1.3
+        for line in simpleSplit(text or "", font, size, self.content_width) or [""]:
+            self.ensure(leading)
+            self.canvas.setFont(font, size)
+            self.y -= leading
+            self.canvas.drawString(self.MARGIN, self.y + size * 0.3, line)
+        self.y -= space_after
+
+    def space(self, height: float) -> None:
+        self.y -= height
+
+    def start_table(self, columns: List[str], widths: List[float]) -> None:
+        self.end_blocks()
+        total = sum(widths)
+        self.table_widths = [self.content_width * width / total for width in widths]
+        self.ensure(40)
+        self._draw_row(columns, header=True)
+        self.table_columns = columns
+
+    def row(self, cells: List[str]) -> None:
+        self._draw_row(cells, header=False)
+
+    def photo(self, image: Optional[ImageReader], caption: str) -> None:
+        size = self.THUMBNAIL
+        per_row = max(1, int((self.content_width + self.THUMBNAIL_GAP) // (size + self.THUMBNAIL_GAP)))
+        if self.photo_column == 0:
+            self.ensure(size + 24)
+        x = self.MARGIN + self.photo_column * (size + self.THUMBNAIL_GAP)
+        top = self.y
+
+        if image is not None:
+            self.canvas.drawImage(image, x, top - size, width=size, height=size, preserveAspectRatio=True, anchor="c")
+        else:
+            self.canvas.setFillColor(colors.lightgrey)
+            self.canvas.rect(x, top - size, size, size, stroke=0, fill=1)
+            self.canvas.setFillColor(colors.black)
+            self.canvas.setFont("Helvetica", 8)
+            self.canvas.drawCentredString(x + size / 2, top - size / 2, "No preview")
+
+        self.canvas.setFont("Helvetica", 7)
+        caption_line = (simpleSplit(caption, "Helvetica", 7, size) or [""])[0]
+        self.canvas.drawString(x, top - size - 10, caption_line)
+
+        self.photo_column += 1
+        if self.photo_column >= per_row:
+            self.photo_column = 0
+            self.y -= size + 24
+
+    def end_blocks(self) -> None:
+        self.table_columns = None
+        if self.photo_column:
+            self.photo_column = 0
+            self.y -= self.THUMBNAIL + 24
+
+    def close(self) -> None:
+        self._page_number()
+        self.canvas.save()
+
+    def _draw_row(self, cells: List[str], header: bool) -> None:
+        font = "Helvetica-Bold" if header else "Helvetica"
+        size = 8
+        leading = size * 1.3
+        wrapped = [
+            simpleSplit(str(cell or ""), font, size, width - 6) or [""]
+            for cell, width in zip(cells, self.table_widths)
+        ]
+        height = max(len(lines) for lines in wrapped) * leading + 6
+        self.ensure(height)
+
+        x = self.MARGIN
+        self.canvas.setFillColor(colors.grey if header else colors.beige)
+        self.canvas.rect(x, self.y - height, sum(self.table_widths), height, stroke=0, fill=1)
+        self.canvas.setFillColor(colors.whitesmoke if header else colors.black)
+        self.canvas.setFont(font, size)
+        for lines, width in zip(wrapped, self.table_widths):
+            line_y = self.y - 3 - size
+            for line in lines:
+                self.canvas.drawString(x + 3, line_y, line)
+                line_y -= leading
+            self.canvas.setStrokeColor(colors.black)
+            self.canvas.rect(x, self.y - height, width, height, stroke=1, fill=0)
+            x += width
+        self.canvas.setFillColor(colors.black)
+        self.y -= height
+
+    def _page_number(self) -> None:
+        self.canvas.setFont("Helvetica", 8)
+        self.canvas.drawRightString(self.width - self.MARGIN, self.MARGIN / 2, f"Page {self.page}")
+
+def _load_thumbnail(path: str) -> Optional[ImageReader]:
+    if not os.path.exists(path):
+        return None
+    try:
+        reader = ImageReader(path)
+        reader.getSize()
+        return reader
+    except Exception:
+        return None
+
+# Se ejecuta en un proceso del pool de render
+def render_full_trip_report(spool_path: str, output_path: str) -> None:
+    writer = _PageWriter(output_path)
+
+    with open(spool_path, "r", encoding="utf-8") as spool:
+        for line in spool:
+            record: Dict[str, Any] = json.loads(line)
+            kind = record["kind"]
+
+            if kind == "title":
+                writer.text(record["text"], "Helvetica-Bold", 18, space_after=20)
+            elif kind == "section":
+                writer.end_blocks()
+                writer.space(10)
+                writer.text(record["title"], "Helvetica-Bold", 14, space_after=6)
+                for text in record["lines"]:
+                    writer.text(text)
+            elif kind == "table":
+                writer.start_table(record["columns"], record["widths"])
+            elif kind == "row":
+                writer.row(record["cells"])
+            elif kind == "entry":
+                writer.end_blocks()
+                writer.text(record["heading"], "Helvetica-Bold", 11, space_after=2)
+                writer.text(record["text"], space_after=10)
+            elif kind == "photo":
+                writer.photo(_load_thumbnail(record["path"]), record["caption"])
+
+    writer.end_blocks()
+    writer.space(20)
+    writer.text(f"Report generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    writer.close()
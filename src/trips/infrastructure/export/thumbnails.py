@@ -0,0 +1,74 @@
+import asyncio
+import urllib.error
+import urllib.request
+from pathlib import Path
+from typing import List, Optional, Tuple
+from urllib.parse import urlparse
+
+# Solo se descargan miniaturas de Cloudinary: la URL de la foto la envía el cliente
+ALLOWED_THUMBNAIL_HOSTS = {"res.cloudinary.com"}
+MAX_THUMBNAIL_BYTES = 5 * 1024 * 1024
+THUMBNAIL_TIMEOUT_SECONDS = 5
+THUMBNAIL_CONCURRENCY = 8
+# Tope para todas las miniaturas de un reporte; las que no llegan se dibujan sin vista previa
+THUMBNAIL_TOTAL_SECONDS = 60
+
+def thumbnail_url(file_url: str) -> str:
+    # Cloudinary genera la miniatura en el servidor; otras URLs se usan tal cual
+    if "res.cloudinary.com" in file_url and "/image/upload/" in file_url:
+        return file_url.replace("/image/upload/", "/image/upload/c_fill,w_240,h_240/", 1)
+    return file_url
+
+def is_allowed_thumbnail_url(url: str) -> bool:
+    try:
+        parsed = urlparse(url)
+    except ValueError:
+        return False
+    return parsed.scheme == "https" and parsed.hostname in ALLOWED_THUMBNAIL_HOSTS and parsed.port in (None, 443)
+
+class _NoRedirect(urllib.request.HTTPRedirectHandler):
+    # Una redirección podría llevar a un host fuera de la lista permitida
+    def redirect_request(self, req, fp, code, msg, headers, newurl):
+        return None
+
+_opener = urllib.request.build_opener(_NoRedirect)
+
+def _fetch(url: str) -> Optional[bytes]:
+    try:
+        with _opener.open(url, timeout=THUMBNAIL_TIMEOUT_SECONDS) as response:
+            data = response.read(MAX_THUMBNAIL_BYTES + 1)
+    except (urllib.error.URLError, OSError, ValueError):
+        return None
+    if len(data) > MAX_THUMBNAIL_BYTES:
+        return None
+    return data
+
+async def prefetch_thumbnails(items: List[Tuple[str, Path]]) -> int:
+    """Descarga las miniaturas antes del render, con concurrencia y tiempo total acotados.
+
+    Así el proceso de render nunca hace red y no queda ocupado esperando descargas.
+    """
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(THUMBNAIL_CONCURRENCY)
+
+    async def download(url: str, path: Path) -> bool:
+        async with semaphore:
+            data = await loop.run_in_executor(None, _fetch, url)
+        if data is None:
+            return False
+        path.write_bytes(data)
+        return True
+
+    tasks = [
+        asyncio.ensure_future(download(url, path))
+        for url, path in items
+        if is_allowed_thumbnail_url(url)
+    ]
+    if not tasks:
+        return 0
+
+    done, pending = await asyncio.wait(tasks, timeout=THUMBNAIL_TOTAL_SECONDS)
+    for task in pending:
+        task.cancel()
+    await asyncio.gather(*pending, return_exceptions=True)
+    return sum(1 for task in done if not task.cancelled() and task.exception() is None and task.result())
@@ -0,0 +1,117 @@
+import asyncio
+import os
+import tempfile
+import time
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Optional
+from src.shared.config import settings
+from src.shared.infrastructure.services.render_pool import render_pool
+
+class TripExportCache:
+    def __init__(self):
+        self.directory = Path(settings.export_cache_dir or os.path.join(tempfile.gettempdir(), "voyaj_exports"))
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_files = settings.export_cache_max_files
+        # Quien recibe una ruta la abre después (FileResponse): un PDF reciente no se borra aunque ya no sirva
+        self.grace_seconds = settings.export_cache_grace_seconds
+        # El mtime de esta marca es la última invalidación; se comparte entre procesos por el directorio
+        self._marker = self.directory / ".invalidated"
+        self._pending: Dict[str, asyncio.Task] = {}
+        self._generation = 0
+
+    def find(self, trip_id: str, data_version: int) -> Optional[str]:
+        path = self._path_for(trip_id, data_version)
+        return str(path) if self._is_current(path) else None
+
+    async def render(self, trip_id: str, data_version: int, render: Callable[..., None], *args: Any) -> str:
+        path = self._path_for(trip_id, data_version)
+        if self._is_current(path):
+            return str(path)
+
+        # Exportaciones simultáneas del mismo viaje comparten un solo render
+        task = self._pending.get(path.name)
+        if task is None:
+            task = asyncio.ensure_future(self._render(trip_id, path, render, args))
+            self._pending[path.name] = task
+            task.add_done_callback(lambda done: self._forget(path.name, done))
+        # shield: si un cliente se desconecta el render sigue para los demás
+        return await asyncio.shield(task)
+
+    def _forget(self, name: str, task: asyncio.Task) -> None:
+        # Tras invalidar puede haber otro render con el mismo nombre
+        if self._pending.get(name) is task:
+            del self._pending[name]
+
+    def invalidate(self) -> None:
+        # Cambios que no suben la versión del viaje (tasas de cambio) descartan todos los PDFs
+        self._generation += 1
+        self._pending.clear()
+        try:
+            # Los PDFs recientes quedan en disco para las descargas en curso, pero ya no se entregan
+            self._marker.touch()
+            self._remove(self.directory.glob("trip_*.pdf"))
+        except OSError as e:
+            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            print(f"[{timestamp}] [EXPORT_CACHE] [ERROR] Failed to invalidate exports: {str(e)}")
+
+    async def _render(self, trip_id: str, path: Path, render: Callable[..., None], args: tuple) -> str:
+        generation = self._generation
+        temp_path = path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            await render_pool.run(render, str(temp_path), *args)
+            if generation != self._generation:
+                # Se invalidó durante el render: se entrega a quien lo pidió pero no queda en caché
+                path = path.with_name(f"{path.stem}.{uuid.uuid4().hex}.pdf")
+            # El rename es atómico: nunca se sirve un PDF a medio escribir
+            os.replace(temp_path, path)
+        finally:
+            if temp_path.exists():
+                temp_path.unlink()
+
+        self._prune(trip_id, path)
+        return str(path)
+
+    def _prune(self, trip_id: str, current: Path) -> None:
+        try:
+            invalidated_at = self._invalidated_at()
+            self._remove(stale for stale in self.directory.glob(f"trip_{trip_id}_v*.pdf") if stale != current)
+
+            files = sorted(self._modified_times(self.directory.glob("trip_*.pdf")).items(), key=lambda item: item[1])
+            self._remove(path for path, modified in files if modified <= invalidated_at and path != current)
+            self._remove(path for path, _ in files[:max(0, len(files) - self.max_files)] if path != current)
+        except OSError as e:
+            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            print(f"[{timestamp}] [EXPORT_CACHE] [ERROR] Failed to prune exports: {str(e)}")
+
+    def _remove(self, paths: Iterable[Path]) -> None:
+        cutoff = time.time() - self.grace_seconds
+        for path, modified in self._modified_times(paths).items():
+            if modified < cutoff:
+                path.unlink(missing_ok=True)
+
+    def _modified_times(self, paths: Iterable[Path]) -> Dict[Path, float]:
+        # Otro proceso puede borrar el archivo entre el glob y el stat
+        modified: Dict[Path, float] = {}
+        for path in paths:
+            try:
+                modified[path] = path.stat().st_mtime
+            except FileNotFoundError:
+                continue
+        return modified
+
+    def _is_current(self, path: Path) -> bool:
+        try:
+            return path.stat().st_mtime > self._invalidated_at()
+        except FileNotFoundError:
+            return False
+
+    def _invalidated_at(self) -> float:
+        try:
+            return self._marker.stat().st_mtime
+        except FileNotFoundError:
+            return 0.0
+
+    def _path_for(self, trip_id: str, data_version: int) -> Path:
+        return self.directory / f"trip_{trip_id}_v{data_version}.pdf"
@@ -0,0 +1,124 @@
+from typing import Dict, Any, List
+from datetime import datetime
+from reportlab.lib.pagesizes import A4
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.units import inch
+from reportlab.lib import colors
+from src.trips.domain.trip import Trip
+from src.expenses.domain.expense import Expense
+from src.journal_entries.domain.journal_entry import JournalEntry
+
+# Se ejecuta en un proceso del pool: recibe datos ya cargados y no toca la base de datos
+def render_trip_report(
+    path: str,
+    trip: Trip,
+    expense_totals: Dict[str, Any],
+    expenses: List[Expense],
+    photo_count: int,
+    journal_count: int,
+    journal_entries: List[JournalEntry]
+) -> None:
+    doc = SimpleDocTemplate(path, pagesize=A4)
+    styles = getSampleStyleSheet()
+    story = []
+
+    title_style = ParagraphStyle(
+        'CustomTitle',
+        parent=styles['Heading1'],
+        fontSize=18,
+        spaceAfter=30,
+        alignment=1
+    )
+
+    story.append(Paragraph(f"Trip Report: {trip.title}", title_style))
+    story.append(Spacer(1, 20))
+
+    story.append(Paragraph("Trip Information", styles['Heading2']))
+    trip_info = [
+        ["Trip Title", trip.title],
+        ["Start Date", trip.start_date.strftime("%Y-%m-%d")],
+        ["End Date", trip.end_date.strftime("%Y-%m-%d")],
+        ["Duration", f"{(trip.end_date - trip.start_date).days + 1} days"],
+        ["Base Currency", trip.base_currency],
+        ["Is Public", "Yes" if trip.is_public else "No"],
+        ["Total Members", str(len(trip.members))],
+        ["Total Days", str(len(trip.days))]
+    ]
+    
+    if trip.estimated_total_budget:
+        trip_info.append(["Estimated Budget", f"{trip.base_currency} {trip.estimated_total_budget}"])
+
+    trip_table = Table(trip_info, colWidths=[2*inch, 3*inch])
+    trip_table.setStyle(TableStyle([
+        ('BACKGROUND', (0, 0), (0, -1), colors.grey),
+        ('TEXTCOLOR', (0, 0), (0, -1), colors.whitesmoke),
+        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+        ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
+        ('FONTSIZE', (0, 0), (-1, -1), 10),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 12),
+        ('BACKGROUND', (1, 0), (1, -1), colors.beige),
+        ('GRID', (0, 0), (-1, -1), 1, colors.black)
+    ]))
+    story.append(trip_table)
+    story.append(Spacer(1, 20))
+
+    expense_count = expense_totals["count"]
+    if expense_count:
+        story.append(Paragraph("Expense Summary", styles['Heading2']))
+        total_expenses = expense_totals["total"]
+        story.append(Paragraph(f"Total Expenses: {trip.base_currency} {total_expenses}", styles['Normal']))
+        story.append(Paragraph(f"Number of Expense Records: {expense_count}", styles['Normal']))
+        
+        expense_data = [["Date", "Description", "Amount", "Category", "User"]]
+        for expense in expenses:
+            expense_data.append([
+                expense.date.strftime("%Y-%m-%d"),
+                expense.description[:30] + "..." if len(expense.description) > 30 else expense.description,
+                f"{expense.currency} {expense.amount}",
+                expense.category or "N/A",
+                expense.user_id[:8] + "..."
+            ])
+        
+        if expense_count > len(expenses):
+            expense_data.append(["...", f"and {expense_count - len(expenses)} more expenses", "", "", ""])
+
+        expense_table = Table(expense_data, colWidths=[1*inch, 2*inch, 1*inch, 1*inch, 1*inch])
+        expense_table.setStyle(TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, -1), 8),
+            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+            ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+            ('GRID', (0, 0), (-1, -1), 1, colors.black)
+        ]))
+        story.append(expense_table)
+        story.append(Spacer(1, 20))
+
+    if photo_count:
+        story.append(Paragraph("Photos Summary", styles['Heading2']))
+        story.append(Paragraph(f"Total Photos: {photo_count}", styles['Normal']))
+        story.append(Spacer(1, 10))
+
+    if journal_count:
+        story.append(Paragraph("Journal Entries", styles['Heading2']))
+        story.append(Paragraph(f"Total Journal Entries: {journal_count}", styles['Normal']))
+        story.append(Spacer(1, 10))
+        
+        for entry in journal_entries:
+            entry_date = entry.created_at.strftime("%Y-%m-%d %H:%M")
+            story.append(Paragraph(f"Entry - {entry_date}", styles['Heading4']))
+            content_preview = entry.content[:200] + "..." if len(entry.content) > 200 else entry.content
+            story.append(Paragraph(content_preview, styles['Normal']))
+            story.append(Spacer(1, 10))
+        
+        if journal_count > len(journal_entries):
+            story.append(Paragraph(f"... and {journal_count - len(journal_entries)} more entries", styles['Italic']))
+
+    story.append(Spacer(1, 30))
+    footer_text = f"Report generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+    story.append(Paragraph(footer_text, styles['Normal']))
+
+    doc.build(story)
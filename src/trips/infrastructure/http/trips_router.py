@@ -1,9 +1,11 @@
-from fastapi import APIRouter, HTTPException, status, Depends
-from fastapi.responses import StreamingResponse
-from typing import Any, Dict, List
+import os
+from datetime import date
+from fastapi import APIRouter, HTTPException, Query, Response, status, Depends
+from fastapi.responses import FileResponse
+from typing import Any, Dict, List, Optional
 from src.trips.infrastructure.http.trips_schemas import (
     CreateTripRequest, UpdateTripRequest, TripResponse, InviteMemberRequest, 
-    RespondInvitationRequest, CreateActivityRequest, UpdateActivityRequest
+    RespondInvitationRequest, CreateActivityRequest, UpdateActivityRequest, ExportJobResponse
 )
 from src.trips.application.create_trip import CreateTrip
 from src.trips.application.get_trip_analytics import GetTripAnalytics
@@ -13,17 +15,35 @@ from src.trips.application.update_trip import UpdateTrip
 from src.trips.application.delete_trip import DeleteTrip
 from src.trips.application.invite_member import InviteMember
 from src.trips.application.export_trip_data import ExportTripData
+from src.trips.application.start_trip_export import StartTripExport
+from src.trips.application.get_trip_export import GetTripExport
+from src.trips.domain.export_job import ExportJob, ExportJobStatus
 from src.trips.application.respond_to_invitation import RespondToInvitation
 from src.trips.application.manage_trip_activities import ManageTripActivities
+from src.expenses.application.get_trip_balances import GetTripBalances
+from src.expenses.application.get_trip_settlement import GetTripSettlement
 from src.shared.infrastructure.security.authentication import get_current_user_id
-import io
+from src.trips.domain.trip import Trip
+from src.auth.domain.user import UserSummary
+from src.auth.application.user_loader import UserLoader
+from src.shared.infrastructure.container import provide
+from src.shared.infrastructure.database.pagination import DEFAULT_PAGE_LIMIT, MAX_PAGE_LIMIT, NEXT_CURSOR_HEADER
 
 router = APIRouter(prefix="/trips", tags=["trips"])
 
+def _trip_response(trip: Trip, users: Dict[str, UserSummary]) -> TripResponse:
+    data = trip.dict()
+    for member in data["members"]:
+        member["user"] = users.get(member["user_id"])
+    return TripResponse(**data)
+
 @router.post("/", response_model=TripResponse)
-async def create_trip(request: CreateTripRequest, user_id: str = Depends(get_current_user_id)):
+async def create_trip(
+    request: CreateTripRequest,
+    user_id: str = Depends(get_current_user_id),
+    create_trip_uc: CreateTrip = Depends(provide(CreateTrip))
+):
     try:
-        create_trip_uc = CreateTrip()
         trip = await create_trip_uc.execute(
             title=request.title,
             start_date=request.start_date,
@@ -38,24 +58,52 @@ async def create_trip(request: CreateTripRequest, user_id: str = Depends(get_cur
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 @router.get("/", response_model=List[TripResponse])
-async def list_user_trips(user_id: str = Depends(get_current_user_id)):
-    list_trips = ListUserTrips()
-    trips = await list_trips.execute(user_id)
-    return [TripResponse(**trip.dict()) for trip in trips]
+async def list_user_trips(
+    response: Response,
+    limit: int = Query(DEFAULT_PAGE_LIMIT, ge=1, le=MAX_PAGE_LIMIT),
+    cursor: Optional[str] = Query(None),
+    start_date: Optional[date] = Query(None),
+    end_date: Optional[date] = Query(None),
+    user_id: str = Depends(get_current_user_id),
+    list_trips: ListUserTrips = Depends(provide(ListUserTrips)),
+    user_loader: UserLoader = Depends(provide(UserLoader))
+):
+    try:
+        page = await list_trips.execute(
+            user_id, limit, cursor,
+            start_date=start_date,
+            end_date=end_date
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    if page.next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+    members = await user_loader.load_many(member.user_id for trip in page.items for member in trip.members)
+    return [_trip_response(trip, members) for trip in page.items]
 
 @router.get("/{trip_id}", response_model=TripResponse)
-async def get_trip_details(trip_id: str, user_id: str = Depends(get_current_user_id)):
+async def get_trip_details(
+    trip_id: str,
+    user_id: str = Depends(get_current_user_id),
+    get_trip_uc: GetTripDetails = Depends(provide(GetTripDetails)),
+    user_loader: UserLoader = Depends(provide(UserLoader))
+):
     try:
-        get_trip_uc = GetTripDetails()
         trip = await get_trip_uc.execute(trip_id, user_id)
-        return TripResponse(**trip.dict())
+        members = await user_loader.load_many(member.user_id for member in trip.members)
+        return _trip_response(trip, members)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
 
 @router.put("/{trip_id}", response_model=TripResponse)
-async def update_trip(trip_id: str, request: UpdateTripRequest, user_id: str = Depends(get_current_user_id)):
+async def update_trip(
+    trip_id: str,
+    request: UpdateTripRequest,
+    user_id: str = Depends(get_current_user_id),
+    update_trip_uc: UpdateTrip = Depends(provide(UpdateTrip))
+):
     try:
-        update_trip_uc = UpdateTrip()
         trip = await update_trip_uc.execute(
             trip_id=trip_id,
             user_id=user_id,
@@ -72,17 +120,24 @@ async def update_trip(trip_id: str, request: UpdateTripRequest, user_id: str = D
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 @router.delete("/{trip_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_trip(trip_id: str, user_id: str = Depends(get_current_user_id)):
+async def delete_trip(
+    trip_id: str,
+    user_id: str = Depends(get_current_user_id),
+    delete_trip_uc: DeleteTrip = Depends(provide(DeleteTrip))
+):
     try:
-        delete_trip_uc = DeleteTrip()
         await delete_trip_uc.execute(trip_id, user_id)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 @router.post("/{trip_id}/invite", status_code=status.HTTP_200_OK)
-async def invite_member(trip_id: str, request: InviteMemberRequest, user_id: str = Depends(get_current_user_id)):
+async def invite_member(
+    trip_id: str,
+    request: InviteMemberRequest,
+    user_id: str = Depends(get_current_user_id),
+    invite_member_uc: InviteMember = Depends(provide(InviteMember))
+):
     try:
-        invite_member_uc = InviteMember()
         await invite_member_uc.execute(
             trip_id=trip_id,
             invited_user_id=request.invited_user_id,
@@ -94,9 +149,13 @@ async def invite_member(trip_id: str, request: InviteMemberRequest, user_id: str
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 @router.post("/{trip_id}/respond-invitation", status_code=status.HTTP_200_OK)
-async def respond_to_invitation(trip_id: str, request: RespondInvitationRequest, user_id: str = Depends(get_current_user_id)):
+async def respond_to_invitation(
+    trip_id: str,
+    request: RespondInvitationRequest,
+    user_id: str = Depends(get_current_user_id),
+    respond_uc: RespondToInvitation = Depends(provide(RespondToInvitation))
+):
     try:
-        respond_uc = RespondToInvitation()
         await respond_uc.execute(
             trip_id=trip_id,
             user_id=user_id,
@@ -107,9 +166,14 @@ async def respond_to_invitation(trip_id: str, request: RespondInvitationRequest,
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 @router.post("/{trip_id}/days/{day_id}/activities", status_code=status.HTTP_201_CREATED)
-async def create_activity(trip_id: str, day_id: str, request: CreateActivityRequest, user_id: str = Depends(get_current_user_id)):
+async def create_activity(
+    trip_id: str,
+    day_id: str,
+    request: CreateActivityRequest,
+    user_id: str = Depends(get_current_user_id),
+    manage_activities: ManageTripActivities = Depends(provide(ManageTripActivities))
+):
     try:
-        manage_activities = ManageTripActivities()
         await manage_activities.create_activity(
             trip_id=trip_id,
             day_id=day_id,
@@ -127,9 +191,15 @@ async def create_activity(trip_id: str, day_id: str, request: CreateActivityRequ
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 @router.put("/{trip_id}/days/{day_id}/activities/{activity_id}", status_code=status.HTTP_200_OK)
-async def update_activity(trip_id: str, day_id: str, activity_id: str, request: UpdateActivityRequest, user_id: str = Depends(get_current_user_id)):
+async def update_activity(
+    trip_id: str,
+    day_id: str,
+    activity_id: str,
+    request: UpdateActivityRequest,
+    user_id: str = Depends(get_current_user_id),
+    manage_activities: ManageTripActivities = Depends(provide(ManageTripActivities))
+):
     try:
-        manage_activities = ManageTripActivities()
         await manage_activities.update_activity(
             trip_id=trip_id,
             day_id=day_id,
@@ -148,31 +218,133 @@ async def update_activity(trip_id: str, day_id: str, activity_id: str, request:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 @router.delete("/{trip_id}/days/{day_id}/activities/{activity_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_activity(trip_id: str, day_id: str, activity_id: str, user_id: str = Depends(get_current_user_id)):
+async def delete_activity(
+    trip_id: str,
+    day_id: str,
+    activity_id: str,
+    user_id: str = Depends(get_current_user_id),
+    manage_activities: ManageTripActivities = Depends(provide(ManageTripActivities))
+):
     try:
-        manage_activities = ManageTripActivities()
         await manage_activities.delete_activity(trip_id, day_id, activity_id, user_id)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     
 @router.get("/{trip_id}/analytics")
-async def get_trip_analytics(trip_id: str, user_id: str = Depends(get_current_user_id)) -> Dict[str, Any]:
+async def get_trip_analytics(
+    trip_id: str,
+    user_id: str = Depends(get_current_user_id),
+    analytics_uc: GetTripAnalytics = Depends(provide(GetTripAnalytics)),
+    user_loader: UserLoader = Depends(provide(UserLoader))
+) -> Dict[str, Any]:
     try:
-        analytics_uc = GetTripAnalytics()
-        return await analytics_uc.execute(trip_id, user_id)
+        analytics = await analytics_uc.execute(trip_id, user_id)
+        # El resultado viene del caché compartido: se agrega el mapa sin modificarlo
+        users = await user_loader.load_many(analytics["expense_summary"]["expenses_by_user"])
+        return {**analytics, "users": users}
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+@router.get("/{trip_id}/balances")
+async def get_trip_balances(
+    trip_id: str,
+    user_id: str = Depends(get_current_user_id),
+    balances_uc: GetTripBalances = Depends(provide(GetTripBalances)),
+    user_loader: UserLoader = Depends(provide(UserLoader))
+) -> Dict[str, Any]:
+    try:
+        result = await balances_uc.execute(trip_id, user_id)
+        result["users"] = await user_loader.load_many(
+            entry["user_id"] for entries in result["balances"].values() for entry in entries
+        )
+        return result
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+@router.get("/{trip_id}/settlement")
+async def get_trip_settlement(
+    trip_id: str,
+    user_id: str = Depends(get_current_user_id),
+    settlement_uc: GetTripSettlement = Depends(provide(GetTripSettlement)),
+    user_loader: UserLoader = Depends(provide(UserLoader))
+) -> Dict[str, Any]:
+    try:
+        result = await settlement_uc.execute(trip_id, user_id)
+        result["users"] = await user_loader.load_many(
+            member_id
+            for transfers in result["settlement"].values()
+            for transfer in transfers
+            for member_id in (transfer["from_user_id"], transfer["to_user_id"])
+        )
+        return result
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     
 @router.get("/{trip_id}/export")
-async def export_trip_data(trip_id: str, user_id: str = Depends(get_current_user_id)):
+async def export_trip_data(
+    trip_id: str,
+    user_id: str = Depends(get_current_user_id),
+    export_uc: ExportTripData = Depends(provide(ExportTripData))
+):
     try:
-        export_uc = ExportTripData()
-        pdf_data = await export_uc.execute(trip_id, user_id)
+        pdf_path = await export_uc.execute(trip_id, user_id)
         
-        return StreamingResponse(
-            io.BytesIO(pdf_data),
+        return FileResponse(
+            pdf_path,
             media_type="application/pdf",
             headers={"Content-Disposition": f"attachment; filename=trip_{trip_id}_export.pdf"}
         )
     except ValueError as e:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
\ No newline at end of file
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+def _export_job_response(job: ExportJob) -> ExportJobResponse:
+    download_url = None
+    if job.status == ExportJobStatus.COMPLETED:
+        download_url = f"/trips/{job.trip_id}/exports/{job.id}/download"
+    return ExportJobResponse(**job.dict(), download_url=download_url)
+
+@router.post("/{trip_id}/exports", response_model=ExportJobResponse, status_code=status.HTTP_202_ACCEPTED)
+async def start_trip_export(
+    trip_id: str,
+    user_id: str = Depends(get_current_user_id),
+    start_export: StartTripExport = Depends(provide(StartTripExport))
+):
+    try:
+        job = await start_export.execute(trip_id, user_id)
+        return _export_job_response(job)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+@router.get("/{trip_id}/exports/{job_id}", response_model=ExportJobResponse)
+async def get_trip_export(
+    trip_id: str,
+    job_id: str,
+    user_id: str = Depends(get_current_user_id),
+    get_export: GetTripExport = Depends(provide(GetTripExport))
+):
+    try:
+        job = await get_export.execute(trip_id, job_id, user_id)
+        return _export_job_response(job)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+@router.get("/{trip_id}/exports/{job_id}/download")
+async def download_trip_export(
+    trip_id: str,
+    job_id: str,
+    user_id: str = Depends(get_current_user_id),
+    get_export: GetTripExport = Depends(provide(GetTripExport))
+):
+    try:
+        job = await get_export.execute(trip_id, job_id, user_id)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    if job.status != ExportJobStatus.COMPLETED or not job.artifact_path or not os.path.exists(job.artifact_path):
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Export is not available")
+
+    return FileResponse(
+        job.artifact_path,
+        media_type="application/pdf",
+        headers={"Content-Disposition": f"attachment; filename=trip_{trip_id}_full_export.pdf"}
+    )
@@ -1,7 +1,8 @@
 from pydantic import BaseModel
-from datetime import date
+from datetime import date, datetime
 from decimal import Decimal
 from typing import Optional, List
+from src.auth.infrastructure.http.auth_schemas import UserSummaryResponse
 
 class CreateTripRequest(BaseModel):
     title: str
@@ -65,6 +66,7 @@ class MemberResponse(BaseModel):
     user_id: str
     role: str
     private_notes: Optional[str] = None
+    user: Optional[UserSummaryResponse] = None
 
 class TripResponse(BaseModel):
     id: str
@@ -77,4 +79,15 @@ class TripResponse(BaseModel):
     base_currency: str
     estimated_total_budget: Optional[Decimal] = None
     members: List[MemberResponse] = []
-    days: List[DayResponse] = []
\ No newline at end of file
+    days: List[DayResponse] = []
+class ExportJobResponse(BaseModel):
+    id: str
+    trip_id: str
+    status: str
+    stage: Optional[str] = None
+    processed: int
+    total: int
+    error: Optional[str] = None
+    download_url: Optional[str] = None
+    created_at: datetime
+    completed_at: Optional[datetime] = None
@@ -0,0 +1,76 @@
+from typing import Optional, Dict, Any
+from datetime import datetime
+from bson import ObjectId
+from pymongo import IndexModel, ASCENDING, DESCENDING
+from src.shared.config import settings
+from src.shared.infrastructure.database.mongo_client import get_database
+from src.shared.infrastructure.database.index_registry import index_registry, QueryShape
+from src.shared.infrastructure.database.document_mapper import DocumentMapper, object_id, value
+from src.trips.domain.export_job import ExportJob, ExportJobStatus
+
+export_job_mapper = DocumentMapper(ExportJob, {
+    "id": object_id("_id"),
+    "trip_id": object_id("tripId"),
+    "user_id": object_id("userId"),
+    "artifact_path": value("artifactPath", default=None),
+    "created_at": value("createdAt"),
+    "updated_at": value("updatedAt"),
+    "completed_at": value("completedAt", default=None)
+})
+
+class MongoExportJobRepository:
+    def __init__(self):
+        self.db = get_database()
+        self.collection = self.db.exportJobs
+
+    async def create(self, job: ExportJob) -> ExportJob:
+        job_dict = export_job_mapper.to_document(job, exclude=("id",))
+        result = await self.collection.insert_one(job_dict)
+        job.id = str(result.inserted_id)
+        return job
+
+    async def find_by_id(self, job_id: str) -> Optional[ExportJob]:
+        if not ObjectId.is_valid(job_id):
+            return None
+        doc = await self.collection.find_one({"_id": ObjectId(job_id)})
+        if doc:
+            return export_job_mapper.to_domain(doc)
+        return None
+
+    async def update(self, job_id: str, update_data: Dict[str, Any]) -> bool:
+        update_data["updatedAt"] = datetime.utcnow()
+        result = await self.collection.update_one(
+            {"_id": ObjectId(job_id)},
+            {"$set": update_data}
+        )
+        return result.modified_count > 0
+
+    async def fail_stale(self, updated_before: datetime) -> int:
+        # Trabajos que quedaron a medias porque el proceso que los ejecutaba terminó
+        result = await self.collection.update_many(
+            {
+                "status": {"$in": [ExportJobStatus.PENDING, ExportJobStatus.RUNNING]},
+                "updatedAt": {"$lt": updated_before}
+            },
+            {"$set": {
+                "status": ExportJobStatus.FAILED,
+                "error": "Export was interrupted",
+                "updatedAt": datetime.utcnow()
+            }}
+        )
+        return result.modified_count
+
+index_registry.register(
+    "exportJobs",
+    indexes=[
+        IndexModel([("tripId", ASCENDING), ("createdAt", DESCENDING)]),
+        IndexModel([("status", ASCENDING), ("updatedAt", ASCENDING)]),
+        IndexModel([("createdAt", ASCENDING)], expireAfterSeconds=settings.export_job_retention_hours * 3600)
+    ],
+    query_shapes=[
+        QueryShape("fail_stale", {
+            "status": {"$in": [ExportJobStatus.PENDING, ExportJobStatus.RUNNING]},
+            "updatedAt": {"$lt": datetime(2025, 1, 1)}
+        })
+    ]
+)
@@ -1,7 +1,107 @@
-from typing import Optional, List
-from bson import ObjectId
+from typing import Optional, List, Dict, Any, Set
+from datetime import date, datetime
+from bson import ObjectId, Decimal128
+from pymongo import IndexModel, ASCENDING, DESCENDING
 from src.shared.infrastructure.database.mongo_client import get_database
-from src.trips.domain.trip import Trip
+from src.shared.infrastructure.database.index_registry import index_registry, QueryShape
+from src.shared.infrastructure.database.pagination import Page, DEFAULT_PAGE_LIMIT, find_page, date_range_filter
+from src.shared.infrastructure.database.document_mapper import DocumentMapper, object_id, date_field, decimal_field, nested, value
+from src.shared.infrastructure.database.decimal_fields import from_decimal128
+from src.trips.domain.trip import Trip, TripAccessView, Member, Day, Activity
+
+activity_mapper = DocumentMapper(Activity, {
+    "estimated_cost": decimal_field(default=None)
+})
+
+day_mapper = DocumentMapper(Day, {
+    "id": object_id("_id"),
+    "date": date_field(default=None),
+    "activities": nested(activity_mapper)
+})
+
+member_mapper = DocumentMapper(Member, {
+    "user_id": object_id("userId")
+})
+
+def _prefer(doc: Dict[str, Any], source: str, legacy: str) -> None:
+    # Viajes anteriores guardan el campo con el nombre del modelo; el de Mongo gana si existen ambos
+    if source in doc:
+        doc[legacy] = doc[source]
+
+def _read_members(doc: Dict[str, Any]) -> None:
+    members = doc.get("members") or []
+    for member in members:
+        if "userId" in member:
+            member["user_id"] = str(member["userId"]) if member["userId"] is not None else None
+    doc["members"] = members
+
+def _read_trip(doc: Dict[str, Any]) -> Trip:
+    # Lectura escrita a mano: es la más frecuente y la de documentos más grandes (días y actividades).
+    # El documento recién leído se ajusta en su lugar y se valida una sola vez
+    doc["id"] = str(doc["_id"])
+    start_date, end_date = doc.get("startDate"), doc.get("endDate")
+    doc["start_date"] = start_date.date() if isinstance(start_date, datetime) else start_date
+    doc["end_date"] = end_date.date() if isinstance(end_date, datetime) else end_date
+    created_by = doc.get("createdBy")
+    doc["created_by"] = str(created_by) if created_by is not None else None
+    _prefer(doc, "coverImageUrl", "cover_image_url")
+    _prefer(doc, "isPublic", "is_public")
+    _prefer(doc, "baseCurrency", "base_currency")
+    _prefer(doc, "isDeleted", "is_deleted")
+    _prefer(doc, "createdAt", "created_at")
+    doc["estimated_total_budget"] = from_decimal128(doc.get("estimatedTotalBudget"))
+    _read_members(doc)
+
+    days = doc.get("days") or []
+    for day in days:
+        day["id"] = str(day["_id"])
+        day_date = day.get("date")
+        day["date"] = day_date.date() if isinstance(day_date, datetime) else day_date
+        activities = day.get("activities") or []
+        for activity in activities:
+            if isinstance(activity.get("estimated_cost"), Decimal128):
+                activity["estimated_cost"] = activity["estimated_cost"].to_decimal()
+        day["activities"] = activities
+    doc["days"] = days
+    return Trip.model_validate(doc)
+
+def _read_trip_access(doc: Dict[str, Any]) -> TripAccessView:
+    # Se lee en cada petición que toca un viaje
+    doc["id"] = str(doc["_id"])
+    created_by = doc.get("createdBy")
+    doc["created_by"] = str(created_by) if created_by is not None else None
+    _prefer(doc, "isPublic", "is_public")
+    _prefer(doc, "baseCurrency", "base_currency")
+    _prefer(doc, "dataVersion", "data_version")
+    _read_members(doc)
+    return TripAccessView.model_validate(doc)
+
+trip_mapper = DocumentMapper(Trip, {
+    "id": object_id("_id"),
+    "start_date": date_field("startDate", default=None),
+    "end_date": date_field("endDate", default=None),
+    "created_by": object_id("createdBy"),
+    "cover_image_url": value("coverImageUrl", aliases=("cover_image_url",)),
+    "is_public": value("isPublic", aliases=("is_public",)),
+    "base_currency": value("baseCurrency", aliases=("base_currency",)),
+    "estimated_total_budget": decimal_field("estimatedTotalBudget", default=None),
+    "members": nested(member_mapper),
+    "days": nested(day_mapper),
+    "is_deleted": value("isDeleted", aliases=("is_deleted",)),
+    "created_at": value("createdAt")
+}, reader=_read_trip)
+
+trip_access_mapper = DocumentMapper(TripAccessView, {
+    "id": object_id("_id"),
+    "created_by": object_id("createdBy"),
+    "is_public": value("isPublic", aliases=("is_public",)),
+    "members": nested(member_mapper),
+    "base_currency": value("baseCurrency", default="USD", aliases=("base_currency",)),
+    "data_version": value("dataVersion", default=0)
+}, reader=_read_trip_access)
+
+# Cada escritura que cambia el contenido del viaje sube la versión
+_BUMP_DATA_VERSION = {"dataVersion": 1}
 
 class MongoTripRepository:
     def __init__(self):
@@ -9,34 +109,7 @@ class MongoTripRepository:
         self.collection = self.db.trips
 
     async def create(self, trip: Trip) -> Trip:
-        from datetime import datetime
-        trip_dict = trip.dict(exclude={"id"})
-        trip_dict["startDate"] = datetime.combine(trip.start_date, datetime.min.time())
-        trip_dict["endDate"] = datetime.combine(trip.end_date, datetime.min.time())
-        trip_dict["createdBy"] = ObjectId(trip.created_by)
-        trip_dict["estimatedTotalBudget"] = float(trip.estimated_total_budget) if trip.estimated_total_budget else None
-        trip_dict["createdAt"] = trip.created_at
-        
-        for day in trip_dict["days"]:
-            day["_id"] = ObjectId(day["id"])
-            day["date"] = datetime.combine(day["date"], datetime.min.time())
-            del day["id"]
-        
-        if trip_dict.get("start_date"):
-            del trip_dict["start_date"]
-        if trip_dict.get("end_date"):
-            del trip_dict["end_date"]
-        if trip_dict.get("created_by"):
-            del trip_dict["created_by"]
-        if trip_dict.get("estimated_total_budget"):
-            del trip_dict["estimated_total_budget"]
-        if trip_dict.get("created_at"):
-            del trip_dict["created_at"]
-        
-        for member in trip_dict["members"]:
-            member["userId"] = ObjectId(member["user_id"])
-            del member["user_id"]
-        
+        trip_dict = trip_mapper.to_document(trip, exclude=("id",))
         result = await self.collection.insert_one(trip_dict)
         trip.id = str(result.inserted_id)
         return trip
@@ -44,39 +117,52 @@ class MongoTripRepository:
     async def find_by_id(self, trip_id: str) -> Optional[Trip]:
         doc = await self.collection.find_one({"_id": ObjectId(trip_id), "isDeleted": {"$ne": True}})
         if doc:
-            doc["id"] = str(doc["_id"])
-            doc["start_date"] = doc.get("startDate").date() if doc.get("startDate") else None
-            doc["end_date"] = doc.get("endDate").date() if doc.get("endDate") else None
-            doc["created_by"] = str(doc.get("createdBy"))
-            doc["estimated_total_budget"] = doc.get("estimatedTotalBudget")
-            doc["created_at"] = doc.get("createdAt")
-            
-            for member in doc.get("members", []):
-                member["user_id"] = str(member.get("userId"))
-                if "userId" in member:
-                    del member["userId"]
-            
-            for day in doc.get("days", []):
-                day["id"] = str(day.get("_id"))
-                day["date"] = day.get("date").date() if day.get("date") else None
-                if "_id" in day:
-                    del day["_id"]
-            
-            del doc["_id"]
-            if "startDate" in doc:
-                del doc["startDate"]
-            if "endDate" in doc:
-                del doc["endDate"]
-            if "createdBy" in doc:
-                del doc["createdBy"]
-            if "estimatedTotalBudget" in doc:
-                del doc["estimatedTotalBudget"]
-            if "createdAt" in doc:
-                del doc["createdAt"]
-                
-            return Trip(**doc)
+            return trip_mapper.to_domain(doc)
         return None
 
+    async def find_access_by_id(self, trip_id: str) -> Optional[TripAccessView]:
+        doc = await self.collection.find_one(
+            {"_id": ObjectId(trip_id), "isDeleted": {"$ne": True}},
+            {"members.userId": 1, "members.role": 1, "isPublic": 1, "is_public": 1, "createdBy": 1,
+             "baseCurrency": 1, "base_currency": 1, "dataVersion": 1}
+        )
+        if not doc:
+            return None
+        return trip_access_mapper.to_domain(doc)
+
+    async def has_day(self, trip_id: str, day_id: str) -> bool:
+        if not ObjectId.is_valid(day_id):
+            return False
+        count = await self.collection.count_documents(
+            {"_id": ObjectId(trip_id), "days._id": ObjectId(day_id), "isDeleted": {"$ne": True}},
+            limit=1
+        )
+        return count > 0
+
+    async def find_day_dates(self, trip_id: str) -> List[tuple]:
+        doc = await self.collection.find_one(
+            {"_id": ObjectId(trip_id), "isDeleted": {"$ne": True}},
+            {"days._id": 1, "days.date": 1}
+        )
+        if not doc:
+            return []
+        return [
+            (str(day.get("_id")), day.get("date").date() if day.get("date") else None)
+            for day in doc.get("days", [])
+        ]
+
+    async def find_day(self, trip_id: str, day_id: str) -> Optional[dict]:
+        if not ObjectId.is_valid(day_id):
+            return None
+        # Solo viaja el primer día que coincide, no el itinerario completo
+        doc = await self.collection.find_one(
+            {"_id": ObjectId(trip_id), "isDeleted": {"$ne": True}},
+            {"days": {"$elemMatch": {"_id": ObjectId(day_id)}}}
+        )
+        if not doc or not doc.get("days"):
+            return None
+        return doc["days"][0]
+
     async def find_by_user_id(self, user_id: str) -> List[Trip]:
         print(f"[DEBUG] Searching trips for user_id: {user_id}")
         print(f"[DEBUG] ObjectId conversion: {ObjectId(user_id)}")
@@ -93,52 +179,66 @@ class MongoTripRepository:
         async for doc in cursor:
             print(f"[DEBUG] Found trip: {doc.get('title')} with members: {[str(m.get('userId')) for m in doc.get('members', [])]}")
             
-            doc["id"] = str(doc["_id"])
-            doc["start_date"] = doc.get("startDate").date() if doc.get("startDate") else None
-            doc["end_date"] = doc.get("endDate").date() if doc.get("endDate") else None
-            doc["created_by"] = str(doc.get("createdBy"))
-            doc["estimated_total_budget"] = doc.get("estimatedTotalBudget")
-            doc["created_at"] = doc.get("createdAt")
-            
-            for member in doc.get("members", []):
-                member["user_id"] = str(member.get("userId"))
-                if "userId" in member:
-                    del member["userId"]
-            
-            for day in doc.get("days", []):
-                day["id"] = str(day.get("_id"))
-                day["date"] = day.get("date").date() if day.get("date") else None
-                if "_id" in day:
-                    del day["_id"]
-                
-                for activity in day.get("activities", []):
-                    if "estimated_cost" in activity and activity["estimated_cost"] is not None:
-                        activity["estimated_cost"] = float(activity["estimated_cost"])
-            
-            del doc["_id"]
-            if "startDate" in doc:
-                del doc["startDate"]
-            if "endDate" in doc:
-                del doc["endDate"]
-            if "createdBy" in doc:
-                del doc["createdBy"]
-            if "estimatedTotalBudget" in doc:
-                del doc["estimatedTotalBudget"]
-            if "createdAt" in doc:
-                del doc["createdAt"]
-                
-            trips.append(Trip(**doc))
+            trips.append(trip_mapper.to_domain(doc))
         
         print(f"[DEBUG] Total trips found: {len(trips)}")
         return trips
 
-    async def update(self, trip_id: str, update_data: dict) -> bool:
-        result = await self.collection.update_one(
-            {"_id": ObjectId(trip_id)},
-            {"$set": update_data}
+    async def find_co_traveler_ids(self, user_id: str) -> Set[str]:
+        cursor = self.collection.find({
+            "$or": [
+                {"createdBy": ObjectId(user_id)},
+                {"members.userId": ObjectId(user_id)}
+            ],
+            "isDeleted": {"$ne": True}
+        }, {"createdBy": 1, "members.userId": 1})
+
+        traveler_ids: Set[str] = set()
+        async for doc in cursor:
+            traveler_ids.add(str(doc.get("createdBy")))
+            traveler_ids.update(str(member.get("userId")) for member in doc.get("members") or [])
+        traveler_ids.discard(user_id)
+        return traveler_ids
+
+    async def find_page_by_user_id(
+        self,
+        user_id: str,
+        limit: int = DEFAULT_PAGE_LIMIT,
+        cursor: Optional[str] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None
+    ) -> Page:
+        query: Dict[str, Any] = {
+            "$or": [
+                {"createdBy": ObjectId(user_id)},
+                {"members.userId": ObjectId(user_id)}
+            ],
+            "isDeleted": {"$ne": True}
+        }
+        date_range = date_range_filter(start_date, end_date)
+        if date_range:
+            query["startDate"] = date_range
+
+        return await find_page(self.collection, query, trip_mapper, "startDate", -1, limit, cursor)
+
+    async def count_owned_active(self, user_id: str, limit: Optional[int] = None) -> int:
+        options = {"limit": limit} if limit else {}
+        return await self.collection.count_documents(
+            {"createdBy": ObjectId(user_id), "isDeleted": {"$ne": True}},
+            **options
         )
+
+    async def update(self, trip_id: str, update_data: dict) -> bool:
+        update = {"$set": update_data, "$inc": _BUMP_DATA_VERSION}
+        # Los viajes anteriores guardan is_public; se deja un solo campo para que no se contradigan
+        if "isPublic" in update_data:
+            update["$unset"] = {"is_public": ""}
+        result = await self.collection.update_one({"_id": ObjectId(trip_id)}, update)
         return result.modified_count > 0
 
+    async def touch_data_version(self, trip_id: str) -> None:
+        await self.collection.update_one({"_id": ObjectId(trip_id)}, {"$inc": _BUMP_DATA_VERSION})
+
     async def add_member(self, trip_id: str, member_data: dict) -> bool:
         # Convertir user_id a ObjectId antes de insertar
         if "userId" in member_data:
@@ -149,34 +249,62 @@ class MongoTripRepository:
             
         result = await self.collection.update_one(
             {"_id": ObjectId(trip_id)},
-            {"$push": {"members": member_data}}
+            {"$push": {"members": member_data}, "$inc": _BUMP_DATA_VERSION}
         )
         return result.modified_count > 0
 
     async def remove_member(self, trip_id: str, user_id: str) -> bool:
         result = await self.collection.update_one(
             {"_id": ObjectId(trip_id)},
-            {"$pull": {"members": {"userId": ObjectId(user_id)}}}
+            {"$pull": {"members": {"userId": ObjectId(user_id)}}, "$inc": _BUMP_DATA_VERSION}
         )
         return result.modified_count > 0
 
     async def add_day(self, trip_id: str, day_data: dict) -> bool:
         result = await self.collection.update_one(
             {"_id": ObjectId(trip_id)},
-            {"$push": {"days": day_data}}
+            {"$push": {"days": day_data}, "$inc": _BUMP_DATA_VERSION}
         )
         return result.modified_count > 0
 
     async def update_day(self, trip_id: str, day_id: str, day_data: dict) -> bool:
         result = await self.collection.update_one(
             {"_id": ObjectId(trip_id), "days._id": ObjectId(day_id)},
-            {"$set": {"days.$": day_data}}
+            {"$set": {"days.$": day_data}, "$inc": _BUMP_DATA_VERSION}
         )
         return result.modified_count > 0
 
     async def delete(self, trip_id: str) -> bool:
         result = await self.collection.update_one(
             {"_id": ObjectId(trip_id)},
-            {"$set": {"isDeleted": True}}
+            {"$set": {"isDeleted": True}, "$inc": _BUMP_DATA_VERSION}
         )
-        return result.modified_count > 0
\ No newline at end of file
+        return result.modified_count > 0
+
+index_registry.register(
+    "trips",
+    indexes=[
+        IndexModel([("createdBy", ASCENDING), ("startDate", DESCENDING), ("_id", DESCENDING)]),
+        IndexModel([("members.userId", ASCENDING), ("startDate", DESCENDING), ("_id", DESCENDING)])
+    ],
+    query_shapes=[
+        QueryShape("find_by_user_id", {
+            "$or": [
+                {"createdBy": ObjectId()},
+                {"members.userId": ObjectId()}
+            ],
+            "isDeleted": {"$ne": True}
+        }),
+        QueryShape("find_page_by_user_id", {
+            "$or": [
+                {"createdBy": ObjectId()},
+                {"members.userId": ObjectId()}
+            ],
+            "isDeleted": {"$ne": True}
+        }, [("startDate", -1), ("_id", -1)]),
+        QueryShape("count_owned_active", {
+            "createdBy": ObjectId(),
+            "isDeleted": {"$ne": True}
+        })
+    ]
+)
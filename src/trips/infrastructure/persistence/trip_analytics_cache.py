@@ -0,0 +1,25 @@
+from typing import Optional, Dict, Any
+from src.shared.infrastructure.cache.ttl_cache import TTLCache
+from src.shared.config import settings
+
+class TripAnalyticsCache:
+    def __init__(self):
+        self.cache = TTLCache(
+            max_entries=settings.trip_analytics_cache_max_entries,
+            ttl_seconds=settings.trip_analytics_cache_ttl_seconds
+        )
+
+    def get(self, trip_id: str, data_version: int) -> Optional[Dict[str, Any]]:
+        # La versión forma parte de la clave: cualquier escritura deja la entrada anterior sin uso
+        return self.cache.get((trip_id, data_version))
+
+    def store(self, trip_id: str, data_version: int, analytics: Dict[str, Any]) -> None:
+        self.cache.set((trip_id, data_version), analytics)
+
+    def clear(self) -> None:
+        self.cache.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        return self.cache.stats()
+
+trip_analytics_cache = TripAnalyticsCache()